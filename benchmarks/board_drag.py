@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from statistics import mean, quantiles
+from time import perf_counter
+
+from chess import E2
+from PySide6.QtCore import QPointF, Qt
+from PySide6.QtGui import QMouseEvent
+from PySide6.QtWidgets import QApplication
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rechess.ui.widgets import SvgBoard  # noqa: E402
+from rechess.core import Game  # noqa: E402
+
+
+def _mouse_event(event_type: QMouseEvent.Type, point: QPointF) -> QMouseEvent:
+    """Create mouse event of `event_type` at `point` with left button."""
+    return QMouseEvent(
+        event_type,
+        point,
+        point,
+        Qt.MouseButton.LeftButton,
+        Qt.MouseButton.LeftButton,
+        Qt.KeyboardModifier.NoModifier,
+    )
+
+
+def _drag_path(start: QPointF, frames: int) -> list[QPointF]:
+    """Get synthetic zigzag drag path of `frames` points from `start`."""
+    return [
+        QPointF(start.x() + (frame % 40) * 6, start.y() - (frame % 25) * 8)
+        for frame in range(frames)
+    ]
+
+
+def main() -> None:
+    """Replay synthetic drag path and report paint time per frame."""
+    frames: int = 600
+
+    app: QApplication = QApplication.instance() or QApplication(sys.argv)
+    board: SvgBoard = SvgBoard(Game())
+    board.update_board_size()
+    board.show()
+    app.processEvents()
+
+    start_point: QPointF = board.square_center(E2)
+    board.mousePressEvent(_mouse_event(QMouseEvent.Type.MouseButtonPress, start_point))
+    app.processEvents()
+    board.frame_times.clear()
+
+    paint_times: list[float] = []
+    start: float = perf_counter()
+
+    for point in _drag_path(start_point, frames):
+        board.mouseMoveEvent(_mouse_event(QMouseEvent.Type.MouseMove, point))
+        app.processEvents()
+        paint_times.append(board.frame_times[-1])
+
+    elapsed: float = perf_counter() - start
+    board.stop_dragging()
+
+    paint_milliseconds: list[float] = [paint_time * 1000 for paint_time in paint_times]
+    percentiles: list[float] = quantiles(paint_milliseconds, n=100)
+
+    print(f"frames:              {frames:10d}")
+    print(f"mean paint per frame:{mean(paint_milliseconds):10.3f} ms")
+    print(f"p95 paint per frame: {percentiles[94]:10.3f} ms")
+    print(f"max paint per frame: {max(paint_milliseconds):10.3f} ms")
+    print(f"total per frame:     {elapsed / frames * 1000:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
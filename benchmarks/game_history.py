@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+
+from __future__ import annotations
+
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+from typing import Callable
+
+from chess import Board, Move
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import rechess.ui  # noqa: E402, F401
+from rechess.core import Game  # noqa: E402
+
+
+def _random_game(plies: int, seed: int = 0) -> list[Move]:
+    """Get moves of random game lasting at least `plies` plies."""
+    randomizer: random.Random = random.Random(seed)
+
+    while True:
+        board: Board = Board()
+
+        while not board.is_game_over() and len(board.move_stack) < plies:
+            board.push(randomizer.choice(list(board.legal_moves)))
+
+        if len(board.move_stack) == plies:
+            return board.move_stack
+
+        seed += 1
+        randomizer.seed(seed)
+
+
+def _allocated_bytes(build: Callable[[], object]) -> tuple[int, object]:
+    """Get bytes allocated by `build` along with its kept result."""
+    tracemalloc.start()
+    result: object = build()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated, result
+
+
+def _legacy_positions(moves: list[Move]) -> list[Board]:
+    """Get board copy with full move stack after every move."""
+    board: Board = Board()
+    positions: list[Board] = []
+
+    for move in moves:
+        board.push(move)
+        positions.append(board.copy())
+
+    return positions
+
+
+def _load_game(moves: list[Move]) -> Game:
+    """Get game with `moves` pushed and selected one after another."""
+    game: Game = Game()
+
+    for move in moves:
+        game.push(move)
+        game.update_state(len(game.moves) - 1)
+
+    return game
+
+
+def _per_call_microseconds(function: Callable[[], None], calls: int) -> float:
+    """Get average cost of calling `function` in microseconds."""
+    start: float = perf_counter()
+
+    for _ in range(calls):
+        function()
+
+    return (perf_counter() - start) / calls * 1_000_000
+
+
+def main() -> None:
+    """Report memory and navigation latency of 300-ply game history."""
+    plies: int = 300
+    moves: list[Move] = _random_game(plies)
+
+    legacy_bytes, _ = _allocated_bytes(lambda: _legacy_positions(moves))
+    history_bytes, game = _allocated_bytes(lambda: _load_game(moves))
+
+    randomizer: random.Random = random.Random(1)
+    step_index: int = plies - 1
+
+    def step_back_and_forth() -> None:
+        nonlocal step_index
+        step_index = step_index - 1 if step_index > 0 else plies - 1
+        game.update_state(step_index)
+
+    jump_cost: float = _per_call_microseconds(
+        lambda: game.update_state(randomizer.randrange(plies)), 2_000
+    )
+    step_cost: float = _per_call_microseconds(step_back_and_forth, 2_000)
+    position_cost: float = _per_call_microseconds(
+        lambda: game.history.position_at(randomizer.randrange(plies)), 2_000
+    )
+
+    print(f"plies:                     {plies:10d}")
+    print(f"board copies per ply:      {legacy_bytes / 1024:10.1f} KiB")
+    print(f"game with compact history: {history_bytes / 1024:10.1f} KiB")
+    print(f"random jump per call:      {jump_cost:10.1f} µs")
+    print(f"single step per call:      {step_cost:10.1f} µs")
+    print(f"position_at per call:      {position_cost:10.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+
+from __future__ import annotations
+
+import random
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from chess import Board
+from chess.pgn import Game as PgnGame
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rechess.utils import PgnIndex, PositionIndex  # noqa: E402
+
+
+def _random_pgn(games: int, plies: int, seed: int = 0) -> str:
+    """Get PGN text of `games` random games lasting up to `plies` plies."""
+    randomizer: random.Random = random.Random(seed)
+    pgn_games: list[str] = []
+
+    for _ in range(games):
+        board: Board = Board()
+
+        while not board.is_game_over() and len(board.move_stack) < plies:
+            board.push(randomizer.choice(list(board.legal_moves)))
+
+        pgn_game: PgnGame = PgnGame.from_board(board)
+        pgn_game.headers["Result"] = randomizer.choice(["1-0", "1/2-1/2", "0-1"])
+        pgn_games.append(str(pgn_game))
+
+    return "\n\n".join(pgn_games) + "\n"
+
+
+def main() -> None:
+    """Report build time and query latency of position index."""
+    games: int = 2_000
+    queries: int = 200
+
+    with tempfile.TemporaryDirectory() as directory:
+        path_to_pgn: str = str(Path(directory) / "games.pgn")
+        Path(path_to_pgn).write_text(_random_pgn(games, 60))
+
+        start: float = perf_counter()
+        pgn_index: PgnIndex = PgnIndex(path_to_pgn)
+        offsets_time: float = perf_counter() - start
+
+        start = perf_counter()
+        position_index: PositionIndex = PositionIndex(path_to_pgn, pgn_index.offsets)
+        build_time: float = perf_counter() - start
+
+        start = perf_counter()
+        reopened_index: PositionIndex = PositionIndex(path_to_pgn, pgn_index.offsets)
+        reopen_time: float = perf_counter() - start
+
+        boards: list[Board] = []
+        randomizer: random.Random = random.Random(1)
+
+        for _ in range(queries):
+            pgn_game: PgnGame = pgn_index.read_game(randomizer.randrange(games))
+            board: Board = pgn_game.board()
+
+            for move in list(pgn_game.mainline_moves())[: randomizer.randrange(12)]:
+                board.push(move)
+
+            boards.append(board)
+
+        start = perf_counter()
+
+        for board in boards:
+            reopened_index.move_statistics(board)
+
+        query_time: float = (perf_counter() - start) / queries
+        starting_start: float = perf_counter()
+        reopened_index.move_statistics(Board())
+        starting_time: float = perf_counter() - starting_start
+
+        print(f"games:                      {games:10d}")
+        print(f"positions:                  {len(position_index):10d}")
+        print(f"offset index build:         {offsets_time * 1000:10.1f} ms")
+        print(f"position index build:       {build_time:10.2f} s")
+        print(f"position index reopen:      {reopen_time * 1000:10.2f} ms")
+        print(f"move statistics per query:  {query_time * 1000:10.2f} ms")
+        print(f"starting position query:    {starting_time * 1000:10.2f} ms")
+
+        position_index.close()
+        reopened_index.close()
+        pgn_index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from timeit import timeit
+from typing import Any, Callable
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rechess.utils import setting_value  # noqa: E402
+
+
+def _legacy_setting_value(section: str, key: str) -> Any:
+    """Get value of `key` from `section` by reading settings.json file."""
+    with open("rechess/settings.json") as settings_file:
+        return json.load(settings_file)[section][key]
+
+
+def _per_call_microseconds(function: Callable, calls: int) -> float:
+    """Get average cost of calling `function` in microseconds."""
+    seconds: float = timeit(lambda: function("engine", "is_white"), number=calls)
+    return seconds / calls * 1_000_000
+
+
+def main() -> None:
+    """Compare per-call cost of reading setting from file and memory."""
+    calls: int = 20_000
+
+    legacy_cost: float = _per_call_microseconds(_legacy_setting_value, calls)
+    store_cost: float = _per_call_microseconds(setting_value, calls)
+
+    print(f"json.load per call:      {legacy_cost:10.3f} µs")
+    print(f"settings store per call: {store_cost:10.3f} µs")
+    print(f"speedup:                 {legacy_cost / store_cost:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+from typing import Any
+
+from chess import Board, Move
+from PySide6.QtCore import QModelIndex, QPersistentModelIndex, Qt
+from PySide6.QtWidgets import QApplication
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rechess.ui.table import TableModel, TableView  # noqa: E402
+from rechess.core import Game  # noqa: E402
+
+
+class CountingTableModel(TableModel):
+    """Table model counting how often view asks for data."""
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+
+        self.data_calls: int = 0
+
+    def data(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        """Count call and get SAN representation for move at `index`."""
+        self.data_calls += 1
+        return super().data(index, role)
+
+
+class LayoutChangedTableModel(CountingTableModel):
+    """Counting table model refreshed by layout change after every move."""
+
+    def refresh_view(self) -> None:
+        """Refresh whole view to reflect model changes."""
+        self._history.take_changed_index()
+        self._item_count = len(self._history)
+        self.layoutChanged.emit()
+
+
+def _random_moves(plies: int, seed: int = 0) -> list[Move]:
+    """Get up to `plies` random legal moves from starting position."""
+    randomizer: random.Random = random.Random(seed)
+    board: Board = Board()
+
+    while not board.is_game_over() and len(board.move_stack) < plies:
+        board.push(randomizer.choice(list(board.legal_moves)))
+
+    return board.move_stack
+
+
+def _data_calls_per_move(
+    app: QApplication,
+    model_class: type[CountingTableModel],
+    moves: list[Move],
+) -> float:
+    """Get average data calls per move appended and repainted one at a time."""
+    game: Game = Game()
+    model: CountingTableModel = model_class(game.history)
+    view: TableView = TableView(model)
+    view.show()
+    app.processEvents()
+    model.data_calls = 0
+
+    for move in moves:
+        game.push(move)
+        model.refresh_view()
+        game.update_state(len(game.history) - 1)
+        app.processEvents()
+
+    return model.data_calls / len(moves)
+
+
+def _bulk_append_data_calls(app: QApplication, moves: list[Move]) -> int:
+    """Get data calls caused by appending all `moves` in one batch."""
+    game: Game = Game()
+    model: CountingTableModel = CountingTableModel(game.history)
+    view: TableView = TableView(model)
+    view.show()
+    app.processEvents()
+    model.data_calls = 0
+
+    game.push_moves(moves)
+    model.refresh_view()
+    app.processEvents()
+
+    return model.data_calls
+
+
+def main() -> None:
+    """Compare data calls per appended move for both refresh strategies."""
+    app: QApplication = QApplication.instance() or QApplication(sys.argv)
+    moves: list[Move] = _random_moves(200)
+
+    layout_calls: float = _data_calls_per_move(app, LayoutChangedTableModel, moves)
+    incremental_calls: float = _data_calls_per_move(app, CountingTableModel, moves)
+    bulk_calls: int = _bulk_append_data_calls(app, moves)
+
+    print(f"moves:                           {len(moves):10d}")
+    print(f"layoutChanged data() per move:   {layout_calls:10.1f}")
+    print(f"incremental data() per move:     {incremental_calls:10.1f}")
+    print(f"bulk append data() for all moves:{bulk_calls:10d}")
+
+
+if __name__ == "__main__":
+    main()
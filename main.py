@@ -3,10 +3,48 @@
 
 from __future__ import annotations
 
-from PySide6.QtCore import QLockFile, QTimer
+import logging
+from argparse import ArgumentParser, Namespace
+from typing import Final
+
+from PySide6.QtCore import QLockFile
 
 from rechess.ui import MainWindow
-from rechess.utils import create_app, create_splash_screen, show_warning
+from rechess.utils import (
+    create_app,
+    create_splash_screen,
+    openings_loader,
+    show_warning,
+    startup_profile,
+)
+
+
+STARTUP_PHASES: Final[tuple[str, ...]] = (
+    "app creation",
+    "style load",
+    "engine spawn",
+    "openings load",
+    "first board paint",
+)
+
+
+def _parse_arguments() -> Namespace:
+    """Parse command-line arguments, leaving Qt ones untouched."""
+    parser: ArgumentParser = ArgumentParser(prog="ReChess")
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="print per-phase breakdown of startup time",
+    )
+    arguments, _ = parser.parse_known_args()
+    return arguments
+
+
+def _print_startup_profile(profile: StartupProfile) -> None:
+    """Print startup profile once all startup phases are recorded."""
+    if profile.has_phases(*STARTUP_PHASES):
+        profile.phase_recorded.disconnect()
+        print(profile.report(), flush=True)
 
 
 def _finish(splash_screen: QSplashScreen, main_window: QMainWindow) -> None:
@@ -17,17 +55,33 @@ def _finish(splash_screen: QSplashScreen, main_window: QMainWindow) -> None:
 
 def main() -> None:
     """Launch app with splash screen, lock it to launch only once."""
-    app: QApplication = create_app()
-    main_window: MainWindow = MainWindow()
+    arguments: Namespace = _parse_arguments()
+    profile: StartupProfile = startup_profile()
+
+    if arguments.startup_profile:
+        logging.basicConfig(level=logging.INFO)
+        profile.phase_recorded.connect(lambda: _print_startup_profile(profile))
+
+    with profile.measure("app creation"):
+        app: QApplication = create_app()
+
+    with profile.measure("splash screen"):
+        splash_screen: QSplashScreen = create_splash_screen()
+        app.processEvents()
+
+    openings_loader().start()
+
+    with profile.measure("main window"):
+        main_window: MainWindow = MainWindow()
+
     lock_file: QLockFile = QLockFile("ReChess.lock")
-    splash_screen: QSplashScreen = create_splash_screen()
 
     if not lock_file.tryLock(1):
         splash_screen.close()
         show_warning(main_window)
         return
 
-    QTimer.singleShot(3000, lambda: _finish(splash_screen, main_window))
+    _finish(splash_screen, main_window)
 
     app.exec()
 
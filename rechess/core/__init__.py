@@ -1,5 +1,28 @@
+from .endgame_tablebase import EndgameTablebase, TablebaseProbe
 from .engine import Engine
+from .engine_pool import EnginePool, EngineWorker
+from .event_loop import EventLoopThread, shared_event_loop
 from .game import Game
+from .game_analysis import GameAnalysis, Judgement
+from .game_history import GameHistory
+from .game_tree import GameNode
+from .legal_move_map import LegalMoveMap
+from .opening_book import OpeningBook
 
 
-__all__: list[str] = ["Engine", "Game"]
+__all__: list[str] = [
+    "EndgameTablebase",
+    "Engine",
+    "EnginePool",
+    "EngineWorker",
+    "EventLoopThread",
+    "Game",
+    "GameAnalysis",
+    "GameHistory",
+    "GameNode",
+    "Judgement",
+    "LegalMoveMap",
+    "OpeningBook",
+    "TablebaseProbe",
+    "shared_event_loop",
+]
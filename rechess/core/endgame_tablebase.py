@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Final, NamedTuple
+
+from chess import Board, Move, popcount
+from chess.polyglot import zobrist_hash
+from chess.syzygy import Tablebase, open_tablebase
+
+
+PROBE_CACHE_SIZE: Final[int] = 4096
+
+
+class TablebaseProbe(NamedTuple):
+    """Type annotations for WDL and DTZ values from side to move's view."""
+
+    wdl: int
+    dtz: int
+
+
+class EndgameTablebase:
+    """Syzygy tablebase opened once and probed through Zobrist-keyed LRU."""
+
+    def __init__(self, path_to_directory: str, max_pieces: int) -> None:
+        self.path_to_directory: str = path_to_directory
+        self.max_pieces: int = max_pieces
+
+        self._tablebase: Tablebase | None = None
+        self._probes: OrderedDict[int, TablebaseProbe | None] = OrderedDict()
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @property
+    def tablebase(self) -> Tablebase:
+        """Get tablebase, opening table files on first use."""
+        if self._tablebase is None:
+            self._tablebase = open_tablebase(self.path_to_directory)
+        return self._tablebase
+
+    def is_probeable(self, board: Board) -> bool:
+        """Return True if `board` has few enough pieces and no castling rights."""
+        return popcount(board.occupied) <= self.max_pieces and not board.castling_rights
+
+    def probe(self, board: Board) -> TablebaseProbe | None:
+        """Get WDL and DTZ values for `board`, if tables cover it."""
+        if not self.is_probeable(board):
+            return None
+
+        key: int = zobrist_hash(board)
+
+        if key in self._probes:
+            self.hits += 1
+            self._probes.move_to_end(key)
+            return self._probes[key]
+
+        self.misses += 1
+        wdl: int | None = self.tablebase.get_wdl(board)
+        dtz: int | None = self.tablebase.get_dtz(board)
+        probe: TablebaseProbe | None = (
+            None if wdl is None or dtz is None else TablebaseProbe(wdl, dtz)
+        )
+
+        self._probes[key] = probe
+
+        if len(self._probes) > PROBE_CACHE_SIZE:
+            self._probes.popitem(last=False)
+
+        return probe
+
+    def best_move(self, board: Board) -> Move | None:
+        """Get move keeping best result on `board` while minding DTZ."""
+        if self.probe(board) is None:
+            return None
+
+        ranked_moves: list[tuple[tuple[int, bool, bool, int], Move]] = []
+
+        for move in board.legal_moves:
+            is_zeroing: bool = board.is_zeroing(move)
+            board.push(move)
+            is_checkmate: bool = board.is_checkmate()
+            probe: TablebaseProbe | None = self.probe(board)
+            board.pop()
+
+            if probe is None:
+                return None
+
+            rank: tuple[int, bool, bool, int] = (
+                -probe.wdl,
+                is_checkmate,
+                is_zeroing and probe.wdl < 0,
+                probe.dtz,
+            )
+            ranked_moves.append((rank, move))
+
+        if not ranked_moves:
+            return None
+
+        return max(ranked_moves, key=lambda ranked_move: ranked_move[0])[1]
+
+    def close(self) -> None:
+        """Close table files."""
+        if self._tablebase is not None:
+            self._tablebase.close()
+            self._tablebase = None
+
+        self._probes.clear()
@@ -1,95 +1,651 @@
 from __future__ import annotations
 
-from typing import ClassVar
+import asyncio
+import logging
+from concurrent.futures import Future
+from functools import partial
+from time import perf_counter
+from typing import Awaitable, Callable, ClassVar, Final, Literal, NamedTuple
 
-from chess import Move
-from chess.engine import Limit, PlayResult, Score, SimpleEngine
+from chess import Board, Move
+from chess.engine import (
+    AnalysisResult,
+    EngineError,
+    EngineTerminatedError,
+    Limit,
+    PlayResult,
+    Score,
+    UciProtocol,
+    popen_uci,
+)
 from PySide6.QtCore import QObject, Signal
 
+from rechess.core.endgame_tablebase import EndgameTablebase, TablebaseProbe
+from rechess.core.evaluation_cache import CachedEvaluation, EvaluationCache
+from rechess.core.event_loop import EventLoopThread, shared_event_loop
+from rechess.core.opening_book import OpeningBook
 from rechess.utils import (
     delete_quarantine_attribute,
     engine_configuration,
     make_executable,
     path_to_stockfish,
     setting_value,
+    startup_profile,
 )
 
 
+JOB_QUEUE_SIZE: Final[int] = 8
+MAXIMUM_UPDATE_RATE: Final[int] = 30
+MINIMUM_CLOCK: Final[float] = 0.05
+MINIMUM_UPDATE_RATE: Final[int] = 10
+QUIT_TIMEOUT: Final[float] = 5.0
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class AnalysisLine(NamedTuple):
+    """Type annotations for analysis line."""
+
+    multipv: int
+    depth: int
+    score: Score
+    pv: list[Move]
+
+
+class VariationLine(NamedTuple):
+    """Type annotations for analysis line with variation in SAN."""
+
+    multipv: int
+    depth: int
+    score: Score
+    move: Move
+    variation: str
+
+
+class EngineJob(NamedTuple):
+    """Type annotations for queued engine job."""
+
+    run: Callable[[], Awaitable[None]]
+    is_analysis: bool = False
+
+
+class LineCoalescer:
+    """Latest analysis line per MultiPV slot awaiting delivery."""
+
+    def __init__(self) -> None:
+        self._lines: dict[int, AnalysisLine] = {}
+
+        self.delivered: int = 0
+        self.dropped: int = 0
+
+    def push(self, line: AnalysisLine) -> None:
+        """Keep `line`, dropping undelivered line of same slot."""
+        if line.multipv in self._lines:
+            self.dropped += 1
+
+        self._lines[line.multipv] = line
+
+    def pop_all(self) -> list[AnalysisLine]:
+        """Take pending lines ordered by MultiPV slot."""
+        lines: list[AnalysisLine] = sorted(self._lines.values())
+        self._lines.clear()
+        self.delivered += len(lines)
+        return lines
+
+    def clear(self) -> None:
+        """Discard pending lines without counting them."""
+        self._lines.clear()
+
+
 class Engine(QObject):
-    """Communication with UCI-compliant engine."""
+    """Communication with UCI-compliant engine over asyncio protocol."""
 
-    best_move_analyzed: ClassVar[Signal] = Signal(Move)
+    book_move_recorded: ClassVar[Signal] = Signal(int)
+    lines_analyzed: ClassVar[Signal] = Signal(int, list)
     load_failed: ClassVar[Signal] = Signal(str)
-    move_played: ClassVar[Signal] = Signal(Move)
-    score_analyzed: ClassVar[Signal] = Signal(Score)
-    variation_analyzed: ClassVar[Signal] = Signal(str)
+    loaded: ClassVar[Signal] = Signal(str)
+    move_played: ClassVar[Signal] = Signal(int, Move)
+    score_analyzed: ClassVar[Signal] = Signal(int, Score)
+    tablebase_move_recorded: ClassVar[Signal] = Signal(int)
+    tablebase_probed: ClassVar[Signal] = Signal(int, int, int)
+    think_time_recorded: ClassVar[Signal] = Signal(float, float)
 
     def __init__(self, game: Game) -> None:
         super().__init__()
 
         self._game: Game = game
-        self._analyzing: bool = False
+        self.think_times: list[float] = []
+        self.book_moves: int = 0
+        self.tablebase_moves: int = 0
+
+        self._event_loop: EventLoopThread = shared_event_loop()
+        self._protocol: UciProtocol | None = None
+        self._path_to_file: str = ""
+        self._analysis: AnalysisResult | None = None
+        self._analysis_session: int = 0
+        self._play_session: int = 0
+        self._is_searching_move: bool = False
+        self._loads: list[Future] = []
+        self._evaluation_cache: EvaluationCache = EvaluationCache(
+            "rechess/evaluations.sqlite3"
+        )
+        self.line_coalescer: LineCoalescer = LineCoalescer()
+        self._opening_book: OpeningBook | None = (
+            OpeningBook(setting_value("book", "path"))
+            if setting_value("book", "path")
+            else None
+        )
+        self._tablebase: EndgameTablebase | None = (
+            EndgameTablebase(
+                setting_value("tablebase", "path"),
+                setting_value("tablebase", "max_pieces"),
+            )
+            if setting_value("tablebase", "path")
+            else None
+        )
 
-        self.load_from_file_at(path_to_stockfish())
+        self._jobs: asyncio.Queue[EngineJob] = asyncio.Queue(maxsize=JOB_QUEUE_SIZE)
+        self._event_loop.submit(self._process_jobs())
+
+    @property
+    def analysis_session(self) -> int:
+        """Get number of analysis session whose lines are current."""
+        return self._analysis_session
+
+    @property
+    def play_session(self) -> int:
+        """Get number of play request whose move is still wanted."""
+        return self._play_session
+
+    @property
+    def is_loaded(self) -> bool:
+        """Return True if engine is loaded."""
+        return self._protocol is not None
+
+    @property
+    def threads(self) -> int:
+        """Get number of search threads if engine is loaded."""
+        if self._protocol is not None:
+            return int(engine_configuration()["Threads"])
+        return 0
+
+    @property
+    def path_to_file(self) -> str:
+        """Get path to executable file of loaded engine."""
+        return self._path_to_file
 
     @property
     def name(self) -> str:
         """Get engine name if engine is loaded."""
-        if hasattr(self, "_engine"):
-            return self._engine.id["name"]
+        if self._protocol is not None:
+            return self._protocol.id.get("name", "(unnamed engine)")
         return "(no engine loaded)"
 
+    def load_default(self) -> None:
+        """Load default Stockfish engine without blocking."""
+        self._submit_load(self._load(path_to_stockfish(), "engine spawn"))
+
     def load_from_file_at(self, path_to_file: str) -> None:
-        """Load engine from file at `path_to_file`."""
+        """Load engine from file at `path_to_file` without blocking."""
+        self._submit_load(self._load(path_to_file))
+
+    def _submit_load(self, load: Awaitable[None]) -> None:
+        """Schedule `load` on event loop and keep track of it until quitting."""
+        self._loads = [
+            pending_load for pending_load in self._loads if not pending_load.done()
+        ]
+        self._loads.append(self._event_loop.submit(load))
+
+    async def _load(self, path_to_file: str, phase_name: str = "") -> None:
+        """Spawn engine from file at `path_to_file` and replace old one."""
+        start: float = startup_profile().elapsed()
+
         try:
             delete_quarantine_attribute(path_to_file)
             make_executable(path_to_file)
 
-            new_engine: SimpleEngine = SimpleEngine.popen_uci(path_to_file)
-            new_engine.configure(engine_configuration())
-
-            self.quit()
-            self._engine: SimpleEngine = new_engine
+            _, new_protocol = await popen_uci(path_to_file)
+            await new_protocol.configure(engine_configuration())
 
         except Exception as exception:
             self.load_failed.emit(f"UCI engine failed to load.\n\n{exception}")
+            return
+
+        finally:
+            if phase_name:
+                startup_profile().record(
+                    phase_name,
+                    start,
+                    startup_profile().elapsed() - start,
+                )
+
+        old_protocol: UciProtocol | None = self._protocol
+        self._protocol = new_protocol
+        self._path_to_file = path_to_file
+
+        if old_protocol is not None:
+            await self._quit(old_protocol)
+
+        self.loaded.emit(self.name)
+
+    def load_book(self, path_to_file: str) -> None:
+        """Replace opening book with one from file at `path_to_file`."""
+        self._event_loop.submit(self._replace_book(path_to_file)).result()
+
+    async def _replace_book(self, path_to_file: str) -> None:
+        """Close old opening book on event loop thread and set new one."""
+        if self._opening_book is not None:
+            self._opening_book.close()
+
+        self._opening_book = OpeningBook(path_to_file)
+
+    def load_tablebase(self, path_to_directory: str) -> None:
+        """Replace tablebase with one from directory at `path_to_directory`."""
+        self._event_loop.submit(self._replace_tablebase(path_to_directory)).result()
+
+    async def _replace_tablebase(self, path_to_directory: str) -> None:
+        """Close old tablebase on event loop thread and pass new one to engine."""
+        if self._tablebase is not None:
+            self._tablebase.close()
+
+        self._tablebase = EndgameTablebase(
+            path_to_directory,
+            setting_value("tablebase", "max_pieces"),
+        )
+
+        if self._protocol is not None:
+            try:
+                await self._protocol.configure({"SyzygyPath": path_to_directory})
+            except EngineError as error:
+                logger.warning("Engine rejected tablebase path: %s", error)
+
+    def _book_move(self, board: Board) -> Move | None:
+        """Get move from opening book for `board`, if any."""
+        if self._opening_book is None:
+            return None
+
+        try:
+            return self._opening_book.choose_move(
+                board,
+                setting_value("book", "weighting"),
+                setting_value("book", "depth"),
+                setting_value("book", "variety"),
+            )
+        except (OSError, ValueError) as error:
+            logger.warning("Opening book disabled: %s", error)
+            self._opening_book.close()
+            self._opening_book = None
+            return None
+
+    def _tablebase_probe(self, board: Board) -> TablebaseProbe | None:
+        """Get tablebase WDL and DTZ values for `board`, if any."""
+        if self._tablebase is None:
+            return None
+
+        try:
+            return self._tablebase.probe(board)
+        except OSError as error:
+            self._disable_tablebase(error)
+            return None
+
+    def _tablebase_move(self, board: Board) -> Move | None:
+        """Get move keeping tablebase result for `board`, if any."""
+        if self._tablebase is None:
+            return None
+
+        try:
+            return self._tablebase.best_move(board)
+        except OSError as error:
+            self._disable_tablebase(error)
+            return None
+
+    def _disable_tablebase(self, error: OSError) -> None:
+        """Close tablebase that failed to be probed due to `error`."""
+        logger.warning("Tablebase disabled: %s", error)
+
+        if self._tablebase is not None:
+            self._tablebase.close()
+            self._tablebase = None
+
+    def _emit_tablebase_probe(
+        self,
+        board: Board,
+        probe: TablebaseProbe,
+        session: int,
+    ) -> None:
+        """Announce tablebase `probe` of `board` in `session` from White's view."""
+        perspective: int = 1 if board.turn else -1
+        self.tablebase_probed.emit(
+            session,
+            perspective * probe.wdl,
+            perspective * probe.dtz,
+        )
+
+    def limit(
+        self,
+        white_clock: float,
+        black_clock: float,
+        white_inc: float,
+        black_inc: float,
+    ) -> Limit:
+        """Get search limit based on time management policy and clocks."""
+        policy: Literal["clock", "depth", "movetime", "nodes"] = setting_value(
+            "engine", "time_management"
+        )
+        safety_margin: float = setting_value("engine", "safety_margin")
 
-    def play_move(self) -> None:
-        """Invoke engine to play move."""
-        play_result: PlayResult = self._engine.play(
-            limit=Limit(depth=20),
-            board=self._game.board,
-            ponder=setting_value("engine", "is_ponder_on"),
+        clock_limit: Limit = Limit(
+            white_clock=max(white_clock - safety_margin, MINIMUM_CLOCK),
+            black_clock=max(black_clock - safety_margin, MINIMUM_CLOCK),
+            white_inc=white_inc,
+            black_inc=black_inc,
+        )
+        own_clock: float = (
+            clock_limit.white_clock if self._game.turn else clock_limit.black_clock
         )
-        self.move_played.emit(play_result.move)
+
+        if policy == "depth":
+            clock_limit.depth = setting_value("engine", "depth")
+        elif policy == "nodes":
+            clock_limit.nodes = setting_value("engine", "nodes")
+        elif policy == "movetime":
+            clock_limit.time = min(setting_value("engine", "movetime"), own_clock)
+
+        return clock_limit
+
+    def play_move(
+        self,
+        white_clock: float,
+        black_clock: float,
+        white_inc: float = 0.0,
+        black_inc: float = 0.0,
+    ) -> None:
+        """Queue engine to play move within remaining clock times."""
+        limit: Limit = self.limit(white_clock, black_clock, white_inc, black_inc)
+        self._play_session += 1
+
+        self._enqueue(
+            EngineJob(
+                partial(
+                    self._play,
+                    self._game.board.copy(),
+                    limit,
+                    self._play_session,
+                )
+            )
+        )
+
+    async def _play(self, board: Board, limit: Limit, session: int) -> None:
+        """Search `board` within `limit` and announce move played in `session`."""
+        if self._protocol is None or session != self._play_session:
+            return
+
+        start: float = perf_counter()
+        book_move: Move | None = self._book_move(board)
+
+        if book_move is not None:
+            self.think_times.append(perf_counter() - start)
+            self.book_moves += 1
+            self.move_played.emit(session, book_move)
+            self.book_move_recorded.emit(self.book_moves)
+            return
+
+        tablebase_move: Move | None = self._tablebase_move(board)
+
+        if tablebase_move is not None:
+            self.think_times.append(perf_counter() - start)
+            self.tablebase_moves += 1
+            self.move_played.emit(session, tablebase_move)
+            self.tablebase_move_recorded.emit(self.tablebase_moves)
+            return
+
+        self._is_searching_move = True
+
+        try:
+            play_result: PlayResult = await self._protocol.play(
+                board=board,
+                limit=limit,
+                ponder=setting_value("engine", "is_ponder_on"),
+            )
+        finally:
+            self._is_searching_move = False
+
+        think_time: float = perf_counter() - start
+        engine_clock: float = limit.white_clock if board.turn else limit.black_clock
+        self.think_times.append(think_time)
+
+        if play_result.move is not None:
+            self.move_played.emit(session, play_result.move)
+            self.think_time_recorded.emit(think_time, engine_clock)
 
     def start_analysis(self) -> None:
-        """Start analyzing current position."""
-        self._analyzing = True
+        """Queue analysis of current position."""
+        self._analysis_session += 1
 
-        with self._engine.analysis(self._game.board) as analysis:
-            for info in analysis:
-                if not self._analyzing:
+        self._enqueue(
+            EngineJob(
+                partial(
+                    self._analyze,
+                    self._game.board.copy(),
+                    self._analysis_session,
+                ),
+                is_analysis=True,
+            )
+        )
+
+    async def _analyze(self, board: Board, session: int) -> None:
+        """Stream analysis of `board`, showing cached line until search is deeper."""
+        if self._protocol is None or session != self._analysis_session:
+            return
+
+        probe: TablebaseProbe | None = self._tablebase_probe(board)
+
+        if probe is not None:
+            self._emit_tablebase_probe(board, probe, session)
+
+        engine_name: str = self.name
+        cached: CachedEvaluation | None = self._evaluation_cache.get(board, engine_name)
+        cached_depth: int = 0
+
+        if cached is not None:
+            cached_depth = cached.depth
+            self.line_coalescer.push(
+                AnalysisLine(1, cached.depth, cached.score, cached.pv)
+            )
+
+        stored_depth: int = cached_depth
+        delivery_task: asyncio.Task | None = None
+
+        try:
+            delivery_task = asyncio.create_task(
+                self._deliver_periodically(board, session)
+            )
+            self._analysis = await self._protocol.analysis(
+                board,
+                multipv=max(1, setting_value("analysis", "lines")),
+            )
+
+            async for info in self._analysis:
+                if session != self._analysis_session:
                     break
 
-                if "pv" in info:
-                    pv: list[Move] = info["pv"]
+                depth: int = info.get("depth", 0)
+                multipv: int = info.get("multipv", 1)
 
-                    best_move: Move = pv[0]
+                if "pv" in info and (multipv > 1 or depth > cached_depth):
+                    pv: list[Move] = info["pv"]
                     score: Score = info["score"].white()
-                    variation: str = self._game.board.variation_san(pv)
 
-                    self.best_move_analyzed.emit(best_move)
-                    self.score_analyzed.emit(score)
-                    self.variation_analyzed.emit(variation)
+                    self.line_coalescer.push(AnalysisLine(multipv, depth, score, pv))
+
+                    if multipv == 1 and depth > stored_depth:
+                        self._evaluation_cache.put(board, engine_name, depth, score, pv)
+                        stored_depth = depth
+        finally:
+            if delivery_task is not None:
+                delivery_task.cancel()
+
+            if self._analysis is not None:
+                self._analysis.stop()
+                self._analysis = None
+
+            self._evaluation_cache.commit()
+
+            if session == self._analysis_session:
+                self._deliver(board, session)
+            else:
+                self.line_coalescer.clear()
+
+    async def _deliver_periodically(self, board: Board, session: int) -> None:
+        """Deliver coalesced lines at update rate while session lasts."""
+        update_rate: int = max(
+            MINIMUM_UPDATE_RATE,
+            min(MAXIMUM_UPDATE_RATE, setting_value("analysis", "update_rate")),
+        )
+        interval: float = 1 / update_rate
+
+        while True:
+            await asyncio.sleep(interval)
+
+            if session != self._analysis_session:
+                return
+
+            self._deliver(board, session)
+
+    def _deliver(self, board: Board, session: int) -> None:
+        """Announce changed lines of `session` in one batch and main line score."""
+        probe: TablebaseProbe | None = self._tablebase_probe(board)
+        variation_lines: list[VariationLine] = []
+
+        for line in self.line_coalescer.pop_all():
+            try:
+                variation: str = board.variation_san(line.pv)
+            except ValueError:
+                continue
+
+            variation_lines.append(
+                VariationLine(
+                    line.multipv, line.depth, line.score, line.pv[0], variation
+                )
+            )
+
+            if line.multipv != 1:
+                continue
+
+            if probe is None:
+                self.score_analyzed.emit(session, line.score)
+            else:
+                self._emit_tablebase_probe(board, probe, session)
+
+        if variation_lines:
+            self.lines_analyzed.emit(session, variation_lines)
 
     def stop_analysis(self) -> None:
-        """Stop analyzing current position."""
-        self._analyzing = False
+        """Stop analyzing current position by sending UCI stop."""
+        self._analysis_session += 1
+        self._event_loop.call_soon(self._stop_running_analysis)
+
+    def cancel_play(self) -> None:
+        """Discard requested moves, stopping search and dropping queued jobs."""
+        self._play_session += 1
+        self._event_loop.call_soon(self._cancel_play_jobs)
+
+    def _cancel_play_jobs(self) -> None:
+        """Drop queued play jobs and send UCI stop to running search."""
+        self._drop_queued_jobs(is_analysis=False)
+
+        if self._is_searching_move and self._protocol is not None:
+            self._protocol.send_line("stop")
+
+    def _stop_running_analysis(self) -> None:
+        """Send UCI stop to running analysis, if any."""
+        if self._analysis is not None:
+            self._analysis.stop()
+
+    def _enqueue(self, job: EngineJob) -> None:
+        """Queue `job` on event loop, superseding running analysis."""
+        self._event_loop.call_soon(self._put_job, job)
+
+    def _put_job(self, job: EngineJob) -> None:
+        """Put `job` into bounded queue, replacing stale jobs if it is full."""
+        self._stop_running_analysis()
+
+        if not job.is_analysis:
+            self._drop_queued_jobs(is_analysis=False)
+
+        if self._jobs.full():
+            logger.warning("Analysis job dropped: engine queue is full")
+            self._drop_queued_jobs(is_analysis=True, limit=1)
+
+        self._jobs.put_nowait(job)
+
+    def _drop_queued_jobs(self, is_analysis: bool, limit: int | None = None) -> None:
+        """Drop up to `limit` oldest queued jobs of kind given by `is_analysis`."""
+        pending_jobs: list[EngineJob] = []
+        dropped_count: int = 0
+
+        while not self._jobs.empty():
+            job: EngineJob = self._jobs.get_nowait()
+            self._jobs.task_done()
+
+            if job.is_analysis == is_analysis and (
+                limit is None or dropped_count < limit
+            ):
+                dropped_count += 1
+            else:
+                pending_jobs.append(job)
+
+        for pending_job in pending_jobs:
+            self._jobs.put_nowait(pending_job)
+
+    async def _process_jobs(self) -> None:
+        """Run queued jobs one after another for engine's lifetime."""
+        while True:
+            job: EngineJob = await self._jobs.get()
+
+            try:
+                await job.run()
+            except EngineTerminatedError as exception:
+                logger.warning("Engine terminated: %s", exception)
+                self._protocol = None
+                self.load_failed.emit(f"UCI engine terminated.\n\n{exception}")
+            except EngineError as exception:
+                logger.warning("Engine job failed: %s", exception)
+            except Exception:
+                logger.exception("Engine job raised unexpectedly")
+            finally:
+                self._jobs.task_done()
+
+    async def _quit(self, protocol: UciProtocol) -> None:
+        """Terminate engine process behind `protocol`."""
+        try:
+            await asyncio.wait_for(protocol.quit(), QUIT_TIMEOUT)
+        except (asyncio.TimeoutError, EngineError, EngineTerminatedError):
+            pass
 
     def quit(self) -> None:
-        """Stop analysis and terminate engine."""
+        """Stop analysis, wait for pending loads and terminate engine."""
         self.stop_analysis()
 
-        if hasattr(self, "_engine"):
-            self._engine.quit()
+        for pending_load in self._loads:
+            pending_load.result()
+
+        self._loads.clear()
+
+        if self._protocol is not None:
+            protocol: UciProtocol = self._protocol
+            self._protocol = None
+            self._event_loop.submit(self._quit(protocol)).result()
+
+        self._event_loop.submit(self._close_cache()).result()
+
+    async def _close_cache(self) -> None:
+        """Close evaluation cache, opening book and tablebase on loop thread."""
+        self._evaluation_cache.close()
+
+        if self._opening_book is not None:
+            self._opening_book.close()
+
+        if self._tablebase is not None:
+            self._tablebase.close()
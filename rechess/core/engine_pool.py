@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, ClassVar, Final, TypeVar
+
+from chess import Board
+from chess.engine import (
+    EngineError,
+    EngineTerminatedError,
+    InfoDict,
+    Limit,
+    PlayResult,
+    UciProtocol,
+    popen_uci,
+)
+from PySide6.QtCore import QObject, Signal
+
+from rechess.core.event_loop import EventLoopThread, shared_event_loop
+from rechess.utils import (
+    delete_quarantine_attribute,
+    engine_configuration,
+    make_executable,
+)
+
+
+HEALTH_CHECK_INTERVAL: Final[float] = 10.0
+PING_TIMEOUT: Final[float] = 5.0
+QUIT_TIMEOUT: Final[float] = 5.0
+
+
+JobResult = TypeVar("JobResult")
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class EngineWorker:
+    """Single UCI process with its own share of threads and hash."""
+
+    def __init__(
+        self,
+        index: int,
+        path_to_file: str,
+        options: dict[str, int | str],
+    ) -> None:
+        self.index: int = index
+        self.path_to_file: str = path_to_file
+        self.options: dict[str, int | str] = options
+        self.protocol: UciProtocol | None = None
+        self.restart_count: int = 0
+
+    @property
+    def is_alive(self) -> bool:
+        """Return True if engine process is running."""
+        return self.protocol is not None and not self.protocol.returncode.done()
+
+    @property
+    def name(self) -> str:
+        """Get engine name if engine is running."""
+        if self.protocol is not None:
+            return self.protocol.id.get("name", "(unnamed engine)")
+        return "(no engine loaded)"
+
+    async def start(self) -> None:
+        """Spawn and configure engine process."""
+        delete_quarantine_attribute(self.path_to_file)
+        make_executable(self.path_to_file)
+
+        _, self.protocol = await popen_uci(self.path_to_file)
+        await self.protocol.configure(self.options)
+
+    async def is_healthy(self) -> bool:
+        """Return True if engine process answers ping in time."""
+        if not self.is_alive:
+            return False
+
+        try:
+            await asyncio.wait_for(self.protocol.ping(), PING_TIMEOUT)
+        except (asyncio.TimeoutError, EngineError, EngineTerminatedError):
+            return False
+
+        return True
+
+    async def restart(self) -> None:
+        """Replace crashed or hung engine process by new one."""
+        self.restart_count += 1
+
+        await self.quit()
+        await self.start()
+
+    async def quit(self) -> None:
+        """Terminate engine process, killing it if it does not quit."""
+        if self.protocol is None:
+            return
+
+        protocol: UciProtocol = self.protocol
+        self.protocol = None
+
+        try:
+            await asyncio.wait_for(protocol.quit(), QUIT_TIMEOUT)
+        except (asyncio.TimeoutError, EngineError, EngineTerminatedError):
+            protocol.transport.kill()
+
+
+class EnginePool(QObject):
+    """Pool of UCI processes serving jobs on whichever worker is idle."""
+
+    worker_restarted: ClassVar[Signal] = Signal(int)
+    started: ClassVar[Signal] = Signal(int)
+    start_failed: ClassVar[Signal] = Signal(str)
+
+    def __init__(
+        self,
+        paths_to_files: list[str],
+        threads: int | None = None,
+        hash_size: int | None = None,
+        reserved_threads: int = 0,
+    ) -> None:
+        super().__init__()
+
+        configuration: dict[str, int | str] = engine_configuration()
+        total_hash_size: int = hash_size or int(configuration["Hash"])
+        worker_count: int = len(paths_to_files)
+        total_threads: int = max(
+            worker_count,
+            (threads or int(configuration["Threads"])) - reserved_threads,
+        )
+
+        self._event_loop: EventLoopThread = shared_event_loop()
+        self._idle_workers: asyncio.Queue[EngineWorker] = asyncio.Queue()
+        self._health_task: asyncio.Task | None = None
+
+        self.workers: list[EngineWorker] = [
+            EngineWorker(
+                index=index,
+                path_to_file=path_to_file,
+                options={
+                    **configuration,
+                    "Hash": max(1, total_hash_size // worker_count),
+                    "Threads": max(1, total_threads // worker_count),
+                },
+            )
+            for index, path_to_file in enumerate(paths_to_files)
+        ]
+
+    @classmethod
+    def of_same_engine(
+        cls,
+        path_to_file: str,
+        worker_count: int,
+        threads: int | None = None,
+        hash_size: int | None = None,
+        reserved_threads: int = 0,
+    ) -> EnginePool:
+        """Create pool of `worker_count` processes of same engine."""
+        return cls(
+            [path_to_file] * worker_count,
+            threads,
+            hash_size,
+            reserved_threads,
+        )
+
+    @property
+    def size(self) -> int:
+        """Get number of engine processes in pool."""
+        return len(self.workers)
+
+    def start(self) -> Future:
+        """Spawn all engine processes without blocking."""
+        return self._event_loop.submit(self.spawn())
+
+    async def spawn(self) -> bool:
+        """Spawn engine processes and start periodic health checks."""
+        try:
+            await asyncio.gather(*(worker.start() for worker in self.workers))
+        except Exception as exception:
+            self.start_failed.emit(f"Engine pool failed to start.\n\n{exception}")
+            await self.shutdown()
+            return False
+
+        for worker in self.workers:
+            self._idle_workers.put_nowait(worker)
+
+        self._health_task = asyncio.create_task(self._check_health_periodically())
+        self.started.emit(self.size)
+        return True
+
+    async def _check_health_periodically(self) -> None:
+        """Ping idle workers and restart those that do not respond."""
+        while True:
+            await asyncio.sleep(HEALTH_CHECK_INTERVAL)
+
+            for _ in range(self._idle_workers.qsize()):
+                worker: EngineWorker = self._idle_workers.get_nowait()
+
+                try:
+                    if not await worker.is_healthy():
+                        await self._restart(worker)
+                except Exception as exception:
+                    logger.warning(
+                        "Engine worker %d failed: %s", worker.index, exception
+                    )
+
+                self._idle_workers.put_nowait(worker)
+
+    async def _restart(self, worker: EngineWorker) -> None:
+        """Restart `worker` and announce it."""
+        logger.warning("Restarting engine worker %d", worker.index)
+
+        await worker.restart()
+        self.worker_restarted.emit(worker.index)
+
+    async def run(
+        self, job: Callable[[UciProtocol], Awaitable[JobResult]]
+    ) -> JobResult:
+        """Run `job` on next idle worker, retrying once after crash."""
+        worker: EngineWorker = await self._idle_workers.get()
+
+        try:
+            if not worker.is_alive:
+                await self._restart(worker)
+
+            try:
+                return await job(worker.protocol)
+            except EngineTerminatedError:
+                await self._restart(worker)
+                return await job(worker.protocol)
+        finally:
+            self._idle_workers.put_nowait(worker)
+
+    async def analyse(self, board: Board, limit: Limit, **options: Any) -> InfoDict:
+        """Analyse `board` within `limit` on idle worker."""
+        return await self.run(
+            lambda protocol: protocol.analyse(board, limit, **options)
+        )
+
+    async def play(self, board: Board, limit: Limit) -> PlayResult:
+        """Search move for `board` within `limit` on idle worker."""
+        return await self.run(lambda protocol: protocol.play(board, limit))
+
+    async def evaluate_positions(self, fens: list[str], limit: Limit) -> list[InfoDict]:
+        """Analyse positions of `fens` in parallel across all workers."""
+        return await asyncio.gather(*(self.analyse(Board(fen), limit) for fen in fens))
+
+    def submit(self, coroutine: Awaitable[JobResult]) -> Future:
+        """Schedule pool `coroutine` from any thread."""
+        return self._event_loop.submit(coroutine)
+
+    async def shutdown(self) -> None:
+        """Stop health checks and terminate all engine processes."""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+
+        await asyncio.gather(*(worker.quit() for worker in self.workers))
+
+    def quit(self) -> None:
+        """Terminate all engine processes."""
+        self._event_loop.submit(self.shutdown()).result()
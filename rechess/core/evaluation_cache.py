@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import sqlite3
+from itertools import count
+from typing import Final, Iterator, NamedTuple
+
+from chess import Board, Move
+from chess.engine import Cp, Mate, Score
+from chess.polyglot import zobrist_hash
+
+
+EVICTION_RATIO: Final[float] = 0.9
+SIGNED_KEY_OFFSET: Final[int] = 1 << 64
+SIGNED_KEY_LIMIT: Final[int] = 1 << 63
+
+
+class CachedEvaluation(NamedTuple):
+    """Type annotations for cached evaluation."""
+
+    depth: int
+    score: Score
+    pv: list[Move]
+    engine: str
+
+
+class EvaluationCache:
+    """SQLite cache of engine evaluations keyed by Zobrist hash."""
+
+    def __init__(self, path_to_file: str, max_entries: int = 200_000) -> None:
+        self._path_to_file: str = path_to_file
+        self._max_entries: int = max_entries
+        self._connection: sqlite3.Connection | None = None
+        self._access_clock: Iterator[int] = count()
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Get ratio of lookups answered from cache."""
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Get connection, opening database on first use."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self._path_to_file)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS evaluations ("
+                "key INTEGER NOT NULL, "
+                "engine TEXT NOT NULL, "
+                "depth INTEGER NOT NULL, "
+                "is_mate INTEGER NOT NULL, "
+                "score INTEGER NOT NULL, "
+                "pv TEXT NOT NULL, "
+                "last_access INTEGER NOT NULL, "
+                "PRIMARY KEY (key, engine))"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS evaluations_last_access "
+                "ON evaluations (last_access)"
+            )
+
+            last_access: int = self._connection.execute(
+                "SELECT COALESCE(MAX(last_access), 0) FROM evaluations"
+            ).fetchone()[0]
+            self._access_clock = count(last_access + 1)
+
+        return self._connection
+
+    @staticmethod
+    def key(board: Board) -> int:
+        """Get Zobrist hash of `board` as signed SQLite integer."""
+        key: int = zobrist_hash(board)
+        return key - SIGNED_KEY_OFFSET if key >= SIGNED_KEY_LIMIT else key
+
+    def get(self, board: Board, engine: str) -> CachedEvaluation | None:
+        """Get cached evaluation of `board` by `engine`."""
+        key: int = self.key(board)
+        row: tuple[int, int, int, str] | None = self.connection.execute(
+            "SELECT depth, is_mate, score, pv FROM evaluations "
+            "WHERE key = ? AND engine = ?",
+            (key, engine),
+        ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.connection.execute(
+            "UPDATE evaluations SET last_access = ? WHERE key = ? AND engine = ?",
+            (next(self._access_clock), key, engine),
+        )
+
+        depth, is_mate, score, pv = row
+        return CachedEvaluation(
+            depth=depth,
+            score=Mate(score) if is_mate else Cp(score),
+            pv=[Move.from_uci(uci) for uci in pv.split()],
+            engine=engine,
+        )
+
+    def put(
+        self,
+        board: Board,
+        engine: str,
+        depth: int,
+        score: Score,
+        pv: list[Move],
+    ) -> None:
+        """Store evaluation of `board` unless deeper one is cached."""
+        is_mate: bool = score.is_mate()
+        score_value: int = score.mate() if is_mate else score.score()
+
+        self.connection.execute(
+            "INSERT INTO evaluations VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (key, engine) DO UPDATE SET "
+            "depth = excluded.depth, is_mate = excluded.is_mate, "
+            "score = excluded.score, pv = excluded.pv, "
+            "last_access = excluded.last_access "
+            "WHERE excluded.depth > evaluations.depth",
+            (
+                self.key(board),
+                engine,
+                depth,
+                is_mate,
+                score_value,
+                " ".join(move.uci() for move in pv),
+                next(self._access_clock),
+            ),
+        )
+
+    def commit(self) -> None:
+        """Evict least recently used entries over budget and commit."""
+        if self._connection is None:
+            return
+
+        entries: int = self._connection.execute(
+            "SELECT COUNT(*) FROM evaluations"
+        ).fetchone()[0]
+
+        if entries > self._max_entries:
+            self._connection.execute(
+                "DELETE FROM evaluations WHERE last_access <= ("
+                "SELECT last_access FROM evaluations "
+                "ORDER BY last_access DESC LIMIT 1 OFFSET ?)",
+                (int(self._max_entries * EVICTION_RATIO),),
+            )
+
+        self._connection.commit()
+
+    def close(self) -> None:
+        """Commit pending changes and close database."""
+        if self._connection is not None:
+            self.commit()
+            self._connection.close()
+            self._connection = None
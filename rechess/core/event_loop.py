@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future
+from functools import lru_cache
+from threading import Thread
+from typing import Any, Callable, Coroutine
+
+
+class EventLoopThread:
+    """Asyncio event loop running forever on dedicated daemon thread."""
+
+    def __init__(self, name: str) -> None:
+        self._loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        self._thread: Thread = Thread(
+            target=self._loop.run_forever,
+            name=name,
+            daemon=True,
+        )
+        self._thread.start()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Get event loop running on dedicated thread."""
+        return self._loop
+
+    def submit(self, coroutine: Coroutine[Any, Any, Any]) -> Future:
+        """Schedule `coroutine` on event loop from any thread."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def call_soon(self, callback: Callable[..., Any], *args: Any) -> None:
+        """Schedule `callback` with `args` on event loop from any thread."""
+        self._loop.call_soon_threadsafe(callback, *args)
+
+
+@lru_cache(maxsize=1)
+def shared_event_loop() -> EventLoopThread:
+    """Get event loop thread shared by all engine processes."""
+    return EventLoopThread("engine-event-loop")
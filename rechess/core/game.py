@@ -1,16 +1,24 @@
 from __future__ import annotations
 
-from contextlib import suppress
-from typing import ClassVar, Iterator
+from datetime import date
+from typing import ClassVar, Final, Iterable
 
-from chess import BB_SQUARES, BLACK, WHITE, Board, IllegalMoveError, Move
+from chess import BLACK, WHITE, Board, Move
+from chess.engine import PovScore
+from chess.pgn import Game as PgnGame
+from chess.pgn import GameNode as PgnNode
 from PySide6.QtCore import QObject, Signal
 from PySide6.QtWidgets import QDialog
 
+from rechess.core.game_history import GameHistory
+from rechess.core.legal_move_map import LegalMoveMap
 from rechess.ui.dialogs import PromotionDialog
 from rechess.utils import setting_value
 
 
+ARROW_COLORS: Final[tuple[str, ...]] = ("green", "blue", "yellow", "red")
+
+
 class Game(QObject):
     """Management of game state, logic, and events."""
 
@@ -21,10 +29,10 @@ class Game(QObject):
         super().__init__()
 
         self.board: Board = Board()
+        self._legal_move_map: LegalMoveMap | None = None
 
-        self.moves: list[str] = []
-        self.positions: list[Board] = []
-        self.arrow: list[tuple[Square, Square]] = []
+        self.history: GameHistory = GameHistory()
+        self.arrow: list[tuple[Square, Square, str]] = []
 
         self.move_index: int = -1
         self.origin_square: Square | None = None
@@ -45,8 +53,21 @@ class Game(QObject):
     def fen(self, value) -> None:
         """Set new position in FEN format based on `value`."""
         self.board.set_fen(value)
+        self.invalidate_legal_moves()
         self._initialize_state()
 
+    @property
+    def moves(self) -> list[str]:
+        """Get SAN of every move in history line."""
+        return self.history.sans()
+
+    @property
+    def legal_move_map(self) -> LegalMoveMap:
+        """Get legal moves of current position, computing them once."""
+        if self._legal_move_map is None:
+            self._legal_move_map = LegalMoveMap(self.board)
+        return self._legal_move_map
+
     @property
     def check(self) -> Square | None:
         """Get square of king in check."""
@@ -65,7 +86,7 @@ class Game(QObject):
             elif self.player_lost_on_time == WHITE:
                 return "Black wins on time"
         else:
-            result = self.board.result(claim_draw=True)
+            result = self.result_code(self.board)
 
         result_descriptions: dict[str, str] = {
             "1/2-1/2": "Draw",
@@ -80,6 +101,12 @@ class Game(QObject):
         """Return True if White is on turn."""
         return self.board.turn
 
+    def result_code(self, board: Board) -> str:
+        """Get result in PGN notation of game ending with `board`."""
+        if self.has_time_expired:
+            return "1-0" if self.player_lost_on_time == BLACK else "0-1"
+        return board.result(claim_draw=True)
+
     def _initialize_state(self) -> None:
         """Clear game history and set squares to initial value."""
         self.move_index = -1
@@ -87,12 +114,15 @@ class Game(QObject):
         self.has_time_expired = False
         self.player_lost_on_time = None
 
-        self.moves.clear()
-        self.positions.clear()
+        self.history.reset(self.board)
 
         self.clear_arrow()
         self.reset_selected_squares()
 
+    def invalidate_legal_moves(self) -> None:
+        """Discard legal moves computed for previous position."""
+        self._legal_move_map = None
+
     def reset_selected_squares(self) -> None:
         """Reset origin and target squares."""
         self.origin_square = None
@@ -109,8 +139,9 @@ class Game(QObject):
 
     def prepare_new_game(self) -> None:
         """Initialize state and reset board for new game."""
-        self._initialize_state()
         self.board.reset()
+        self.invalidate_legal_moves()
+        self._initialize_state()
 
     def declare_time_loss_for(self, player_color: Color) -> None:
         """Declare that `player_color` has lost on time."""
@@ -120,28 +151,111 @@ class Game(QObject):
     def maybe_append_ellipsis(self) -> None:
         """If Black moves first, append ellipsis for White's move."""
         if self.move_index < 0 and not self.is_white_on_turn():
-            self.moves.append("...")
-            self.positions.append(self.board.copy())
+            self.history.append_ellipsis()
 
     def push(self, move: Move) -> None:
         """Update game state by pushing `move`."""
         if not self.board.is_legal(move):
             return
 
-        self.delete_data_after_index()
+        self.truncate_line_after_index()
         self.maybe_append_ellipsis()
 
         self.sound_effect_played.emit(move)
 
         new_move: str = self.board.san_and_push(move)
-        self.moves.append(new_move)
+        self.history.append(move, new_move, self.board)
+        self.invalidate_legal_moves()
+
+    def push_moves(self, moves: Iterable[Move]) -> None:
+        """Update game state by pushing `moves` at once, stopping at illegal one."""
+        self.truncate_line_after_index()
+        self.maybe_append_ellipsis()
+
+        for move in moves:
+            if not self.board.is_legal(move):
+                break
+
+            new_move: str = self.board.san_and_push(move)
+            self.history.append(move, new_move, self.board)
+
+        self.invalidate_legal_moves()
+
+    def load_moves(self, root: Board, moves: Iterable[Move]) -> None:
+        """Start game from `root` position and push `moves` played from it."""
+        self.fen = root.fen()
+        self.push_moves(moves)
+
+    def to_pgn(self, engine_name: str) -> PgnGame:
+        """Get game with variations, clock times and evaluations in PGN form."""
+        human_name: str = setting_value("human", "name")
+        is_engine_white: bool = setting_value("engine", "is_white")
+        clock_time: float = setting_value("clock", "time")
+        clock_increment: float = setting_value("clock", "increment")
+
+        pgn_game: PgnGame = PgnGame()
+        pgn_game.setup(self.history.root)
+        pgn_game.headers["Event"] = "ReChess game"
+        pgn_game.headers["Date"] = date.today().strftime("%Y.%m.%d")
+        pgn_game.headers["White"] = engine_name if is_engine_white else human_name
+        pgn_game.headers["Black"] = human_name if is_engine_white else engine_name
+        pgn_game.headers["TimeControl"] = f"{clock_time:g}+{clock_increment:g}"
+
+        board: Board = self.history.root.copy()
+        pgn_node: PgnNode = pgn_game
+        parent: GameNode = self.history.root_node
 
-        position: Board = self.board.copy()
-        self.positions.append(position)
+        for node in self.history.line:
+            board.push(node.move)
+            line_pgn_node: PgnNode = pgn_node.add_variation(node.move)
+            self.annotate_pgn_node(line_pgn_node, node)
+
+            for variation in parent.children:
+                if variation is not node:
+                    self.add_pgn_variation(pgn_node, variation)
+
+            pgn_node = line_pgn_node
+            parent = node
+
+        pgn_game.headers["Result"] = self.result_code(board)
+        return pgn_game
+
+    def add_pgn_variation(self, pgn_parent: PgnNode, variation: GameNode) -> None:
+        """Add `variation` with all its continuations below `pgn_parent`."""
+        pending: list[tuple[PgnNode, GameNode]] = [(pgn_parent, variation)]
+
+        while pending:
+            pgn_node, node = pending.pop()
+            pgn_child: PgnNode = pgn_node.add_variation(node.move)
+            self.annotate_pgn_node(pgn_child, node)
+            pending.extend((pgn_child, child) for child in reversed(node.children))
+
+    def annotate_pgn_node(self, pgn_node: PgnNode, node: GameNode) -> None:
+        """Copy evaluation and clock time of `node` to `pgn_node`."""
+        if node.evaluation is not None:
+            pgn_node.set_eval(PovScore(node.evaluation, WHITE))
+
+        if node.clock_time is not None:
+            pgn_node.set_clock(node.clock_time)
+
+    def set_evaluation(self, item_index: int, score: Score) -> None:
+        """Store `score` on position after history item at `item_index`."""
+        self.history.node_at(item_index).evaluation = score
+
+    def set_clock_time(self, item_index: int, clock_time: float) -> None:
+        """Store remaining `clock_time` after history item at `item_index`."""
+        self.history.node_at(item_index).clock_time = clock_time
 
     def set_arrow(self, move: Move) -> None:
         """Set arrow based on `move`."""
-        self.arrow = [(move.from_square, move.to_square)]
+        self.arrow = [(move.from_square, move.to_square, ARROW_COLORS[0])]
+
+    def set_arrows(self, moves: list[Move]) -> None:
+        """Set arrows based on `moves`, each colored by its position."""
+        self.arrow = [
+            (move.from_square, move.to_square, ARROW_COLORS[index % len(ARROW_COLORS)])
+            for index, move in enumerate(moves)
+        ]
 
     def clear_arrow(self) -> None:
         """Clear arrow from board."""
@@ -149,32 +263,31 @@ class Game(QObject):
 
     def set_root_position(self) -> None:
         """Reset pieces on board to initial position and clear arrow."""
-        self.move_index = -1
-        self.board = self.board.root()
+        self.replay_to(-1)
 
         self.clear_arrow()
 
-    def legal_targets(self, square: Square | None = None) -> list[Square]:
+    def legal_targets(self, square: Square | None = None) -> Bitboard:
         """Get target squares as legal moves for piece at `square`."""
         if square is None:
-            return []
+            return 0
 
-        square_bit: int = BB_SQUARES[square]
-        targets: Iterator[Move] = self.board.generate_legal_moves(square_bit)
-        return [move.to_square for move in targets]
+        return self.legal_move_map.target_squares(square)
 
     def find_legal_move(self, origin_square: Square, target_square: Square) -> None:
         """Find legal move for `origin_square` and `target_square`."""
         if origin_square is None or target_square is None:
             return
 
-        with suppress(IllegalMoveError):
-            move: Move = self.board.find_move(origin_square, target_square)
+        move: Move | None = self.legal_move_map.find_move(origin_square, target_square)
+
+        if move is None:
+            return
 
-            if move.promotion:
-                move.promotion = self.promotion_piece_type()
+        if move.promotion:
+            move = Move(move.from_square, move.to_square, self.promotion_piece_type())
 
-            self.move_played.emit(move)
+        self.move_played.emit(move)
 
     def promotion_piece_type(self) -> PieceType | None:
         """Get promotion piece type from promotion dialog."""
@@ -191,22 +304,34 @@ class Game(QObject):
 
     def update_state(self, item_index: int) -> None:
         """Update game state based on `item_index`."""
-        self.move_index = item_index
-        self.board = self.positions[item_index].copy()
+        self.replay_to(item_index)
+
+        move: Move | None = self.history.move_at(item_index)
 
-        if self.moves[item_index] != "...":
-            self.set_arrow(self.board.move_stack[-1])
+        if move is not None:
+            self.set_arrow(move)
         else:
             self.clear_arrow()
 
-    def delete_data_after_index(self) -> None:
-        """Delete moves and positions after internal move index."""
-        last_move_index: int = len(self.moves) - 1
+    def replay_to(self, item_index: int) -> None:
+        """Pop or push moves on board until it reaches `item_index`."""
+        self.move_index = item_index
+        plies: int = self.history.plies_until(item_index)
+
+        while len(self.board.move_stack) > plies:
+            self.board.pop()
+
+        for ply in range(len(self.board.move_stack), plies):
+            self.board.push(self.history.move_at_ply(ply))
+
+        self.invalidate_legal_moves()
+
+    def truncate_line_after_index(self) -> None:
+        """Cut history line after internal move index, keeping variations."""
+        last_move_index: int = len(self.history) - 1
 
         if self.move_index < last_move_index:
-            after_move_index: slice = slice(self.move_index + 1, len(self.moves))
-            del self.moves[after_move_index]
-            del self.positions[after_move_index]
+            self.history.truncate(self.move_index + 1)
 
     def gives_check(self, move: Move) -> bool:
         """Return True if `move` puts opponent's king in check."""
@@ -218,7 +343,7 @@ class Game(QObject):
 
     def is_in_progress(self) -> bool:
         """Return True if game is in progress."""
-        return bool(self.moves)
+        return bool(len(self.history))
 
     def is_legal(self, move: Move) -> bool:
         """Return True if `move` would be considered as legal."""
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import Future
+from enum import StrEnum
+from itertools import count
+from typing import ClassVar, Final, Iterator
+
+from chess import Board, Outcome
+from chess.engine import Cp, InfoDict, Limit, Mate, PovScore, Score
+from PySide6.QtCore import QObject, Signal
+
+from rechess.core.engine_pool import EnginePool
+
+
+BLUNDER_LOSS: Final[int] = 300
+MISTAKE_LOSS: Final[int] = 100
+INACCURACY_LOSS: Final[int] = 50
+MATE_SCORE: Final[int] = 1000
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class Judgement(StrEnum):
+    """SAN annotation symbol for move quality by centipawn loss."""
+
+    Blunder = "??"
+    Mistake = "?"
+    Inaccuracy = "?!"
+    Good = ""
+
+
+def judge(centipawn_loss: int) -> Judgement:
+    """Get judgement of move that lost `centipawn_loss`."""
+    if centipawn_loss >= BLUNDER_LOSS:
+        return Judgement.Blunder
+    if centipawn_loss >= MISTAKE_LOSS:
+        return Judgement.Mistake
+    if centipawn_loss >= INACCURACY_LOSS:
+        return Judgement.Inaccuracy
+    return Judgement.Good
+
+
+def centipawns(score: Score) -> int:
+    """Get `score` in centipawns with mates clamped to mate score."""
+    return max(-MATE_SCORE, min(MATE_SCORE, score.score(mate_score=MATE_SCORE)))
+
+
+def outcome_score(board: Board) -> Score | None:
+    """Get score from White's view if game on `board` is over, else None."""
+    outcome: Outcome | None = board.outcome()
+
+    if outcome is None:
+        return None
+
+    if outcome.winner is None:
+        return Cp(0)
+
+    return PovScore(Mate(0), board.turn).white()
+
+
+class GameAnalysis(QObject):
+    """Evaluation of every position of game across engine pool."""
+
+    finished: ClassVar[Signal] = Signal(int, bool)
+    move_judged: ClassVar[Signal] = Signal(int, int, str, int)
+    position_analyzed: ClassVar[Signal] = Signal(int, int, Score)
+    progress_changed: ClassVar[Signal] = Signal(int, int, int)
+
+    _run_ids: ClassVar[Iterator[int]] = count(1)
+
+    def __init__(self, pool: EnginePool, time_per_position: float) -> None:
+        super().__init__()
+
+        self._pool: EnginePool = pool
+        self._limit: Limit = Limit(time=time_per_position)
+        self._future: Future | None = None
+        self._task: asyncio.Task | None = None
+        self.run_id: int = 0
+
+        self._root: Board = Board()
+        self._positions: list[Board] = []
+        self._moves: list[str] = []
+
+        self.scores: dict[int, Score] = {}
+        self.judgements: dict[int, Judgement] = {}
+
+    @property
+    def is_running(self) -> bool:
+        """Return True if analysis is still in progress."""
+        return self._future is not None and not self._future.done()
+
+    def start(self, root: Board, positions: list[Board], moves: list[str]) -> None:
+        """Start evaluating `root` and `positions` reached by `moves`."""
+        self._root = root.copy()
+        self._positions = [position.copy() for position in positions]
+        self._moves = list(moves)
+
+        self.scores.clear()
+        self.judgements.clear()
+
+        self.run_id = next(GameAnalysis._run_ids)
+        self._future = self._pool.submit(self._analyze(self.run_id))
+
+    def cancel(self, wait: bool = False) -> None:
+        """Cancel analysis, waiting for engine pool to shut down if `wait`."""
+        if self._future is not None:
+            self._future.cancel()
+
+        if wait:
+            self._pool.submit(self._wait_for_shutdown()).result()
+
+    async def _wait_for_shutdown(self) -> None:
+        """Wait until analysis task has shut down engine pool."""
+        if self._task is not None:
+            await asyncio.wait([self._task])
+
+    async def _analyze(self, run_id: int) -> None:
+        """Evaluate all positions in parallel and judge each move."""
+        self._task = asyncio.current_task()
+        boards: list[Board] = [self._root, *self._positions]
+        total: int = len(boards)
+        completed: int = 0
+
+        async def analyze_position(position_index: int, board: Board) -> None:
+            nonlocal completed
+
+            score: Score | None = outcome_score(board)
+
+            if score is None:
+                info: InfoDict = await self._pool.analyse(board, self._limit)
+
+                if "score" in info:
+                    score = info["score"].white()
+
+            if score is not None:
+                self.scores[position_index] = score
+                self.position_analyzed.emit(run_id, position_index, score)
+
+                self.maybe_judge(run_id, position_index)
+                self.maybe_judge(run_id, position_index + 1)
+
+            completed += 1
+            self.progress_changed.emit(run_id, completed, total)
+
+        try:
+            if not await self._pool.spawn():
+                self.finished.emit(run_id, False)
+                return
+
+            await asyncio.gather(
+                *(
+                    analyze_position(position_index, board)
+                    for position_index, board in enumerate(boards, start=-1)
+                )
+            )
+        except asyncio.CancelledError:
+            self.finished.emit(run_id, False)
+            raise
+        except Exception:
+            logger.exception("Game analysis failed")
+            self.finished.emit(run_id, False)
+        else:
+            self.finished.emit(run_id, True)
+        finally:
+            await self._pool.shutdown()
+
+    def maybe_judge(self, run_id: int, move_index: int) -> None:
+        """Judge move at `move_index` once both its positions are scored."""
+        if not 0 <= move_index < len(self._moves):
+            return
+
+        if self._moves[move_index] == "...":
+            return
+
+        if move_index - 1 not in self.scores or move_index not in self.scores:
+            return
+
+        before: Board = self._positions[move_index - 1] if move_index else self._root
+        sign: int = 1 if before.turn else -1
+
+        score_before: int = sign * centipawns(self.scores[move_index - 1])
+        score_after: int = sign * centipawns(self.scores[move_index])
+        centipawn_loss: int = max(0, score_before - score_after)
+
+        judgement: Judgement = judge(centipawn_loss)
+        self.judgements[move_index] = judgement
+        self.move_judged.emit(run_id, move_index, judgement, centipawn_loss)
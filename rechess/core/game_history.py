@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+from chess import Board, Move
+
+from rechess.core.game_tree import GameNode
+
+
+class GameHistory:
+    """Line of game tree shown as move history, keeping all variations."""
+
+    def __init__(self) -> None:
+        self.root: Board = Board()
+        self.root_node: GameNode = GameNode(None, None, "", self.root)
+        self.line: list[GameNode] = []
+        self.has_ellipsis: bool = False
+
+        self._changed_index: int | None = None
+
+    def __len__(self) -> int:
+        """Get number of history items."""
+        return len(self.line) + self.ellipsis_offset
+
+    @property
+    def ellipsis_offset(self) -> int:
+        """Get 1 if history starts with ellipsis for White's move."""
+        return 1 if self.has_ellipsis else 0
+
+    def reset(self, root: Board) -> None:
+        """Discard game tree and start new one from `root`."""
+        self.root = root.copy(stack=False)
+        self.root_node = GameNode(None, None, "", self.root)
+        self.line.clear()
+        self.has_ellipsis = False
+        self.mark_changed(0)
+
+    def mark_changed(self, item_index: int) -> None:
+        """Remember that history items from `item_index` onward changed."""
+        if self._changed_index is None or item_index < self._changed_index:
+            self._changed_index = item_index
+
+    def take_changed_index(self) -> int | None:
+        """Get index of first changed item since last call, if any."""
+        changed_index: int | None = self._changed_index
+        self._changed_index = None
+        return changed_index
+
+    def append_ellipsis(self) -> None:
+        """Start history with ellipsis for White's move."""
+        self.has_ellipsis = True
+        self.mark_changed(0)
+
+    def append(self, move: Move, san: str, board: Board) -> GameNode:
+        """Extend line by `move` written as `san` leading to `board`."""
+        parent: GameNode = self.line[-1] if self.line else self.root_node
+        node: GameNode | None = parent.child(move)
+
+        if node is None:
+            node = parent.add_child(move, san, board)
+
+        parent.promote(node)
+        self.line.append(node)
+        self.mark_changed(len(self) - 1)
+        return node
+
+    def truncate(self, length: int) -> None:
+        """Cut line to `length` items, keeping cut moves as variations."""
+        del self.line[max(0, length - self.ellipsis_offset) :]
+
+        if length <= 0:
+            self.has_ellipsis = False
+
+        self.mark_changed(max(0, length))
+
+    def node_at(self, item_index: int) -> GameNode:
+        """Get node of position after history item at `item_index`."""
+        line_index: int = item_index - self.ellipsis_offset
+        return self.line[line_index] if line_index >= 0 else self.root_node
+
+    def keys_until(self, item_index: int) -> Iterator[int]:
+        """Get Zobrist hashes of positions from `item_index` back to root."""
+        node: GameNode | None = self.node_at(item_index)
+
+        while node is not None:
+            yield node.key
+            node = node.parent
+
+    def move_at(self, item_index: int) -> Move | None:
+        """Get move of history item at `item_index`, or None for ellipsis."""
+        return self.node_at(item_index).move
+
+    def san_at(self, item_index: int) -> str:
+        """Get SAN of history item at `item_index`."""
+        return self.node_at(item_index).san or "..."
+
+    def sans(self) -> list[str]:
+        """Get SAN of every history item."""
+        return ["..."] * self.ellipsis_offset + [node.san for node in self.line]
+
+    def plies_until(self, item_index: int) -> int:
+        """Get number of moves played up to history item at `item_index`."""
+        if item_index < 0:
+            return 0
+        return item_index + 1 - self.ellipsis_offset
+
+    def move_at_ply(self, ply: int) -> Move:
+        """Get move played at `ply` counted from root position."""
+        return self.line[ply].move
+
+    def position_at(self, item_index: int) -> Board:
+        """Get position after history item at `item_index`."""
+        return self.node_at(item_index).board()
+
+    def positions(self) -> list[Board]:
+        """Get positions after each history item without move stacks."""
+        board: Board = self.root.copy(stack=False)
+        positions: list[Board] = [board.copy(stack=False)] * self.ellipsis_offset
+
+        for node in self.line:
+            board.push(node.move)
+            positions.append(board.copy(stack=False))
+
+        return positions
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import Final
+
+from chess import Board, Move
+from chess.polyglot import zobrist_hash
+
+
+SNAPSHOT_INTERVAL: Final[int] = 32
+
+
+class GameNode:
+    """Position in game tree reached by move from parent position."""
+
+    __slots__ = (
+        "parent",
+        "move",
+        "san",
+        "key",
+        "ply",
+        "children",
+        "evaluation",
+        "clock_time",
+        "_snapshot",
+    )
+
+    def __init__(
+        self,
+        parent: GameNode | None,
+        move: Move | None,
+        san: str,
+        board: Board,
+    ) -> None:
+        self.parent: GameNode | None = parent
+        self.move: Move | None = move
+        self.san: str = san
+        self.key: int = zobrist_hash(board)
+        self.ply: int = parent.ply + 1 if parent is not None else 0
+        self.children: list[GameNode] = []
+        self.evaluation: Score | None = None
+        self.clock_time: float | None = None
+
+        self._snapshot: Board | None = None
+
+        if parent is None or self.ply % SNAPSHOT_INTERVAL == 0:
+            self._snapshot = board.copy(stack=False)
+
+    @property
+    def main_child(self) -> GameNode | None:
+        """Get child continuing main line, if any."""
+        return self.children[0] if self.children else None
+
+    @property
+    def variations(self) -> list[GameNode]:
+        """Get children starting side variations."""
+        return self.children[1:]
+
+    def child(self, move: Move) -> GameNode | None:
+        """Get child reached by `move`, if it was played before."""
+        for child in self.children:
+            if child.move == move:
+                return child
+        return None
+
+    def add_child(self, move: Move, san: str, board: Board) -> GameNode:
+        """Add child reached by `move` written as `san` leading to `board`."""
+        child: GameNode = GameNode(self, move, san, board)
+        self.children.append(child)
+        return child
+
+    def promote(self, child: GameNode) -> None:
+        """Make `child` continue main line, keeping other children."""
+        self.children.remove(child)
+        self.children.insert(0, child)
+
+    def board(self) -> Board:
+        """Materialize position by replaying moves from nearest snapshot."""
+        moves: list[Move] = []
+        node: GameNode = self
+
+        while node._snapshot is None:
+            moves.append(node.move)
+            node = node.parent
+
+        board: Board = node._snapshot.copy(stack=False)
+
+        for move in reversed(moves):
+            board.push(move)
+
+        return board
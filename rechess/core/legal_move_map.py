@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from chess import BB_SQUARES, QUEEN, Board, Move, square, square_file
+
+
+class LegalMoveMap:
+    """Legal moves of position grouped by origin square."""
+
+    def __init__(self, board: Board) -> None:
+        self.targets: dict[Square, Bitboard] = {}
+        self._moves: dict[tuple[Square, Square], Move] = {}
+
+        for move in board.generate_legal_moves():
+            origin_square: Square = move.from_square
+            target_square: Square = move.to_square
+
+            self.targets[origin_square] = (
+                self.targets.get(origin_square, 0) | BB_SQUARES[target_square]
+            )
+
+            if move.promotion not in (None, QUEEN):
+                continue
+
+            self._moves[origin_square, target_square] = move
+
+            if board.is_castling(move) and not board.chess960:
+                rook_file: int = 7 if square_file(target_square) > 4 else 0
+                rook_square: Square = square(rook_file, target_square // 8)
+                self._moves[origin_square, rook_square] = move
+
+    def target_squares(self, origin_square: Square) -> Bitboard:
+        """Get target squares of legal moves from `origin_square`."""
+        return self.targets.get(origin_square, 0)
+
+    def find_move(self, origin_square: Square, target_square: Square) -> Move | None:
+        """Get legal move from `origin_square` to `target_square`, if any."""
+        return self._moves.get((origin_square, target_square))
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import random
+from typing import Literal
+
+from chess import Board, Move
+from chess.polyglot import Entry, MemoryMappedReader
+
+
+class OpeningBook:
+    """Polyglot opening book kept memory-mapped for whole session."""
+
+    def __init__(self, path_to_file: str) -> None:
+        self.path_to_file: str = path_to_file
+
+        self._reader: MemoryMappedReader | None = None
+        self._random: random.Random = random.Random()
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @property
+    def reader(self) -> MemoryMappedReader:
+        """Get book reader, mapping book file on first use."""
+        if self._reader is None:
+            self._reader = MemoryMappedReader(self.path_to_file)
+        return self._reader
+
+    def choose_move(
+        self,
+        board: Board,
+        weighting: Literal["best", "uniform", "weighted"],
+        depth_limit: int,
+        variety: int,
+    ) -> Move | None:
+        """Get book move for `board` picked by `weighting` among varied entries."""
+        if board.ply() >= depth_limit:
+            return None
+
+        entries: list[Entry] = list(self.reader.find_all(board, minimum_weight=0))
+
+        if not entries:
+            self.misses += 1
+            return None
+
+        best_weight: int = max(entry.weight for entry in entries)
+        minimum_weight: float = best_weight * (1 - min(max(variety, 0), 100) / 100)
+        entries = [entry for entry in entries if entry.weight >= minimum_weight]
+
+        if weighting == "best":
+            chosen_entry: Entry = max(entries, key=lambda entry: entry.weight)
+        elif weighting == "uniform" or not any(entry.weight for entry in entries):
+            chosen_entry = self._random.choice(entries)
+        else:
+            chosen_entry = self._random.choices(
+                entries,
+                weights=[entry.weight for entry in entries],
+            )[0]
+
+        self.hits += 1
+        return chosen_entry.move
+
+    def close(self) -> None:
+        """Unmap book file."""
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
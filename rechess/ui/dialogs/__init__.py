@@ -1,5 +1,11 @@
+from .game_list import GameListDialog, GameListModel
 from .promotion import PromotionDialog
 from .settings import SettingsDialog
 
 
-__all__: list[str] = ["PromotionDialog", "SettingsDialog"]
+__all__: list[str] = [
+    "GameListDialog",
+    "GameListModel",
+    "PromotionDialog",
+    "SettingsDialog",
+]
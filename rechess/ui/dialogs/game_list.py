@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Final, Sequence
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    Qt,
+    Slot,
+)
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QDialog,
+    QDialogButtonBox,
+    QHeaderView,
+    QTableView,
+    QVBoxLayout,
+)
+
+
+Cancel: QDialogButtonBox.StandardButton = QDialogButtonBox.StandardButton.Cancel
+Open: QDialogButtonBox.StandardButton = QDialogButtonBox.StandardButton.Open
+
+COLUMN_HEADERS: Final[tuple[str, ...]] = ("White", "Black", "Result", "Date", "Event")
+HEADERS_CACHE_SIZE: Final[int] = 4096
+
+
+class GameListModel(QAbstractTableModel):
+    """Model for games of PGN file, reading headers of visible rows only."""
+
+    def __init__(
+        self,
+        pgn_index: PgnIndex,
+        game_indexes: Sequence[int] | None = None,
+    ) -> None:
+        super().__init__()
+
+        self._pgn_index: PgnIndex = pgn_index
+        self._game_indexes: Sequence[int] = (
+            range(len(pgn_index)) if game_indexes is None else game_indexes
+        )
+        self._headers: Callable[[int], Headers] = lru_cache(HEADERS_CACHE_SIZE)(
+            pgn_index.read_headers
+        )
+
+    def data(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        """Get header value of game at `index` for its column."""
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        headers: Headers = self._headers(self.game_index(index.row()))
+        return headers.get(COLUMN_HEADERS[index.column()], "?")
+
+    def rowCount(
+        self,
+        index: QModelIndex | QPersistentModelIndex = QModelIndex(),
+    ) -> int:
+        """Get number of listed games."""
+        return len(self._game_indexes)
+
+    def columnCount(
+        self,
+        index: QModelIndex | QPersistentModelIndex = QModelIndex(),
+    ) -> int:
+        """Get number of shown headers."""
+        return len(COLUMN_HEADERS)
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        """Get header names for columns and game numbers for rows."""
+        if role == Qt.ItemDataRole.DisplayRole:
+            if orientation == Qt.Orientation.Horizontal:
+                return COLUMN_HEADERS[section]
+
+            if orientation == Qt.Orientation.Vertical:
+                return self.game_index(section) + 1
+
+    def game_index(self, row: int) -> int:
+        """Get index of game listed in `row`."""
+        return self._game_indexes[row]
+
+
+class GameListDialog(QDialog):
+    """Dialog listing games of PGN file for selecting one to open."""
+
+    def __init__(
+        self,
+        pgn_index: PgnIndex,
+        game_indexes: Sequence[int] | None = None,
+    ) -> None:
+        super().__init__()
+
+        self._game_list_model: GameListModel = GameListModel(pgn_index, game_indexes)
+
+        self._button_box: QDialogButtonBox = QDialogButtonBox(Open | Cancel)
+
+        self.create_table_view()
+        self.set_vertical_layout()
+        self.connect_signals_to_slots()
+
+        self.setWindowTitle(f"Games in {Path(pgn_index.path_to_pgn).name}")
+        self.resize(720, 480)
+
+    @property
+    def game_index(self) -> int:
+        """Get index of selected game."""
+        return self._game_list_model.game_index(self._table_view.currentIndex().row())
+
+    def create_table_view(self) -> None:
+        """Create table view with uniform rows over game list model."""
+        self._table_view: QTableView = QTableView()
+        self._table_view.setModel(self._game_list_model)
+
+        self._table_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._table_view.setSelectionBehavior(
+            QAbstractItemView.SelectionBehavior.SelectRows
+        )
+        self._table_view.setSelectionMode(
+            QAbstractItemView.SelectionMode.SingleSelection
+        )
+        self._table_view.verticalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Fixed
+        )
+        self._table_view.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Stretch
+        )
+
+        self._table_view.selectRow(0)
+
+    def set_vertical_layout(self) -> None:
+        """Add table view and buttons to vertical layout."""
+        vertical_layout: QVBoxLayout = QVBoxLayout()
+        vertical_layout.addWidget(self._table_view)
+        vertical_layout.addWidget(self._button_box)
+
+        self.setLayout(vertical_layout)
+
+    def connect_signals_to_slots(self) -> None:
+        """Connect component signals to corresponding slot methods."""
+        self._button_box.accepted.connect(self.accept)
+        self._button_box.rejected.connect(self.reject)
+        self._table_view.doubleClicked.connect(self.on_double_clicked)
+
+    @Slot()
+    def on_double_clicked(self) -> None:
+        """Open game that was double-clicked."""
+        self.accept()
@@ -27,12 +27,15 @@ class SettingsDialog(QDialog):
         super().__init__()
 
         self._initial_settings: dict[str, bool | float | str] = {
+            "analysis_lines": setting_value("analysis", "lines"),
+            "is_analysis_continuous": setting_value("analysis", "is_continuous"),
             "board_size": setting_value("board", "size"),
             "clock_increment": setting_value("clock", "increment"),
             "clock_time": setting_value("clock", "time"),
             "human_name": setting_value("human", "name"),
             "is_engine_ponder_on": setting_value("engine", "is_ponder_on"),
             "is_engine_white": setting_value("engine", "is_white"),
+            "time_management": setting_value("engine", "time_management"),
         }
 
         self._button_box: QDialogButtonBox = QDialogButtonBox(Save | Cancel)
@@ -71,6 +74,32 @@ class SettingsDialog(QDialog):
         self._engine_ponder_option.setText("Ponder")
         self._engine_ponder_option.setChecked(setting_value("engine", "is_ponder_on"))
 
+        self._time_management_option: QComboBox = QComboBox()
+        self._time_management_option.addItem("Clock", "clock")
+        self._time_management_option.addItem("Fixed move time", "movetime")
+        self._time_management_option.addItem("Fixed nodes", "nodes")
+        self._time_management_option.addItem("Fixed depth", "depth")
+        self._time_management_option.setCurrentIndex(
+            self._time_management_option.findData(
+                setting_value("engine", "time_management")
+            )
+        )
+
+        self._continuous_analysis_option: QCheckBox = QCheckBox()
+        self._continuous_analysis_option.setText("Continuous analysis")
+        self._continuous_analysis_option.setChecked(
+            setting_value("analysis", "is_continuous")
+        )
+
+        self._analysis_lines_option: QComboBox = QComboBox()
+        self._analysis_lines_option.addItem("1 analysis line", 1)
+        self._analysis_lines_option.addItem("2 analysis lines", 2)
+        self._analysis_lines_option.addItem("3 analysis lines", 3)
+        self._analysis_lines_option.addItem("4 analysis lines", 4)
+        self._analysis_lines_option.setCurrentIndex(
+            self._analysis_lines_option.findData(setting_value("analysis", "lines"))
+        )
+
         self._clock_time_option: QComboBox = QComboBox()
         self._clock_time_option.addItem("1 minute", 60.0)
         self._clock_time_option.addItem("3 minutes", 180.0)
@@ -111,6 +140,9 @@ class SettingsDialog(QDialog):
         engine_layout.addWidget(self._engine_black_option)
         engine_layout.addWidget(self._engine_white_option)
         engine_layout.addWidget(self._engine_ponder_option)
+        engine_layout.addWidget(self._continuous_analysis_option)
+        engine_layout.addWidget(self._time_management_option)
+        engine_layout.addWidget(self._analysis_lines_option)
         self._engine_group.setLayout(engine_layout)
 
         time_control_layout: QHBoxLayout = QHBoxLayout()
@@ -136,13 +168,16 @@ class SettingsDialog(QDialog):
         self._button_box.accepted.connect(self.accept)
         self._button_box.rejected.connect(self.reject)
 
+        self._analysis_lines_option.currentIndexChanged.connect(self.on_edited)
         self._board_size_option.currentIndexChanged.connect(self.on_edited)
         self._clock_increment_option.currentIndexChanged.connect(self.on_edited)
         self._clock_time_option.currentIndexChanged.connect(self.on_edited)
+        self._continuous_analysis_option.toggled.connect(self.on_edited)
         self._engine_black_option.toggled.connect(self.on_edited)
         self._engine_ponder_option.toggled.connect(self.on_edited)
         self._engine_white_option.toggled.connect(self.on_edited)
         self._human_name_option.textChanged.connect(self.on_edited)
+        self._time_management_option.currentIndexChanged.connect(self.on_edited)
 
     def disable_setting_groups(self) -> None:
         """Disable human name and time control groups."""
@@ -152,12 +187,15 @@ class SettingsDialog(QDialog):
     def is_edited(self) -> bool:
         """Return True if any setting is edited."""
         current_settings: dict[str, bool | float | str] = {
+            "analysis_lines": self._analysis_lines_option.currentData(),
+            "is_analysis_continuous": self._continuous_analysis_option.isChecked(),
             "board_size": self._board_size_option.currentData(),
             "clock_increment": self._clock_increment_option.currentData(),
             "clock_time": self._clock_time_option.currentData(),
             "human_name": self._human_name_option.text().strip() or "Human",
             "is_engine_ponder_on": self._engine_ponder_option.isChecked(),
             "is_engine_white": self._engine_white_option.isChecked(),
+            "time_management": self._time_management_option.currentData(),
         }
         return current_settings != self._initial_settings
 
@@ -184,6 +222,21 @@ class SettingsDialog(QDialog):
             key="is_ponder_on",
             value=self._engine_ponder_option.isChecked(),
         )
+        set_setting_value(
+            section="engine",
+            key="time_management",
+            value=self._time_management_option.currentData(),
+        )
+        set_setting_value(
+            section="analysis",
+            key="lines",
+            value=self._analysis_lines_option.currentData(),
+        )
+        set_setting_value(
+            section="analysis",
+            key="is_continuous",
+            value=self._continuous_analysis_option.isChecked(),
+        )
         set_setting_value(
             section="clock",
             key="time",
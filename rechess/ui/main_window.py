@@ -1,41 +1,63 @@
+import logging
 from enum import StrEnum
 from functools import partial
 from pathlib import Path
-from re import sub
 from typing import Final, Literal
 
 from chess import BLACK, WHITE, Move
 from chess.engine import Score
-from PySide6.QtCore import Qt, QThreadPool, QTimer, Slot
+from PySide6.QtCore import Qt, QTimer, Slot
 from PySide6.QtGui import QCloseEvent, QWheelEvent
 from PySide6.QtWidgets import (
     QDialog,
+    QDockWidget,
     QFileDialog,
     QGridLayout,
     QLabel,
     QMainWindow,
     QMessageBox,
+    QStyle,
     QWidget,
 )
 
-from rechess.core import Engine, Game
+from rechess.core import Engine, EnginePool, Game, GameAnalysis
 from rechess.ui.audio import SoundEffect
-from rechess.ui.dialogs import SettingsDialog
+from rechess.ui.dialogs import GameListDialog, SettingsDialog
 from rechess.ui.table import TableModel, TableView
-from rechess.ui.widgets import DigitalClock, EvaluationBar, FenEditor, SvgBoard
+from rechess.ui.widgets import (
+    AnalysisLinesView,
+    DigitalClock,
+    EvaluationBar,
+    FenEditor,
+    OpeningExplorer,
+    PositionSearchPanel,
+    SvgBoard,
+)
 from rechess.utils import (
+    PgnIndex,
+    PgnLoader,
+    PgnWriter,
+    PositionIndex,
     colorize_icon,
     create_action,
     engine_file_filter,
-    find_opening,
+    find_deepest_opening,
+    opening_continuations,
+    openings_loader,
     set_setting_value,
     setting_value,
+    settings_store,
     show_info,
+    standard_icon,
+    startup_profile,
     style_name,
     svg_icon,
 )
 
 
+logger: logging.Logger = logging.getLogger(__name__)
+
+
 class ClockColor(StrEnum):
     """CSS color style enum for clocks of Black and White players."""
 
@@ -52,7 +74,7 @@ class MainWindow(QMainWindow):
         self._game: Game = Game()
         self._engine: Engine = Engine(self._game)
 
-        self._table_model: TableModel = TableModel(self._game.moves)
+        self._table_model: TableModel = TableModel(self._game.history)
         self._table_view: TableView = TableView(self._table_model)
 
         self._black_clock: DigitalClock = DigitalClock(ClockColor.Black)
@@ -62,10 +84,11 @@ class MainWindow(QMainWindow):
         self._fen_editor: FenEditor = FenEditor(self._game)
         self._sound_effect: SoundEffect = SoundEffect(self._game)
         self._evaluation_bar: EvaluationBar = EvaluationBar()
+        self._opening_explorer: OpeningExplorer = OpeningExplorer()
+        self._position_search_panel: PositionSearchPanel = PositionSearchPanel()
 
-        self._engine_analysis_label: QLabel = QLabel()
-        self._engine_analysis_label.setObjectName("engineAnalysis")
-        self._engine_analysis_label.hide()
+        self._analysis_lines_view: AnalysisLinesView = AnalysisLinesView()
+        self._analysis_lines_view.hide()
 
         self._engine_name_label: QLabel = QLabel()
         self._engine_name_label.setObjectName("engineName")
@@ -86,7 +109,25 @@ class MainWindow(QMainWindow):
         self._scroll_timer.setSingleShot(True)
         self._scroll_timer.setInterval(180)
 
+        self._analysis_timer: QTimer = QTimer(self)
+        self._analysis_timer.setSingleShot(True)
+        self._analysis_timer.setInterval(250)
+        self._analysis_timer.timeout.connect(self.invoke_analysis)
+        self._is_analyzing: bool = False
+
+        self._game_analysis: GameAnalysis | None = None
+
+        self._pgn_loader: PgnLoader = PgnLoader()
+        self._pgn_index: PgnIndex | None = None
+        self._position_index: PositionIndex | None = None
+        self._pgn_writer: PgnWriter = PgnWriter(
+            setting_value("archive", "path"),
+            setting_value("archive", "batch_size"),
+            setting_value("archive", "max_size"),
+        )
+
         self.create_layout()
+        self.create_docks()
         self.create_actions()
         self.create_menubar()
         self.create_toolbar()
@@ -96,10 +137,13 @@ class MainWindow(QMainWindow):
         self.switch_clock_timers()
         self.adjust_toolbar_buttons()
         self.connect_signals_to_slots()
-        self.apply_style(setting_value("ui", "style"))
+
+        with startup_profile().measure("style load"):
+            self.apply_style(setting_value("ui", "style"))
 
         self.align_orientation_to_engine()
-        self.invoke_engine()
+
+        self._engine.load_default()
 
     def create_layout(self) -> None:
         """Create grid layout with fixed widget positions."""
@@ -109,7 +153,7 @@ class MainWindow(QMainWindow):
         self._grid_layout.addWidget(self._board, 1, 2, 4, 1)
         self._grid_layout.addWidget(self._table_view, 1, 3, 4, 1)
         self._grid_layout.addWidget(self._evaluation_bar, 1, 4, 4, 1)
-        self._grid_layout.addWidget(self._engine_analysis_label, 1, 5, 4, 1)
+        self._grid_layout.addWidget(self._analysis_lines_view, 1, 5, 4, 1)
         self._grid_layout.addWidget(self._engine_name_label, 2, 1)
         self._grid_layout.addWidget(self._white_clock, 4, 1)
         self._grid_layout.addWidget(self._human_name_label, 5, 1)
@@ -127,6 +171,27 @@ class MainWindow(QMainWindow):
         central_widget.setLayout(self._grid_layout)
         self.setCentralWidget(central_widget)
 
+    def create_docks(self) -> None:
+        """Create docks for opening explorer and hidden position search."""
+        self._opening_explorer_dock: QDockWidget = QDockWidget("Opening explorer")
+        self._opening_explorer_dock.setObjectName("openingExplorer")
+        self._opening_explorer_dock.setWidget(self._opening_explorer)
+
+        self.addDockWidget(
+            Qt.DockWidgetArea.RightDockWidgetArea,
+            self._opening_explorer_dock,
+        )
+
+        self._position_search_dock: QDockWidget = QDockWidget("Position search")
+        self._position_search_dock.setObjectName("positionSearch")
+        self._position_search_dock.setWidget(self._position_search_panel)
+        self._position_search_dock.hide()
+
+        self.addDockWidget(
+            Qt.DockWidgetArea.RightDockWidgetArea,
+            self._position_search_dock,
+        )
+
     def create_actions(self) -> None:
         """Create menu and toolbar actions."""
         self.about_action = create_action(
@@ -136,6 +201,13 @@ class MainWindow(QMainWindow):
             shortcut="F1",
             status_tip="Shows the About dialog.",
         )
+        self.analyze_game_action = create_action(
+            handler=self.toggle_game_analysis,
+            icon=standard_icon(QStyle.StandardPixmap.SP_FileDialogDetailedView),
+            name="Analyze game",
+            shortcut="F5",
+            status_tip="Evaluates every position of the game and marks mistakes.",
+        )
         self.dark_forest_style_action = create_action(
             handler=partial(self.apply_style, "dark-forest"),
             icon=colorize_icon("#2d382d"),
@@ -199,6 +271,13 @@ class MainWindow(QMainWindow):
             shortcut="Alt+8",
             status_tip="Applies the light ocean style.",
         )
+        self.load_book_action = create_action(
+            handler=self.load_book,
+            icon=standard_icon(QStyle.StandardPixmap.SP_FileIcon),
+            name="Load book...",
+            shortcut="Ctrl+B",
+            status_tip="Shows the file manager to load a Polyglot opening book.",
+        )
         self.load_engine_action = create_action(
             handler=self.load_engine,
             icon=svg_icon("load-engine"),
@@ -206,6 +285,13 @@ class MainWindow(QMainWindow):
             shortcut="Ctrl+L",
             status_tip="Shows the file manager to load an engine.",
         )
+        self.load_tablebase_action = create_action(
+            handler=self.load_tablebase,
+            icon=standard_icon(QStyle.StandardPixmap.SP_DirOpenIcon),
+            name="Load tablebase...",
+            shortcut="Ctrl+T",
+            status_tip="Shows the file manager to load Syzygy endgame tablebase.",
+        )
         self.new_game_action = create_action(
             handler=self.offer_new_game,
             icon=svg_icon("new-game"),
@@ -213,6 +299,13 @@ class MainWindow(QMainWindow):
             shortcut="Ctrl+N",
             status_tip="Shows a dialog offering to start a new game.",
         )
+        self.open_pgn_action = create_action(
+            handler=self.open_pgn,
+            icon=standard_icon(QStyle.StandardPixmap.SP_DialogOpenButton),
+            name="Open PGN...",
+            shortcut="Ctrl+O",
+            status_tip="Shows the file manager to open a game from a PGN file.",
+        )
         self.play_move_now_action = create_action(
             handler=self.play_move_now,
             icon=svg_icon("play-move-now"),
@@ -227,6 +320,13 @@ class MainWindow(QMainWindow):
             shortcut="Ctrl+Q",
             status_tip="Offers to quit the app.",
         )
+        self.save_pgn_action = create_action(
+            handler=self.save_pgn,
+            icon=standard_icon(QStyle.StandardPixmap.SP_DialogSaveButton),
+            name="Save PGN...",
+            shortcut="Ctrl+S",
+            status_tip="Shows the file manager to save the game to a PGN file.",
+        )
         self.settings_action = create_action(
             handler=self.show_settings_dialog,
             icon=svg_icon("settings"),
@@ -267,9 +367,21 @@ class MainWindow(QMainWindow):
         # Help menu
         help_menu = menubar.addMenu("Help")
 
+        # General menu > Open PGN...
+        general_menu.addAction(self.open_pgn_action)
+
+        # General menu > Save PGN...
+        general_menu.addAction(self.save_pgn_action)
+
         # General menu > Load engine...
         general_menu.addAction(self.load_engine_action)
 
+        # General menu > Load book...
+        general_menu.addAction(self.load_book_action)
+
+        # General menu > Load tablebase...
+        general_menu.addAction(self.load_tablebase_action)
+
         # General menu separator
         general_menu.addSeparator()
 
@@ -300,6 +412,9 @@ class MainWindow(QMainWindow):
         # Style menu > Light ocean
         style_menu.addAction(self.light_ocean_style_action)
 
+        # Edit menu > Analyze game
+        edit_menu.addAction(self.analyze_game_action)
+
         # Edit menu > Settings...
         edit_menu.addAction(self.settings_action)
 
@@ -373,13 +488,13 @@ class MainWindow(QMainWindow):
         self._evaluation_bar.setFixedSize(ninth_board_size, board_size)
         self._black_clock.setFixedSize(third_board_size, ninth_board_size)
         self._white_clock.setFixedSize(third_board_size, ninth_board_size)
-        self._engine_analysis_label.setFixedSize(third_board_size, board_size)
+        self._analysis_lines_view.setFixedSize(third_board_size, board_size)
 
     def retain_layout_size(self) -> None:
         """Retain layout size for hidden widgets."""
         size_policy: QSizePolicy = self.sizePolicy()
         size_policy.setRetainSizeWhenHidden(True)
-        self._engine_analysis_label.setSizePolicy(size_policy)
+        self._analysis_lines_view.setSizePolicy(size_policy)
         self._evaluation_bar.setSizePolicy(size_policy)
 
     def switch_clock_timers(self) -> None:
@@ -410,16 +525,35 @@ class MainWindow(QMainWindow):
     def connect_signals_to_slots(self) -> None:
         """Connect component signals to corresponding slot methods."""
         self._black_clock.time_expired.connect(self.on_black_time_expired)
-        self._engine.best_move_analyzed.connect(self.on_best_move_analyzed)
+        self._board.first_painted.connect(self.on_board_first_painted)
+        self._engine.book_move_recorded.connect(self.on_book_move_recorded)
+        self._engine.lines_analyzed.connect(self.on_lines_analyzed)
         self._engine.load_failed.connect(self.on_load_failed)
-        self._engine.move_played.connect(self.on_move_played)
+        self._engine.loaded.connect(self.on_engine_loaded)
+        self._engine.move_played.connect(self.on_engine_move_played)
         self._engine.score_analyzed.connect(self.on_score_analyzed)
-        self._engine.variation_analyzed.connect(self.on_variation_analyzed)
+        self._engine.tablebase_move_recorded.connect(self.on_tablebase_move_recorded)
+        self._engine.tablebase_probed.connect(self.on_tablebase_probed)
+        self._engine.think_time_recorded.connect(self.on_think_time_recorded)
         self._fen_editor.fen_validated.connect(self.on_fen_validated)
         self._game.move_played.connect(self.on_move_played)
         self._game.sound_effect_played.connect(self.on_sound_effect_played)
+        self._pgn_loader.failed.connect(self.on_load_failed)
+        self._pgn_loader.positions_progress_changed.connect(
+            self.on_positions_progress_changed
+        )
+        self._pgn_loader.positions_ready.connect(self.on_positions_ready)
+        self._pgn_loader.progress_changed.connect(self.on_pgn_progress_changed)
+        self._pgn_loader.ready.connect(self.on_pgn_ready)
+        self._pgn_writer.failed.connect(self.on_save_failed)
+        self._pgn_writer.written.connect(self.on_pgn_written)
+        self._position_search_panel.games_requested.connect(self.on_games_requested)
         self._table_view.item_selected.connect(self.on_item_selected)
         self._white_clock.time_expired.connect(self.on_white_time_expired)
+        openings_loader().failed.connect(self.on_load_failed)
+        openings_loader().ready.connect(self.on_openings_ready)
+        openings_loader().tree_ready.connect(self.on_opening_tree_ready)
+        settings_store().value_changed.connect(self.on_setting_changed)
 
     def apply_style(self, file_name: str) -> None:
         """Apply QSS style at `file_name` and show its name."""
@@ -436,13 +570,25 @@ class MainWindow(QMainWindow):
 
     def invoke_engine(self, by_force: bool = False) -> None:
         """Invoke engine when on turn or when `by_force` is True."""
+        if not self._engine.is_loaded:
+            return
+
         if self.should_invoke_engine() or by_force:
-            QThreadPool.globalInstance().start(self._engine.play_move)
+            self._engine.play_move(
+                white_clock=self._white_clock.time,
+                black_clock=self._black_clock.time,
+                white_inc=self._white_clock.increment,
+                black_inc=self._black_clock.increment,
+            )
             self._game_notifications_label.setText("Thinking...")
 
     def invoke_analysis(self) -> None:
         """Invoke engine to start analysis."""
-        QThreadPool.globalInstance().start(self._engine.start_analysis)
+        if not self._engine.is_loaded:
+            return
+
+        self._analysis_lines_view.clear()
+        self._engine.start_analysis()
         self._game_notifications_label.setText("Analyzing...")
 
     def quit(self) -> None:
@@ -493,7 +639,6 @@ class MainWindow(QMainWindow):
         if not self._game.is_in_progress():
             self._black_clock.reset()
             self._white_clock.reset()
-            self._human_name_label.setText(setting_value("human", "name"))
 
         self.apply_widget_sizes()
         self.align_orientation_to_engine()
@@ -511,15 +656,102 @@ class MainWindow(QMainWindow):
         if path_to_file:
             self.start_new_engine(path_to_file)
 
+    def load_book(self) -> None:
+        """Show file manager to load Polyglot opening book."""
+        path_to_file, _ = QFileDialog.getOpenFileName(
+            self,
+            "File Manager",
+            Path.home().as_posix(),
+            "Polyglot book (*.bin)",
+        )
+
+        if path_to_file:
+            self._engine.load_book(path_to_file)
+            set_setting_value("book", "path", path_to_file)
+            self._game_notifications_label.setText(f"Loaded {Path(path_to_file).name}")
+
+    def load_tablebase(self) -> None:
+        """Show file manager to load Syzygy endgame tablebase directory."""
+        path_to_directory: str = QFileDialog.getExistingDirectory(
+            self,
+            "File Manager",
+            Path.home().as_posix(),
+        )
+
+        if path_to_directory:
+            self._engine.load_tablebase(path_to_directory)
+            set_setting_value("tablebase", "path", path_to_directory)
+            self._game_notifications_label.setText(
+                f"Loaded {Path(path_to_directory).name}"
+            )
+
     def start_new_engine(self, path_to_file: str) -> None:
         """Start new engine from file at `path_to_file`."""
         self.stop_analysis()
 
         self._engine.load_from_file_at(path_to_file)
-        self._engine_name_label.setText(self._engine.name)
-        self._engine_name_label.setToolTip(self._engine.name)
 
-        self.invoke_engine()
+    def open_pgn(self) -> None:
+        """Show file manager to open PGN file."""
+        path_to_file, _ = QFileDialog.getOpenFileName(
+            self,
+            "File Manager",
+            Path.home().as_posix(),
+            "PGN file (*.pgn)",
+        )
+
+        if path_to_file:
+            self._game_notifications_label.setText("Indexing games...")
+            self._pgn_loader.start(path_to_file)
+
+    def show_game_list_dialog(self, game_indexes: list[int] | None = None) -> None:
+        """Show dialog to select game from indexed PGN file."""
+        game_list_dialog: GameListDialog = GameListDialog(
+            self._pgn_index,
+            game_indexes,
+        )
+
+        if game_list_dialog.exec() == QDialog.DialogCode.Accepted:
+            self.open_pgn_game(game_list_dialog.game_index)
+
+    def open_pgn_game(self, game_index: int) -> None:
+        """Replace current game with game at `game_index` in PGN file."""
+        pgn_game: PgnGame | None = self._pgn_index.read_game(game_index)
+
+        if pgn_game is None:
+            return
+
+        self._black_clock.stop_timer()
+        self._white_clock.stop_timer()
+
+        self._engine.cancel_play()
+        self.cancel_game_analysis()
+        self._game.load_moves(pgn_game.board(), pgn_game.mainline_moves())
+        self._table_model.reset()
+        self._openings_label.clear()
+        self._board.enable_interaction()
+
+        if len(self._game.history):
+            self._table_view.select_last_item()
+        else:
+            self.on_item_selected(-1)
+
+    def save_pgn(self) -> None:
+        """Show file manager to save game to PGN file."""
+        path_to_file, _ = QFileDialog.getSaveFileName(
+            self,
+            "File Manager",
+            Path.home().as_posix(),
+            "PGN file (*.pgn)",
+        )
+
+        if path_to_file:
+            self._pgn_writer.write(path_to_file, self._game.to_pgn(self._engine.name))
+
+    def archive_game(self) -> None:
+        """Queue finished game for PGN archive if archiving is enabled."""
+        if setting_value("archive", "is_enabled") and self._game.is_in_progress():
+            self._pgn_writer.archive(self._game.to_pgn(self._engine.name))
 
     def show_about(self) -> None:
         """Show About dialog."""
@@ -558,17 +790,19 @@ class MainWindow(QMainWindow):
             self._grid_layout.addWidget(self._human_name_label, 5, 1)
 
     def show_analysis_ui(self) -> None:
-        """Show evaluation bar and engine analysis label."""
+        """Show evaluation bar and analysis lines view."""
         self._evaluation_bar.show()
-        self._engine_analysis_label.show()
+        self._analysis_lines_view.show()
 
     def hide_analysis_ui(self) -> None:
-        """Hide engine analysis label and evaluation bar."""
-        self._engine_analysis_label.hide()
+        """Hide analysis lines view and evaluation bar."""
+        self._analysis_lines_view.hide()
         self._evaluation_bar.hide()
 
     def start_analysis(self) -> None:
         """Start analyzing current position."""
+        self._is_analyzing = True
+
         self.invoke_analysis()
         self.show_analysis_ui()
 
@@ -580,6 +814,8 @@ class MainWindow(QMainWindow):
 
     def stop_analysis(self) -> None:
         """Stop analyzing current position."""
+        self._is_analyzing = False
+        self._analysis_timer.stop()
         self._engine.stop_analysis()
 
         self._game_notifications_label.clear()
@@ -588,6 +824,60 @@ class MainWindow(QMainWindow):
         self.switch_clock_timers()
         self.hide_analysis_ui()
 
+    def follow_board_with_analysis(self) -> None:
+        """Stop analysis of left position and restart it once scrolling settles."""
+        self._engine.stop_analysis()
+        self._analysis_lines_view.clear()
+        self._analysis_timer.start()
+
+    def toggle_game_analysis(self) -> None:
+        """Start analyzing whole game or cancel running game analysis."""
+        if self._game_analysis is not None and self._game_analysis.is_running:
+            self._game_analysis.cancel()
+            return
+
+        if not self._engine.is_loaded or not self._game.is_in_progress():
+            return
+
+        is_engine_busy: bool = self._is_analyzing or setting_value(
+            "engine", "is_ponder_on"
+        )
+        engine_pool: EnginePool = EnginePool.of_same_engine(
+            self._engine.path_to_file,
+            setting_value("analysis", "workers"),
+            reserved_threads=self._engine.threads if is_engine_busy else 0,
+        )
+        engine_pool.start_failed.connect(self.on_load_failed)
+
+        self._game_analysis = GameAnalysis(
+            engine_pool,
+            setting_value("analysis", "time_per_position"),
+        )
+        self._game_analysis.finished.connect(self.on_game_analysis_finished)
+        self._game_analysis.move_judged.connect(self.on_move_judged)
+        self._game_analysis.position_analyzed.connect(self.on_position_analyzed)
+        self._game_analysis.progress_changed.connect(
+            self.on_game_analysis_progress_changed
+        )
+
+        self._game_analysis.start(
+            self._game.history.root,
+            self._game.history.positions(),
+            self._game.moves,
+        )
+        self.analyze_game_action.setText("Cancel game analysis")
+
+    def cancel_game_analysis(self, wait: bool = False) -> None:
+        """Cancel game analysis and ignore results it has yet to deliver."""
+        if self._game_analysis is not None:
+            self._game_analysis.cancel(wait)
+            self._game_analysis = None
+            self.analyze_game_action.setText("Analyze game")
+
+    def is_current_game_analysis(self, run_id: int) -> bool:
+        """Return True if `run_id` belongs to game analysis still relevant."""
+        return self._game_analysis is not None and self._game_analysis.run_id == run_id
+
     def show_fen(self) -> None:
         """Show FEN in editor."""
         self._fen_editor.clearFocus()
@@ -595,13 +885,36 @@ class MainWindow(QMainWindow):
         self._fen_editor.setText(self._game.fen)
 
     def show_opening(self) -> None:
-        """Show ECO code and opening name."""
-        openings_data: list[str] | None = find_opening(self._game.fen)
+        """Show deepest known opening reached so far once openings are loaded."""
+        openings_data: list[str] | None = find_deepest_opening(
+            self._game.history.keys_until(self._game.move_index)
+        )
 
         if openings_data is not None:
             eco_code, opening_name = openings_data
             self._openings_label.setText(f"{eco_code}: {opening_name}")
 
+        self.show_continuations()
+
+    def show_continuations(self) -> None:
+        """Show book moves from current position once opening tree is loaded."""
+        continuations: list[BookContinuation] | None = opening_continuations(
+            self._game.board
+        )
+
+        if continuations is not None:
+            self._opening_explorer.show_continuations(self._game.board, continuations)
+
+    def show_move_statistics(self) -> None:
+        """Show moves played from current position in indexed games."""
+        if self._position_index is None:
+            return
+
+        self._position_search_panel.show_statistics(
+            self._game.board,
+            self._position_index.statistics(self._game.board),
+        )
+
     def refresh_ui(self) -> None:
         """Refresh current state of UI."""
         self._game.is_history = False
@@ -611,6 +924,7 @@ class MainWindow(QMainWindow):
 
         self.show_fen()
         self.show_opening()
+        self.show_move_statistics()
         self.stop_analysis()
         self.invoke_engine()
 
@@ -618,6 +932,14 @@ class MainWindow(QMainWindow):
             self._black_clock.stop_timer()
             self._white_clock.stop_timer()
             self._game_notifications_label.setText(self._game.result)
+            self.archive_game()
+
+    def record_clock_time(self) -> None:
+        """Record remaining time of player who made last move."""
+        last_clock: DigitalClock = (
+            self._black_clock if self._game.is_white_on_turn() else self._white_clock
+        )
+        self._game.set_clock_time(len(self._game.history) - 1, last_clock.time)
 
     def offer_new_game(self) -> None:
         """Show dialog offering to start new game."""
@@ -637,12 +959,16 @@ class MainWindow(QMainWindow):
         self._black_clock.reset()
         self._white_clock.reset()
 
+        self._engine.cancel_play()
+        self.cancel_game_analysis()
+        self._game.prepare_new_game()
         self._table_model.reset()
         self._openings_label.clear()
-        self._game.prepare_new_game()
         self._board.enable_interaction()
 
         self.show_fen()
+        self.show_continuations()
+        self.show_move_statistics()
         self.stop_analysis()
         self.align_orientation_to_engine()
         self.invoke_engine()
@@ -661,6 +987,8 @@ class MainWindow(QMainWindow):
         )
 
         if answer == QMessageBox.StandardButton.Yes:
+            self.cancel_game_analysis(wait=True)
+            self._pgn_writer.flush(wait=True)
             self._engine.quit()
             event.accept()
         else:
@@ -678,10 +1006,25 @@ class MainWindow(QMainWindow):
 
             self._scroll_timer.start()
 
-    @Slot(Move)
-    def on_best_move_analyzed(self, best_move: Move) -> None:
-        """Show `best_move` as arrow on board."""
-        self._game.set_arrow(best_move)
+    @Slot()
+    def on_board_first_painted(self) -> None:
+        """Record board's first paint as moment of being interactive."""
+        profile: StartupProfile = startup_profile()
+        time_to_interactive: float = profile.elapsed()
+
+        logger.info("Time to interactive: %.1f ms", time_to_interactive * 1000)
+        profile.record("first board paint", time_to_interactive, 0.0)
+
+    @Slot(int)
+    def on_book_move_recorded(self, book_moves: int) -> None:
+        """Show that engine played instantly from opening book."""
+        if self._game.is_over():
+            return
+
+        self._game_notifications_label.setText("Book move")
+        self._game_notifications_label.setToolTip(
+            f"Engine played {book_moves} moves from its opening book"
+        )
 
     @Slot()
     def on_black_time_expired(self) -> None:
@@ -693,6 +1036,7 @@ class MainWindow(QMainWindow):
 
         self._game.declare_time_loss_for(BLACK)
         self._game_notifications_label.setText(self._game.result)
+        self.archive_game()
 
         self._board.disable_interaction()
         self._board.update()
@@ -709,6 +1053,7 @@ class MainWindow(QMainWindow):
 
         self._game.declare_time_loss_for(WHITE)
         self._game_notifications_label.setText(self._game.result)
+        self.archive_game()
 
         self._board.disable_interaction()
         self._board.update()
@@ -724,6 +1069,7 @@ class MainWindow(QMainWindow):
     def on_item_selected(self, item_index: int) -> None:
         """Show move based on `item_index`."""
         self._game.is_history = True
+        self._engine.cancel_play()
 
         if item_index < 0:
             self._openings_label.clear()
@@ -737,34 +1083,225 @@ class MainWindow(QMainWindow):
 
         self.show_fen()
         self.show_opening()
-        self.stop_analysis()
+        self.show_move_statistics()
+
+        if self._is_analyzing and setting_value("analysis", "is_continuous"):
+            self.follow_board_with_analysis()
+        else:
+            self.stop_analysis()
 
         if self._game.is_over():
             self._game_notifications_label.setText(self._game.result)
 
+    @Slot(str)
+    def on_engine_loaded(self, engine_name: str) -> None:
+        """Show `engine_name` and invoke engine if it is on turn."""
+        self._engine_name_label.setText(engine_name)
+        self._engine_name_label.setToolTip(engine_name)
+
+        self.invoke_engine()
+
+    @Slot(int, Move)
+    def on_engine_move_played(self, session: int, move: Move) -> None:
+        """Play `move` if engine found it for position still on board."""
+        if session == self._engine.play_session:
+            self.on_move_played(move)
+
+    @Slot(int, bool)
+    def on_game_analysis_finished(self, run_id: int, is_complete: bool) -> None:
+        """Report whether game analysis completed or was cancelled."""
+        if not self.is_current_game_analysis(run_id):
+            return
+
+        self.analyze_game_action.setText("Analyze game")
+        self._game_notifications_label.setText(
+            "Game analyzed" if is_complete else "Game analysis stopped"
+        )
+
+    @Slot(int, int, int)
+    def on_game_analysis_progress_changed(
+        self,
+        run_id: int,
+        completed: int,
+        total: int,
+    ) -> None:
+        """Show how many of `total` positions are `completed`."""
+        if not self.is_current_game_analysis(run_id):
+            return
+
+        self._game_notifications_label.setText(f"Analyzed {completed}/{total}")
+
+    @Slot(int, int, str, int)
+    def on_move_judged(
+        self,
+        run_id: int,
+        move_index: int,
+        symbol: str,
+        centipawn_loss: int,
+    ) -> None:
+        """Annotate move at `move_index` with `symbol` in move table."""
+        if not self.is_current_game_analysis(run_id):
+            return
+
+        self._table_model.annotate(
+            move_index,
+            symbol,
+            f"Centipawn loss: {centipawn_loss}",
+        )
+
+    @Slot(int, int, Score)
+    def on_position_analyzed(
+        self,
+        run_id: int,
+        position_index: int,
+        score: Score,
+    ) -> None:
+        """Store `score` of position after move at `position_index`."""
+        if self.is_current_game_analysis(run_id) and position_index >= 0:
+            self._game.set_evaluation(position_index, score)
+
     @Slot(str)
     def on_load_failed(self, engine_message: str) -> None:
         """Show `engine_message` after engine load attempt failed."""
         show_info(self, engine_message)
 
+    @Slot(int)
+    def on_pgn_progress_changed(self, percentage: int) -> None:
+        """Show `percentage` of PGN file indexed so far."""
+        self._game_notifications_label.setText(f"Indexed {percentage}%")
+
+    @Slot(PgnIndex)
+    def on_pgn_ready(self, pgn_index: PgnIndex) -> None:
+        """Show games of `pgn_index` after PGN file has been indexed."""
+        if self._pgn_index is not None:
+            self._pgn_index.close()
+
+        if self._position_index is not None:
+            self._position_index.close()
+            self._position_index = None
+            self._position_search_dock.hide()
+
+        self._pgn_index = pgn_index
+        self._game_notifications_label.setText(f"{len(pgn_index)} games")
+
+        self.show_game_list_dialog()
+
+    @Slot(str)
+    def on_pgn_written(self, path_to_file: str) -> None:
+        """Show name of PGN file that game was written to."""
+        self._game_notifications_label.setText(f"Saved {Path(path_to_file).name}")
+
+    @Slot(str)
+    def on_save_failed(self, error_message: str) -> None:
+        """Show `error_message` after game could not be saved."""
+        show_info(self, f"Game could not be saved: {error_message}")
+
+    @Slot(int)
+    def on_positions_progress_changed(self, percentage: int) -> None:
+        """Show `percentage` of games whose positions are indexed so far."""
+        self._game_notifications_label.setText(f"Indexed positions {percentage}%")
+
+    @Slot(PositionIndex)
+    def on_positions_ready(self, position_index: PositionIndex) -> None:
+        """Show position search after positions of PGN file are indexed."""
+        if (
+            self._pgn_index is None
+            or self._pgn_index.path_to_pgn != position_index.path_to_pgn
+        ):
+            position_index.close()
+            return
+
+        self._position_index = position_index
+        self._game_notifications_label.setText(f"{len(position_index)} positions")
+        self._position_search_dock.show()
+
+        self.show_move_statistics()
+
+    @Slot()
+    def on_games_requested(self) -> None:
+        """Show games of PGN file reaching current position."""
+        if self._position_index is not None:
+            self.show_game_list_dialog(self._position_index.find(self._game.board))
+
     @Slot(Move)
     def on_move_played(self, move: Move) -> None:
-        """Play `move` and refresh UI."""
+        """Play `move` if legal and refresh UI."""
+        if not self._game.board.is_legal(move):
+            return
+
+        self.cancel_game_analysis()
+        self._table_model.discard_annotations_from(self._game.move_index + 1)
+
         self._game.push(move)
+        self.record_clock_time()
         self.refresh_ui()
 
+    @Slot()
+    def on_openings_ready(self) -> None:
+        """Show opening of current position after openings are loaded."""
+        self.show_opening()
+
+    @Slot()
+    def on_opening_tree_ready(self) -> None:
+        """Show book moves from current position after opening tree is loaded."""
+        self.show_continuations()
+
+    @Slot(str, str, object)
+    def on_setting_changed(self, section: str, key: str, value: object) -> None:
+        """Reflect changed `value` of `key` from `section` in UI."""
+        if (section, key) == ("human", "name"):
+            self._human_name_label.setText(value)
+
     @Slot(Move)
     def on_sound_effect_played(self, move: Move) -> None:
         """Play sound effect for received `move`."""
         self._sound_effect.play(move)
 
-    @Slot(str)
-    def on_variation_analyzed(self, variation: str) -> None:
-        """Show formatted `variation` based on engine analysis."""
-        formatted_variation: str = sub(r"(?=(\b\d+\.+))", "\n", variation).strip()
-        self._engine_analysis_label.setText(formatted_variation)
+    @Slot(float, float)
+    def on_think_time_recorded(self, think_time: float, clock_time: float) -> None:
+        """Show `think_time` the engine spent out of its `clock_time`."""
+        if self._game.is_over():
+            return
+
+        self._game_notifications_label.setText(f"Thought {think_time:.2f} s")
+        self._game_notifications_label.setToolTip(
+            f"Engine thought {think_time:.2f} s "
+            f"of {clock_time:.2f} s available on its clock"
+        )
+
+    @Slot(int)
+    def on_tablebase_move_recorded(self, tablebase_moves: int) -> None:
+        """Show that engine played instantly from endgame tablebase."""
+        if self._game.is_over():
+            return
 
-    @Slot(Score)
-    def on_score_analyzed(self, score: Score) -> None:
+        self._game_notifications_label.setText("Tablebase move")
+        self._game_notifications_label.setToolTip(
+            f"Engine played {tablebase_moves} moves from endgame tablebase"
+        )
+
+    @Slot(int, int, int)
+    def on_tablebase_probed(self, session: int, wdl: int, dtz: int) -> None:
+        """Show exact tablebase result based on `wdl` and `dtz`."""
+        if session != self._engine.analysis_session:
+            return
+
+        self._evaluation_bar.show_tablebase_result(wdl, dtz)
+
+    @Slot(int, list)
+    def on_lines_analyzed(self, session: int, lines: list) -> None:
+        """Show changed analysis `lines` and arrows of all shown lines."""
+        if session != self._engine.analysis_session:
+            return
+
+        self._analysis_lines_view.update_lines(lines)
+        self._game.set_arrows(self._analysis_lines_view.best_moves())
+        self._board.update()
+
+    @Slot(int, Score)
+    def on_score_analyzed(self, session: int, score: Score) -> None:
         """Show position evaluation based on `score`."""
+        if session != self._engine.analysis_session:
+            return
+
         self._evaluation_bar.animate(score)
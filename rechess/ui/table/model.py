@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from typing import Any
 
 from PySide6.QtCore import (
@@ -11,10 +13,12 @@ from PySide6.QtCore import (
 class TableModel(QAbstractTableModel):
     """Model for move history in SAN format."""
 
-    def __init__(self, moves: list[str]) -> None:
+    def __init__(self, history: GameHistory) -> None:
         super().__init__()
 
-        self._moves: list[str] = moves
+        self._history: GameHistory = history
+        self._annotations: dict[int, tuple[str, str]] = {}
+        self._item_count: int = len(history)
 
     def data(
         self,
@@ -22,11 +26,18 @@ class TableModel(QAbstractTableModel):
         role: int = Qt.ItemDataRole.DisplayRole,
     ) -> Any:
         """Get SAN representation for move at `index`."""
+        move_index: int = 2 * index.row() + index.column()
+
+        if not 0 <= move_index < self._item_count:
+            return None
+
         if role == Qt.ItemDataRole.DisplayRole:
-            move_index: int = 2 * index.row() + index.column()
+            symbol, _ = self._annotations.get(move_index, ("", ""))
+            return self._history.san_at(move_index) + symbol
 
-            if 0 <= move_index < len(self._moves):
-                return self._moves[move_index]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            _, comment = self._annotations.get(move_index, ("", ""))
+            return comment or None
 
     def flags(self, index: QModelIndex | QPersistentModelIndex) -> Qt.ItemFlag:
         """Get interaction state based on data existence at `index`."""
@@ -40,7 +51,10 @@ class TableModel(QAbstractTableModel):
         index: QModelIndex | QPersistentModelIndex = QModelIndex(),
     ) -> int:
         """Get calculated row count needed for White/Black moves."""
-        all_moves: int = len(self._moves) + 1
+        if index.isValid():
+            return 0
+
+        all_moves: int = self._item_count + 1
         return all_moves // 2
 
     def columnCount(
@@ -48,7 +62,7 @@ class TableModel(QAbstractTableModel):
         index: QModelIndex | QPersistentModelIndex = QModelIndex(),
     ) -> int:
         """Get fixed two column count needed for White/Black moves."""
-        return 2
+        return 0 if index.isValid() else 2
 
     def headerData(
         self,
@@ -65,11 +79,71 @@ class TableModel(QAbstractTableModel):
                 return section + 1
 
     def reset(self) -> None:
-        """Clear stored move history data from model."""
+        """Clear annotations and reflect emptied move history."""
         self.beginResetModel()
-        self._moves.clear()
+        self._annotations.clear()
+        self._item_count = len(self._history)
+        self._history.take_changed_index()
         self.endResetModel()
 
+    def model_index(self, move_index: int) -> QModelIndex:
+        """Get model index of cell showing move at `move_index`."""
+        return self.index(move_index // 2, move_index % 2)
+
+    def annotate(self, move_index: int, symbol: str, comment: str) -> None:
+        """Annotate move at `move_index` with `symbol` and `comment`."""
+        self._annotations[move_index] = (symbol, comment)
+
+        model_index: QModelIndex = self.model_index(move_index)
+        self.dataChanged.emit(model_index, model_index)
+
+    def discard_annotations_from(self, move_index: int) -> None:
+        """Discard annotations of moves from `move_index` onward."""
+        for annotated_index in [
+            annotated_index
+            for annotated_index in self._annotations
+            if annotated_index >= move_index
+        ]:
+            del self._annotations[annotated_index]
+
     def refresh_view(self) -> None:
-        """Refresh view to reflect model changes."""
-        self.layoutChanged.emit()
+        """Notify view of inserted, removed and changed history items."""
+        changed_index: int | None = self._history.take_changed_index()
+
+        if changed_index is None:
+            return
+
+        old_item_count: int = self._item_count
+        new_item_count: int = len(self._history)
+        old_row_count: int = self.rowCount()
+        new_row_count: int = (new_item_count + 1) // 2
+
+        if new_row_count > old_row_count:
+            self.beginInsertRows(QModelIndex(), old_row_count, new_row_count - 1)
+            self._item_count = new_item_count
+            self.endInsertRows()
+        elif new_row_count < old_row_count:
+            self.beginRemoveRows(QModelIndex(), new_row_count, old_row_count - 1)
+            self._item_count = new_item_count
+            self.endRemoveRows()
+        else:
+            self._item_count = new_item_count
+
+        kept_item_count: int = 2 * min(old_row_count, new_row_count)
+        last_changed_index: int = (
+            min(max(old_item_count, new_item_count), kept_item_count) - 1
+        )
+
+        if changed_index > last_changed_index:
+            return
+
+        if changed_index // 2 == last_changed_index // 2:
+            self.dataChanged.emit(
+                self.model_index(changed_index),
+                self.model_index(last_changed_index),
+            )
+        else:
+            self.dataChanged.emit(
+                self.index(changed_index // 2, 0),
+                self.index(last_changed_index // 2, 1),
+            )
@@ -30,7 +30,7 @@ class TableView(QTableView):
         self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
 
-        self.model().layoutChanged.connect(self.scrollToBottom)
+        self.model().rowsInserted.connect(self.scrollToBottom)
         self.selectionModel().currentChanged.connect(self.on_current_changed)
 
     @property
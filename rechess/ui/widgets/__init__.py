@@ -1,7 +1,21 @@
+from .analysis_lines import AnalysisLinesModel, AnalysisLinesView
 from .board import SvgBoard
 from .clock import DigitalClock
 from .evaluation import EvaluationBar
 from .fen import FenEditor
+from .opening_explorer import OpeningExplorer, OpeningExplorerModel
+from .position_search import MoveStatisticsModel, PositionSearchPanel
 
 
-__all__: list[str] = ["DigitalClock", "EvaluationBar", "FenEditor", "SvgBoard"]
+__all__: list[str] = [
+    "AnalysisLinesModel",
+    "AnalysisLinesView",
+    "DigitalClock",
+    "EvaluationBar",
+    "FenEditor",
+    "MoveStatisticsModel",
+    "OpeningExplorer",
+    "OpeningExplorerModel",
+    "PositionSearchPanel",
+    "SvgBoard",
+]
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import Any
+
+from chess import Move
+from chess.engine import Score
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    Qt,
+)
+from PySide6.QtWidgets import QAbstractItemView, QListView
+
+
+def score_text(score: Score) -> str:
+    """Get `score` from White's perspective as pawns or moves to mate."""
+    if score.is_mate():
+        return f"M{score.mate()}"
+    return f"{(score.score() or 0) / 100:+.2f}"
+
+
+class AnalysisLinesModel(QAbstractListModel):
+    """Model for MultiPV lines updating only rows whose line changed."""
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._lines: list[VariationLine | None] = []
+
+    def data(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        """Get score, depth and variation of line at `index`."""
+        if not index.isValid():
+            return None
+
+        line: VariationLine | None = self._lines[index.row()]
+
+        if line is None:
+            return None
+
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return f"{score_text(line.score)}  depth {line.depth}\n{line.variation}"
+
+    def rowCount(
+        self,
+        index: QModelIndex | QPersistentModelIndex = QModelIndex(),
+    ) -> int:
+        """Get number of MultiPV lines."""
+        return len(self._lines)
+
+    def update_lines(self, lines: list[VariationLine]) -> None:
+        """Replace rows of changed `lines`, appending rows for new ones."""
+        for line in sorted(lines, key=lambda line: line.multipv):
+            row: int = line.multipv - 1
+
+            if row >= len(self._lines):
+                self.beginInsertRows(QModelIndex(), len(self._lines), row)
+                self._lines.extend([None] * (row + 1 - len(self._lines)))
+                self._lines[row] = line
+                self.endInsertRows()
+            elif self._lines[row] != line:
+                self._lines[row] = line
+                self.dataChanged.emit(self.index(row), self.index(row))
+
+    def best_moves(self) -> list[Move]:
+        """Get first move of each line ordered by MultiPV slot."""
+        return [line.move for line in self._lines if line is not None]
+
+    def clear(self) -> None:
+        """Remove all lines."""
+        self.beginResetModel()
+        self._lines = []
+        self.endResetModel()
+
+
+class AnalysisLinesView(QListView):
+    """View for MultiPV lines with score and depth above each variation."""
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._analysis_lines_model: AnalysisLinesModel = AnalysisLinesModel()
+        self.setModel(self._analysis_lines_model)
+
+        self.setObjectName("engineAnalysis")
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setWordWrap(True)
+
+    def update_lines(self, lines: list[VariationLine]) -> None:
+        """Show changed `lines` in their rows."""
+        self._analysis_lines_model.update_lines(lines)
+
+    def best_moves(self) -> list[Move]:
+        """Get first move of each shown line."""
+        return self._analysis_lines_model.best_moves()
+
+    def clear(self) -> None:
+        """Remove all shown lines."""
+        self._analysis_lines_model.clear()
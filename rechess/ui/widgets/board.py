@@ -1,42 +1,72 @@
 from __future__ import annotations
 
-from functools import lru_cache
-from typing import Final, Literal, NamedTuple
+from collections import deque
+from functools import partial
+from time import perf_counter
+from typing import ClassVar, Final, Literal, NamedTuple
 
-from chess import Move, Piece, square, svg
+from chess import BB_SQUARES, BaseBoard, Move, Piece, SquareSet, square, svg
+from chess.polyglot import POLYGLOT_RANDOM_ARRAY, ZobristHasher
 from PySide6.QtCore import (
     Property,
     QEasingCurve,
     QPointF,
     QPropertyAnimation,
     QRectF,
+    QSize,
     Qt,
+    Signal,
     Slot,
 )
-from PySide6.QtGui import QColor, QPainter
+from PySide6.QtGui import QColor, QPainter, QPixmap
 from PySide6.QtSvg import QSvgRenderer
 from PySide6.QtSvgWidgets import QSvgWidget
 
-from rechess.utils import setting_value
+from rechess.utils import CacheInfo, RenderCache, setting_value
 
 
 svg.XX = "<circle id='xx' r='4.5' cx='22.5' cy='22.5' stroke='#303030' fill='#e5e5e5'/>"
 
 
-class BoardCache(NamedTuple):
-    """Type annotations for board cache."""
+FRAME_TIME_SAMPLES: Final[int] = 120
+LAYER_CACHE_BUDGET: Final[int] = 32 * 1024 * 1024
+PIECE_CACHE_BUDGET: Final[int] = 2 * 1024 * 1024
+PIECE_HASHER: Final[ZobristHasher] = ZobristHasher(POLYGLOT_RANDOM_ARRAY)
+TRANSPARENT_COLORS: Final[dict[str, str]] = {
+    "coord": "#00000000",
+    "inner border": "#00000000",
+    "margin": "#00000000",
+    "outer border": "#00000000",
+    "square dark": "#00000000",
+    "square dark lastmove": "#00000000",
+    "square light": "#00000000",
+    "square light lastmove": "#00000000",
+}
 
-    fen: str
-    dragging: bool
+
+class BoardLayer(NamedTuple):
+    """Type annotations for board layer."""
+
+    size: int
+    device_pixel_ratio: float
     orientation: bool
-    check: Square | None
-    square: Square | None
-    arrow: tuple[tuple[Square, Square]]
+    is_static: bool = False
+    position_key: int = 0
+    check: Square | None = None
+    squares: Bitboard = 0
+    arrows: tuple[tuple[Square, Square, str], ...] = ()
+
+
+def pixmap_size_in_bytes(pixmap: QPixmap) -> int:
+    """Get memory taken by pixels of `pixmap`."""
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
 
 
 class SvgBoard(QSvgWidget):
     """Piece drag-and-drop functionality and animation on SVG board."""
 
+    first_painted: ClassVar[Signal] = Signal()
+
     coord: Property = Property(
         QColor,
         lambda self: self._coord,
@@ -89,6 +119,7 @@ class SvgBoard(QSvgWidget):
 
         self._game: Game = game
 
+        self.is_painted: bool = False
         self.is_dragging: bool = False
         self.is_animating: bool = False
         self.is_interactive: bool = True
@@ -97,7 +128,16 @@ class SvgBoard(QSvgWidget):
         self.origin_square: Square | None = None
         self.cursor_point: QPointF = QPointF(0.0, 0.0)
         self.animation_point: QPointF = QPointF(0.0, 0.0)
+        self.piece_area: QRectF = QRectF()
         self.orientation: bool = setting_value("board", "orientation")
+        self.frame_times: deque[float] = deque(maxlen=FRAME_TIME_SAMPLES)
+
+        self._layer_cache: RenderCache[QPixmap] = RenderCache(
+            LAYER_CACHE_BUDGET, pixmap_size_in_bytes
+        )
+        self._piece_cache: RenderCache[QPixmap] = RenderCache(
+            PIECE_CACHE_BUDGET, pixmap_size_in_bytes
+        )
 
         self._coord: QColor = QColor()
         self._inner_border: QColor = QColor()
@@ -131,6 +171,13 @@ class SvgBoard(QSvgWidget):
         else:
             return NORMAL_BOARD_SIZE
 
+    @property
+    def average_frame_time(self) -> float:
+        """Get average paint time of recent frames in seconds."""
+        if not self.frame_times:
+            return 0.0
+        return sum(self.frame_times) / len(self.frame_times)
+
     @property
     def board_margin(self) -> float:
         """Get board margin based on board size."""
@@ -197,27 +244,71 @@ class SvgBoard(QSvgWidget):
         self.clear_cache()
 
     def clear_cache(self) -> None:
-        """Clear SVG data and renderer caches, then update board."""
-        self.svg_data.cache_clear()
-        self.svg_renderer.cache_clear()
+        """Clear board layer and piece caches, then update board."""
+        self._layer_cache.clear()
+        self._piece_cache.clear()
 
         self.update()
 
-    def board_cache(self) -> BoardCache:
-        """Get cache of current board state."""
-        return BoardCache(
-            fen=self._game.fen,
-            check=self._game.check,
-            dragging=self.is_dragging,
-            square=self.origin_square,
+    def cache_info(self) -> dict[str, CacheInfo]:
+        """Get statistics of board layer and piece caches."""
+        return {
+            "layers": self._layer_cache.cache_info(),
+            "pieces": self._piece_cache.cache_info(),
+        }
+
+    def layer_pixmaps(self) -> list[QPixmap]:
+        """Get static layer and non-empty layers of current board state."""
+        board_to_render: BaseBoard = self._game.board
+
+        if self.origin_square is not None and (self.is_dragging or self.is_animating):
+            board_to_render = board_to_render.copy(stack=False)
+            board_to_render.set_piece_at(square=self.origin_square, piece=None)
+
+        cached_square: Square | None = self.origin_square if self.is_dragging else None
+        legal_targets: Bitboard = self._game.legal_targets(cached_square)
+
+        layer: BoardLayer = BoardLayer(
+            size=self.width(),
+            device_pixel_ratio=self.devicePixelRatioF(),
             orientation=self.orientation,
-            arrow=tuple(self._game.arrow),
         )
+        layers: list[BoardLayer] = [layer._replace(is_static=True)]
+
+        if self._game.check is not None:
+            layers.append(layer._replace(check=self._game.check))
+
+        layers.append(
+            layer._replace(position_key=PIECE_HASHER.hash_board(board_to_render))
+        )
+
+        if legal_targets:
+            layers.append(layer._replace(squares=legal_targets))
+
+        if self._game.arrow:
+            layers.append(layer._replace(arrows=tuple(self._game.arrow)))
+
+        return [
+            self._layer_cache.get_or_create(
+                layer, partial(self.render_layer, layer, board_to_render)
+            )
+            for layer in layers
+        ]
 
     def set_animation_point(self, value: QPointF) -> None:
-        """Set animation point based on `value`."""
+        """Set animation point based on `value` and update piece area."""
         self.animation_point = value
 
+        self.update_piece_area_at(value)
+
+    def update_piece_area_at(self, point: QPointF) -> None:
+        """Repaint previous piece area and piece area at `point`."""
+        piece_area: QRectF = self.piece_render_area_at(point)
+        dirty_area: QRectF = self.piece_area.united(piece_area)
+
+        self.piece_area = piece_area
+        self.update(dirty_area.toAlignedRect().adjusted(-1, -1, 1, 1))
+
     def square_center(self, square: Square) -> QPointF:
         """Get center point of `square`."""
         file: int = square % 8
@@ -262,8 +353,8 @@ class SvgBoard(QSvgWidget):
 
     def is_legal(self, target_square: Square) -> bool:
         """Return True if `target_square` is legal for dragged piece."""
-        legal_targets: list[Square] = self._game.legal_targets(self.origin_square)
-        return target_square in legal_targets
+        legal_targets: Bitboard = self._game.legal_targets(self.origin_square)
+        return bool(legal_targets & BB_SQUARES[target_square])
 
     def update_cursor_shape_at(self, cursor_point: QPointF) -> None:
         """Update cursor shape at `cursor_point`."""
@@ -286,6 +377,7 @@ class SvgBoard(QSvgWidget):
         self.dragged_piece = piece
         self.origin_square = square
         self._game.origin_square = square
+        self.piece_area = self.piece_render_area_at(self.cursor_point)
 
         self.setCursor(Qt.CursorShape.ClosedHandCursor)
         self.update()
@@ -339,38 +431,64 @@ class SvgBoard(QSvgWidget):
         self._animation.setEndValue(self.square_center(origin_square))
         self._animation.start()
 
-    @lru_cache(maxsize=128)
-    def svg_data(self, cache: BoardCache) -> bytes:
-        """Transform current board state into SVG data as bytes."""
-        board_to_render: Board = self._game.board
+    def render_layer(self, layer: BoardLayer, board: BaseBoard) -> QPixmap:
+        """Rasterize `layer` of `board` into pixmap."""
+        svg_layer: str = svg.board(
+            board=board if layer.position_key else None,
+            check=layer.check,
+            arrows=[
+                svg.Arrow(tail, head, color=color) for tail, head, color in layer.arrows
+            ],
+            squares=SquareSet(layer.squares),
+            colors=self.color_names() if layer.is_static else TRANSPARENT_COLORS,
+            orientation=layer.orientation,
+        )
+        renderer: QSvgRenderer = QSvgRenderer(svg_layer.encode())
 
-        if cache.square is not None and cache.dragging or self.is_animating:
-            square: Square | None = (
-                cache.square if cache.dragging else self.origin_square
-            )
-            board_to_render = board_to_render.copy()
-            board_to_render.set_piece_at(square=square, piece=None)
-
-        cached_square: Square | None = cache.square if cache.dragging else None
-        legal_targets: list[Square] = self._game.legal_targets(cached_square)
-
-        svg_board: str = svg.board(
-            check=cache.check,
-            arrows=cache.arrow,
-            board=board_to_render,
-            squares=legal_targets,
-            colors=self.color_names(),
-            orientation=cache.orientation,
+        pixmap: QPixmap = QPixmap(
+            QSize(layer.size, layer.size) * layer.device_pixel_ratio
+        )
+        pixmap.setDevicePixelRatio(layer.device_pixel_ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter: QPainter = QPainter(pixmap)
+        renderer.render(painter, QRectF(0, 0, layer.size, layer.size))
+        painter.end()
+        return pixmap
+
+    def piece_pixmap(
+        self,
+        piece_symbol: str,
+        square_size: float,
+        device_pixel_ratio: float,
+    ) -> QPixmap:
+        """Get or rasterize piece based on `piece_symbol` at `square_size`."""
+        return self._piece_cache.get_or_create(
+            (piece_symbol, square_size, device_pixel_ratio),
+            partial(
+                self.render_piece_pixmap, piece_symbol, square_size, device_pixel_ratio
+            ),
         )
-        return svg_board.encode()
 
-    @lru_cache(maxsize=12)
-    def svg_renderer(self, piece_symbol: str) -> QSvgRenderer:
-        """Get or create piece SVG renderer based on `piece_symbol`."""
+    def render_piece_pixmap(
+        self,
+        piece_symbol: str,
+        square_size: float,
+        device_pixel_ratio: float,
+    ) -> QPixmap:
+        """Rasterize piece based on `piece_symbol` at `square_size`."""
         svg_piece: str = svg.piece(Piece.from_symbol(piece_symbol))
-        renderer: QSvgRenderer = QSvgRenderer()
-        renderer.load(svg_piece.encode())
-        return renderer
+        renderer: QSvgRenderer = QSvgRenderer(svg_piece.encode())
+        pixel_size: int = round(square_size * device_pixel_ratio)
+
+        pixmap: QPixmap = QPixmap(pixel_size, pixel_size)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter: QPainter = QPainter(pixmap)
+        renderer.render(painter, QRectF(0, 0, square_size, square_size))
+        painter.end()
+        return pixmap
 
     def piece_render_area_at(self, cursor_point: QPointF) -> QRectF:
         """Get piece render area based on `cursor_point`."""
@@ -383,39 +501,59 @@ class SvgBoard(QSvgWidget):
 
     def render_piece(
         self,
+        painter: QPainter,
         cursor_point: QPointF,
         piece: Piece | None = None,
     ) -> None:
-        """Render `piece` at `cursor_point`."""
+        """Render `piece` at `cursor_point` with `painter`."""
         dragged_piece: Piece | None = self.dragged_piece or None
         piece_to_render: Piece | None = dragged_piece or piece
 
         if piece_to_render is None:
             return
 
-        painter: QPainter = QPainter(self)
-        piece_symbol: str = piece_to_render.symbol()
-        renderer: QSvgRenderer = self.svg_renderer(piece_symbol)
+        pixmap: QPixmap = self.piece_pixmap(
+            piece_to_render.symbol(),
+            self.square_size,
+            self.devicePixelRatioF(),
+        )
         piece_render_area: QRectF = self.piece_render_area_at(cursor_point)
-        renderer.render(painter, piece_render_area)
-        painter.end()
+        painter.drawPixmap(piece_render_area, pixmap, QRectF(pixmap.rect()))
 
     def paintEvent(self, event: QPaintEvent) -> None:
-        """Render board and piece to animate."""
-        board_svg: bytes = self.svg_data(self.board_cache())
-        self.load(board_svg)
-        super().paintEvent(event)
+        """Composite cached board layers in dirty area and render piece."""
+        start: float = perf_counter()
+
+        dirty_area: QRectF = QRectF(event.rect())
+        device_pixel_ratio: float = self.devicePixelRatioF()
+        source_area: QRectF = QRectF(
+            dirty_area.topLeft() * device_pixel_ratio,
+            dirty_area.size() * device_pixel_ratio,
+        )
+
+        painter: QPainter = QPainter(self)
+
+        for pixmap in self.layer_pixmaps():
+            painter.drawPixmap(dirty_area, pixmap, source_area)
 
         if self.is_dragging and self.dragged_piece is not None:
-            current_piece: Piece = self._game.piece_at(self.origin_square)
+            current_piece: Piece | None = self._game.piece_at(self.origin_square)
 
-            if current_piece.color != self.dragged_piece.color:
+            if current_piece is None or current_piece.color != self.dragged_piece.color:
                 self.stop_dragging()
             else:
-                self.render_piece(self.cursor_point)
+                self.render_piece(painter, self.cursor_point)
 
         if self.is_animating:
-            self.render_piece(self.animation_point, self.animated_piece)
+            self.render_piece(painter, self.animation_point, self.animated_piece)
+
+        painter.end()
+
+        self.frame_times.append(perf_counter() - start)
+
+        if not self.is_painted:
+            self.is_painted = True
+            self.first_painted.emit()
 
     def select_square_at(self, cursor_point: QPointF) -> None:
         """Select square at `cursor_point`."""
@@ -441,6 +579,9 @@ class SvgBoard(QSvgWidget):
         cursor_point: QPointF = self.cursor_point_from(event)
         self.update_cursor_shape_at(cursor_point)
 
+        if self.is_dragging:
+            self.update_piece_area_at(cursor_point)
+
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
         """Make move with dragging piece or return it back."""
         cursor_point: QPointF = self.cursor_point_from(event)
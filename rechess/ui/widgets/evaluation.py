@@ -36,5 +36,26 @@ class EvaluationBar(QProgressBar):
             evaluation_text = f"{evaluation_score / 100 :.2f}"
 
         self.setFormat(evaluation_text)
+        self.setToolTip("")
+        self._animation.setEndValue(animation_value)
+        self._animation.start()
+
+    def show_tablebase_result(self, wdl: int, dtz: int) -> None:
+        """Animate chunk to exact tablebase result based on `wdl` and `dtz`."""
+        if wdl == 2:
+            animation_value: int = 0
+            result_text: str = "1-0"
+            result_tip: str = f"Tablebase win for White, DTZ {abs(dtz)}"
+        elif wdl == -2:
+            animation_value = 1000
+            result_text = "0-1"
+            result_tip = f"Tablebase win for Black, DTZ {abs(dtz)}"
+        else:
+            animation_value = 500
+            result_text = "½-½"
+            result_tip = "Tablebase draw"
+
+        self.setFormat(result_text)
+        self.setToolTip(result_tip)
         self._animation.setEndValue(animation_value)
         self._animation.start()
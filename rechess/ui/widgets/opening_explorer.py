@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import Any, Final
+
+from chess import Board
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    Qt,
+)
+from PySide6.QtWidgets import QAbstractItemView, QHeaderView, QTableView
+
+
+COLUMN_HEADERS: Final[tuple[str, ...]] = ("Move", "ECO", "Opening")
+
+
+class OpeningExplorerModel(QAbstractTableModel):
+    """Model for book moves leading from position to named openings."""
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._rows: list[tuple[str, str, str]] = []
+
+    def data(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        """Get move, ECO code or opening name at `index`."""
+        if not index.isValid():
+            return None
+
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return self._rows[index.row()][index.column()]
+
+    def rowCount(
+        self,
+        index: QModelIndex | QPersistentModelIndex = QModelIndex(),
+    ) -> int:
+        """Get number of book moves from position."""
+        return len(self._rows)
+
+    def columnCount(
+        self,
+        index: QModelIndex | QPersistentModelIndex = QModelIndex(),
+    ) -> int:
+        """Get fixed column count for move, ECO code and opening name."""
+        return len(COLUMN_HEADERS)
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        """Get column labels."""
+        if role == Qt.ItemDataRole.DisplayRole:
+            if orientation == Qt.Orientation.Horizontal:
+                return COLUMN_HEADERS[section]
+
+    def set_continuations(
+        self,
+        board: Board,
+        continuations: list[BookContinuation],
+    ) -> None:
+        """Show book `continuations` from position on `board`."""
+        self.beginResetModel()
+        self._rows = [
+            (board.san(continuation.move), *continuation[1:])
+            for continuation in continuations
+        ]
+        self.endResetModel()
+
+
+class OpeningExplorer(QTableView):
+    """View for book moves leading from position to named openings."""
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._opening_explorer_model: OpeningExplorerModel = OpeningExplorerModel()
+        self.setModel(self._opening_explorer_model)
+
+        self.setShowGrid(False)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.verticalHeader().hide()
+        self.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.ResizeToContents
+        )
+        self.horizontalHeader().setStretchLastSection(True)
+
+    def show_continuations(
+        self,
+        board: Board,
+        continuations: list[BookContinuation],
+    ) -> None:
+        """Show book `continuations` from position on `board`."""
+        self._opening_explorer_model.set_continuations(board, continuations)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from typing import Any, ClassVar, Final
+
+from chess import Board
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    Qt,
+    Signal,
+)
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QHeaderView,
+    QLabel,
+    QPushButton,
+    QTableView,
+    QVBoxLayout,
+    QWidget,
+)
+
+
+COLUMN_HEADERS: Final[tuple[str, ...]] = ("Move", "Games", "White", "Draw", "Black")
+
+
+class MoveStatisticsModel(QAbstractTableModel):
+    """Model for frequencies and results of moves played from position."""
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._sans: list[str] = []
+        self._statistics: list[MoveStatistics] = []
+
+    def data(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        """Get move, game count or result percentage at `index`."""
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        statistics: MoveStatistics = self._statistics[index.row()]
+
+        if index.column() == 0:
+            return self._sans[index.row()]
+
+        if index.column() == 1:
+            return statistics.games
+
+        wins_or_draws: int = statistics[index.column()]
+        return f"{100 * wins_or_draws / statistics.games:.0f}%"
+
+    def rowCount(
+        self,
+        index: QModelIndex | QPersistentModelIndex = QModelIndex(),
+    ) -> int:
+        """Get number of moves played from position."""
+        return len(self._statistics)
+
+    def columnCount(
+        self,
+        index: QModelIndex | QPersistentModelIndex = QModelIndex(),
+    ) -> int:
+        """Get fixed column count for move, games and results."""
+        return len(COLUMN_HEADERS)
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        """Get column labels."""
+        if role == Qt.ItemDataRole.DisplayRole:
+            if orientation == Qt.Orientation.Horizontal:
+                return COLUMN_HEADERS[section]
+
+    def set_statistics(self, board: Board, statistics: list[MoveStatistics]) -> None:
+        """Show `statistics` of moves played from position on `board`."""
+        self.beginResetModel()
+        self._statistics = statistics
+        self._sans = [
+            board.san(move_statistics.move) if move_statistics.move else "End"
+            for move_statistics in statistics
+        ]
+        self.endResetModel()
+
+
+class PositionSearchPanel(QWidget):
+    """Panel with statistics of moves played in games reaching position."""
+
+    games_requested: ClassVar[Signal] = Signal()
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._move_statistics_model: MoveStatisticsModel = MoveStatisticsModel()
+
+        self._games_label: QLabel = QLabel()
+        self._games_button: QPushButton = QPushButton("Show games")
+        self._games_button.clicked.connect(self.games_requested)
+
+        self.create_table_view()
+        self.set_vertical_layout()
+
+    def create_table_view(self) -> None:
+        """Create table view over move statistics model."""
+        self._table_view: QTableView = QTableView()
+        self._table_view.setModel(self._move_statistics_model)
+
+        self._table_view.setShowGrid(False)
+        self._table_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self._table_view.verticalHeader().hide()
+        self._table_view.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Stretch
+        )
+
+    def set_vertical_layout(self) -> None:
+        """Add label, table view and button to vertical layout."""
+        vertical_layout: QVBoxLayout = QVBoxLayout()
+        vertical_layout.addWidget(self._games_label)
+        vertical_layout.addWidget(self._table_view)
+        vertical_layout.addWidget(self._games_button)
+
+        self.setLayout(vertical_layout)
+
+    def show_statistics(
+        self,
+        board: Board,
+        statistics: PositionStatistics,
+    ) -> None:
+        """Show `statistics` of games reaching position on `board`."""
+        games: str = f"{statistics.games}" + ("" if statistics.is_complete else "+")
+        self._games_label.setText(f"Games reaching position: {games}")
+        self._games_button.setEnabled(statistics.games > 0)
+        self._move_statistics_model.set_statistics(board, statistics.moves)
@@ -7,19 +7,55 @@ from .helper_functions import (
     delete_quarantine_attribute,
     engine_configuration,
     engine_file_filter,
+    find_deepest_opening,
     find_opening,
     make_executable,
+    opening_continuations,
+    openings_loader,
     path_to_stockfish,
     set_setting_value,
     setting_value,
+    settings_store,
     show_info,
     show_warning,
+    standard_icon,
+    startup_profile,
     style_name,
     svg_icon,
 )
+from .opening_index import OpeningIndex
+from .opening_tree import BookContinuation, OpeningTree
+from .openings_loader import OpeningsLoader
+from .pgn_index import PgnIndex
+from .pgn_loader import PgnLoader
+from .pgn_writer import PgnWriter
+from .position_index import (
+    MoveStatistics,
+    PositionHit,
+    PositionIndex,
+    PositionStatistics,
+)
+from .render_cache import CacheInfo, RenderCache
+from .settings_store import SettingsStore
+from .startup_profile import StartupProfile
 
 
 __all__: list[str] = [
+    "BookContinuation",
+    "CacheInfo",
+    "MoveStatistics",
+    "OpeningIndex",
+    "OpeningTree",
+    "OpeningsLoader",
+    "PgnIndex",
+    "PgnLoader",
+    "PgnWriter",
+    "PositionHit",
+    "PositionIndex",
+    "PositionStatistics",
+    "RenderCache",
+    "SettingsStore",
+    "StartupProfile",
     "colorize_icon",
     "create_action",
     "create_app",
@@ -28,13 +64,19 @@ __all__: list[str] = [
     "delete_quarantine_attribute",
     "engine_configuration",
     "engine_file_filter",
+    "find_deepest_opening",
     "find_opening",
     "make_executable",
+    "opening_continuations",
+    "openings_loader",
     "path_to_stockfish",
     "set_setting_value",
     "setting_value",
+    "settings_store",
     "show_info",
     "show_warning",
+    "standard_icon",
+    "startup_profile",
     "style_name",
     "svg_icon",
 ]
@@ -1,18 +1,29 @@
 from __future__ import annotations
 
-import json
+import atexit
 import os
 import platform
 import stat
 import subprocess
 import sys
 from functools import lru_cache
-from typing import Any, Callable, Final
+from typing import Any, Callable, Final, Iterable
 
+from chess import Board
 from psutil import cpu_count, virtual_memory
 from PySide6.QtCore import QSize, Qt
 from PySide6.QtGui import QAction, QColor, QIcon, QPixmap
-from PySide6.QtWidgets import QApplication, QMessageBox, QPushButton, QSplashScreen
+from PySide6.QtWidgets import (
+    QApplication,
+    QMessageBox,
+    QPushButton,
+    QSplashScreen,
+    QStyle,
+)
+
+from rechess.utils.openings_loader import OpeningsLoader
+from rechess.utils.settings_store import SettingsStore
+from rechess.utils.startup_profile import StartupProfile
 
 
 def colorize_icon(color: str) -> QIcon:
@@ -87,31 +98,32 @@ def show_warning(parent: QWidget) -> None:
     sys.exit()
 
 
+def standard_icon(pixmap: QStyle.StandardPixmap) -> QIcon:
+    """Get icon of current app style for standard `pixmap`."""
+    return QApplication.style().standardIcon(pixmap)
+
+
 def svg_icon(file_name: str) -> QIcon:
     """Get SVG icon from SVG file at `file_name`."""
     return QIcon(f":/icons/{file_name}.svg")
 
 
-def _settings() -> dict[str, dict[str, Any]]:
-    """Get all settings from settings.json file."""
-    with open("rechess/settings.json") as settings_file:
-        return json.load(settings_file)
+@lru_cache(maxsize=1)
+def settings_store() -> SettingsStore:
+    """Get settings store loaded once from settings.json file."""
+    store: SettingsStore = SettingsStore("rechess/settings.json")
+    atexit.register(store.flush)
+    return store
 
 
 def setting_value(section: str, key: str) -> Any:
     """Get value of `key` from `section`."""
-    settings_dict: dict[str, dict[str, Any]] = _settings()
-    return settings_dict[section][key]
+    return settings_store().value(section, key)
 
 
 def set_setting_value(section: str, key: str, value: Any) -> None:
     """Set `value` to `key` for `section`."""
-    settings_dict: dict[str, dict[str, Any]] = _settings()
-    settings_dict[section][key] = value
-
-    with open("rechess/settings.json", mode="w", newline="\n") as settings_file:
-        json.dump(settings_dict, settings_file, indent=2)
-        settings_file.write("\n")
+    settings_store().set_value(section, key, value)
 
 
 def style_name(file_name: str) -> str:
@@ -138,9 +150,14 @@ def delete_quarantine_attribute(path_to_file: str) -> None:
         )
 
 
-def engine_configuration() -> dict[str, int]:
-    """Get engine configuration with fixed hash and variable threads."""
-    return {"Hash": 512, "Threads": cpu_count() or 1}
+def engine_configuration() -> dict[str, int | str]:
+    """Get engine configuration with fixed hash, variable threads and tablebase."""
+    configuration: dict[str, int | str] = {"Hash": 512, "Threads": cpu_count() or 1}
+
+    if setting_value("tablebase", "path"):
+        configuration["SyzygyPath"] = setting_value("tablebase", "path")
+
+    return configuration
 
 
 def engine_file_filter() -> str:
@@ -162,12 +179,32 @@ def path_to_stockfish() -> str:
 
 
 @lru_cache(maxsize=1)
-def _load_openings() -> dict[str, list[str]]:
-    """Load openings from JSON file."""
-    with open("rechess/openings.json", encoding="utf-8") as json_file:
-        return json.load(json_file)
+def startup_profile() -> StartupProfile:
+    """Get profile of startup phases shared across app."""
+    return StartupProfile()
+
+
+@lru_cache(maxsize=1)
+def openings_loader() -> OpeningsLoader:
+    """Get loader of opening index, compiled if openings.json is newer."""
+    return OpeningsLoader(
+        "rechess/openings.json",
+        "rechess/openings.idx",
+        "rechess/openings.tree",
+        startup_profile(),
+    )
+
+
+def find_opening(board: Board) -> list[str] | None:
+    """Get ECO code and opening name based on position on `board`."""
+    return openings_loader().find(board)
+
+
+def find_deepest_opening(keys: Iterable[int]) -> list[str] | None:
+    """Get ECO code and opening name of first known position in `keys`."""
+    return openings_loader().find_deepest(keys)
 
 
-def find_opening(fen: str) -> list[str] | None:
-    """Get ECO code and opening name based on `fen`."""
-    return _load_openings().get(fen)
+def opening_continuations(board: Board) -> list[BookContinuation] | None:
+    """Get book moves from position on `board` with openings they reach."""
+    return openings_loader().continuations(board)
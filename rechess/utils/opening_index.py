@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from bisect import bisect_left
+from typing import Final
+
+from chess import Board
+from chess.polyglot import zobrist_hash
+
+
+HEADER: Final[struct.Struct] = struct.Struct("<4sII")
+MAGIC: Final[bytes] = b"RCOI"
+VERSION: Final[int] = 1
+
+
+class OpeningIndex:
+    """Memory-mapped openings keyed by Zobrist hash of position."""
+
+    def __init__(self, path_to_json: str, path_to_index: str | None) -> None:
+        self._buffer: mmap.mmap | bytes
+
+        if path_to_index is None:
+            self._buffer = self.compile(path_to_json)
+        else:
+            if self.is_stale(path_to_json, path_to_index):
+                self.build(path_to_json, path_to_index)
+
+            with open(path_to_index, "rb") as index_file:
+                self._buffer = mmap.mmap(
+                    index_file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+
+        magic, version, count = HEADER.unpack_from(self._buffer)
+
+        if magic != MAGIC or version != VERSION:
+            self.release_buffer()
+            raise ValueError(f"Unsupported opening index at {path_to_index}")
+
+        keys_start: int = HEADER.size
+        offsets_start: int = keys_start + 8 * count
+        strings_start: int = offsets_start + 4 * (count + 1)
+
+        self._count: int = count
+        self._keys: memoryview = memoryview(self._buffer)[
+            keys_start:offsets_start
+        ].cast("Q")
+        self._offsets: memoryview = memoryview(self._buffer)[
+            offsets_start:strings_start
+        ].cast("I")
+        self._strings: memoryview = memoryview(self._buffer)[strings_start:]
+
+    def __len__(self) -> int:
+        """Get number of indexed positions."""
+        return self._count
+
+    @staticmethod
+    def is_stale(path_to_json: str, path_to_index: str) -> bool:
+        """Return True if index is missing or older than JSON file."""
+        if not os.path.exists(path_to_index):
+            return True
+        return os.path.getmtime(path_to_json) > os.path.getmtime(path_to_index)
+
+    @staticmethod
+    def compile(path_to_json: str) -> bytes:
+        """Compile openings from JSON file into contents of binary index."""
+        with open(path_to_json, encoding="utf-8") as json_file:
+            openings: dict[str, list[str]] = json.load(json_file)
+
+        entries: dict[int, bytes] = {}
+
+        for fen, (eco_code, opening_name) in openings.items():
+            key: int = zobrist_hash(Board(fen))
+            entries.setdefault(key, f"{eco_code}\0{opening_name}".encode())
+
+        keys: array = array("Q", sorted(entries))
+        offsets: array = array("I", [0])
+        strings: bytearray = bytearray()
+
+        for key in keys:
+            strings += entries[key]
+            offsets.append(len(strings))
+
+        return b"".join(
+            [
+                HEADER.pack(MAGIC, VERSION, len(keys)),
+                keys.tobytes(),
+                offsets.tobytes(),
+                strings,
+            ]
+        )
+
+    @classmethod
+    def build(cls, path_to_json: str, path_to_index: str) -> None:
+        """Compile openings from JSON file into binary index file."""
+        contents: bytes = cls.compile(path_to_json)
+        directory: str = os.path.dirname(os.path.abspath(path_to_index))
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=directory)
+
+        try:
+            with os.fdopen(file_descriptor, "wb") as index_file:
+                index_file.write(contents)
+        except OSError:
+            os.remove(temporary_path)
+            raise
+
+        os.chmod(temporary_path, 0o644)
+        os.replace(temporary_path, path_to_index)
+
+    def find(self, board: Board) -> list[str] | None:
+        """Get ECO code and opening name for position on `board`."""
+        return self.find_key(zobrist_hash(board))
+
+    def find_key(self, key: int) -> list[str] | None:
+        """Get ECO code and opening name for position with Zobrist hash `key`."""
+        position: int = bisect_left(self._keys, key)
+
+        if position == self._count or self._keys[position] != key:
+            return None
+
+        start: int = self._offsets[position]
+        end: int = self._offsets[position + 1]
+        eco_code, opening_name = bytes(self._strings[start:end]).decode().split("\0")
+        return [eco_code, opening_name]
+
+    def release_buffer(self) -> None:
+        """Close memory map of index file, if index is not held in memory."""
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def close(self) -> None:
+        """Release memory-mapped index file."""
+        self._keys.release()
+        self._offsets.release()
+        self._strings.release()
+        self.release_buffer()
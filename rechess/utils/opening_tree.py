@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from bisect import bisect_left
+from collections import deque
+from typing import Final, NamedTuple
+
+from chess import Board, Move
+from chess.polyglot import zobrist_hash
+
+from rechess.utils.position_index import decode_move, encode_move
+
+
+HEADER: Final[struct.Struct] = struct.Struct("<4sIII")
+MAGIC: Final[bytes] = b"RCOT"
+VERSION: Final[int] = 1
+
+
+class BookContinuation(NamedTuple):
+    """Type annotations for book move leading to named opening position."""
+
+    move: Move
+    eco_code: str
+    opening_name: str
+
+
+class OpeningTree:
+    """Memory-mapped tree of named opening positions keyed by Zobrist hash."""
+
+    def __init__(self, path_to_json: str, path_to_tree: str | None) -> None:
+        self._buffer: mmap.mmap | bytes
+
+        if path_to_tree is None:
+            self._buffer = self.compile(path_to_json)
+        else:
+            if self.is_stale(path_to_json, path_to_tree):
+                self.build(path_to_json, path_to_tree)
+
+            with open(path_to_tree, "rb") as tree_file:
+                self._buffer = mmap.mmap(tree_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, node_count, edge_count = HEADER.unpack_from(self._buffer)
+
+        if magic != MAGIC or version != VERSION:
+            self.release_buffer()
+            raise ValueError(f"Unsupported opening tree at {path_to_tree}")
+
+        keys_start: int = HEADER.size
+        first_children_start: int = keys_start + 8 * node_count
+        name_offsets_start: int = first_children_start + 4 * (node_count + 1)
+        children_start: int = name_offsets_start + 4 * (node_count + 1)
+        moves_start: int = children_start + 4 * edge_count
+        names_start: int = moves_start + 2 * edge_count
+
+        view: memoryview = memoryview(self._buffer)
+        self._node_count: int = node_count
+        self._keys: memoryview = view[keys_start:first_children_start].cast("Q")
+        self._first_children: memoryview = view[
+            first_children_start:name_offsets_start
+        ].cast("I")
+        self._name_offsets: memoryview = view[name_offsets_start:children_start].cast(
+            "I"
+        )
+        self._children: memoryview = view[children_start:moves_start].cast("I")
+        self._moves: memoryview = view[moves_start:names_start].cast("H")
+        self._names: memoryview = view[names_start:]
+
+    def __len__(self) -> int:
+        """Get number of positions in tree."""
+        return self._node_count
+
+    @staticmethod
+    def is_stale(path_to_json: str, path_to_tree: str) -> bool:
+        """Return True if tree is missing or older than JSON file."""
+        if not os.path.exists(path_to_tree):
+            return True
+        return os.path.getmtime(path_to_json) > os.path.getmtime(path_to_tree)
+
+    @staticmethod
+    def compile(path_to_json: str) -> bytes:
+        """Link named positions from JSON file by book moves into tree contents."""
+        with open(path_to_json, encoding="utf-8") as json_file:
+            openings: dict[str, list[str]] = json.load(json_file)
+
+        names: dict[int, bytes] = {}
+        boards: dict[int, Board] = {}
+
+        for fen, (eco_code, opening_name) in openings.items():
+            board: Board = Board(fen)
+            key: int = zobrist_hash(board)
+
+            if key not in names:
+                names[key] = f"{eco_code}\0{opening_name}".encode()
+                boards[key] = board
+
+        root: Board = Board()
+        root_key: int = zobrist_hash(root)
+        names.setdefault(root_key, b"")
+
+        edges: dict[int, list[tuple[int, int]]] = {}
+        seen_keys: set[int] = {root_key}
+        queue: deque[Board] = deque([root])
+
+        while queue:
+            board = queue.popleft()
+            parent_key: int = zobrist_hash(board)
+
+            for move in board.legal_moves:
+                board.push(move)
+                child_key: int = zobrist_hash(board)
+
+                if child_key in names:
+                    edges.setdefault(parent_key, []).append(
+                        (encode_move(move), child_key)
+                    )
+
+                    if child_key not in seen_keys:
+                        seen_keys.add(child_key)
+                        queue.append(board.copy(stack=False))
+
+                board.pop()
+
+            if not queue:
+                for key in boards.keys() - seen_keys:
+                    seen_keys.add(key)
+                    queue.append(boards[key])
+
+        keys: list[int] = sorted(names)
+        node_indexes: dict[int, int] = {key: index for index, key in enumerate(keys)}
+        first_children: array = array("I", [0])
+        name_offsets: array = array("I", [0])
+        children: array = array("I")
+        moves: array = array("H")
+        name_bytes: bytearray = bytearray()
+
+        for key in keys:
+            for move_code, child_key in edges.get(key, []):
+                children.append(node_indexes[child_key])
+                moves.append(move_code)
+
+            first_children.append(len(children))
+            name_bytes += names[key]
+            name_offsets.append(len(name_bytes))
+
+        return b"".join(
+            [
+                HEADER.pack(MAGIC, VERSION, len(keys), len(children)),
+                array("Q", keys).tobytes(),
+                first_children.tobytes(),
+                name_offsets.tobytes(),
+                children.tobytes(),
+                moves.tobytes(),
+                name_bytes,
+            ]
+        )
+
+    @classmethod
+    def build(cls, path_to_json: str, path_to_tree: str) -> None:
+        """Link named positions from JSON file by book moves into tree file."""
+        contents: bytes = cls.compile(path_to_json)
+        directory: str = os.path.dirname(os.path.abspath(path_to_tree))
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=directory)
+
+        try:
+            with os.fdopen(file_descriptor, "wb") as tree_file:
+                tree_file.write(contents)
+        except OSError:
+            os.remove(temporary_path)
+            raise
+
+        os.chmod(temporary_path, 0o644)
+        os.replace(temporary_path, path_to_tree)
+
+    def node_index(self, key: int) -> int | None:
+        """Get index of node for position with Zobrist hash `key`."""
+        position: int = bisect_left(self._keys, key)
+
+        if position == self._node_count or self._keys[position] != key:
+            return None
+
+        return position
+
+    def name(self, node_index: int) -> list[str] | None:
+        """Get ECO code and opening name of node at `node_index`."""
+        start: int = self._name_offsets[node_index]
+        end: int = self._name_offsets[node_index + 1]
+
+        if start == end:
+            return None
+
+        eco_code, opening_name = bytes(self._names[start:end]).decode().split("\0")
+        return [eco_code, opening_name]
+
+    def children(self, node_index: int) -> list[tuple[Move, int]]:
+        """Get book moves from node at `node_index` with nodes they lead to."""
+        start: int = self._first_children[node_index]
+        end: int = self._first_children[node_index + 1]
+        return [
+            (decode_move(self._moves[edge]), self._children[edge])
+            for edge in range(start, end)
+        ]
+
+    def continuations(self, board: Board) -> list[BookContinuation]:
+        """Get book moves from position on `board` with openings they reach."""
+        node_index: int | None = self.node_index(zobrist_hash(board))
+
+        if node_index is None:
+            return []
+
+        continuations: list[BookContinuation] = []
+
+        for move, child_index in self.children(node_index):
+            eco_code, opening_name = self.name(child_index) or ["", ""]
+            continuations.append(BookContinuation(move, eco_code, opening_name))
+
+        return sorted(continuations, key=lambda continuation: continuation.eco_code)
+
+    def release_buffer(self) -> None:
+        """Close memory map of tree file, if tree is not held in memory."""
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def close(self) -> None:
+        """Release memory-mapped tree file."""
+        self._keys.release()
+        self._first_children.release()
+        self._name_offsets.release()
+        self._children.release()
+        self._moves.release()
+        self._names.release()
+        self.release_buffer()
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import logging
+from typing import ClassVar, Iterable
+
+from chess import Board
+from PySide6.QtCore import QObject, QThreadPool, Signal
+
+from rechess.utils.opening_index import OpeningIndex
+from rechess.utils.opening_tree import BookContinuation, OpeningTree
+from rechess.utils.startup_profile import StartupProfile
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class OpeningsLoader(QObject):
+    """Background loading of opening index and tree with readiness signals."""
+
+    failed: ClassVar[Signal] = Signal(str)
+    ready: ClassVar[Signal] = Signal()
+    tree_ready: ClassVar[Signal] = Signal()
+
+    def __init__(
+        self,
+        path_to_json: str,
+        path_to_index: str,
+        path_to_tree: str,
+        startup_profile: StartupProfile,
+    ) -> None:
+        super().__init__()
+
+        self._path_to_json: str = path_to_json
+        self._path_to_index: str = path_to_index
+        self._path_to_tree: str = path_to_tree
+        self._startup_profile: StartupProfile = startup_profile
+
+        self._index: OpeningIndex | None = None
+        self._tree: OpeningTree | None = None
+        self._is_started: bool = False
+        self._is_tree_started: bool = False
+
+    @property
+    def is_ready(self) -> bool:
+        """Return True if opening index is loaded."""
+        return self._index is not None
+
+    def start(self) -> None:
+        """Start loading opening index on thread pool worker."""
+        if self._is_started:
+            return
+
+        self._is_started = True
+        QThreadPool.globalInstance().start(self._load)
+
+    def _load(self) -> None:
+        """Load opening index and announce its readiness."""
+        index: OpeningIndex
+
+        with self._startup_profile.measure("openings load"):
+            try:
+                index = OpeningIndex(self._path_to_json, self._path_to_index)
+            except Exception as exception:
+                logger.warning(
+                    "Opening index %s unusable, building it in memory: %s",
+                    self._path_to_index,
+                    exception,
+                )
+
+                try:
+                    index = OpeningIndex(self._path_to_json, None)
+                except Exception as error:
+                    logger.exception("Opening index could not be built")
+                    self.failed.emit(f"Openings could not be loaded.\n\n{error}")
+                    return
+
+        self._index = index
+        self.ready.emit()
+
+    def start_tree(self) -> None:
+        """Start loading opening tree on thread pool worker."""
+        if self._is_tree_started:
+            return
+
+        self._is_tree_started = True
+        QThreadPool.globalInstance().start(self._load_tree)
+
+    def _load_tree(self) -> None:
+        """Load opening tree and announce its readiness."""
+        tree: OpeningTree
+
+        with self._startup_profile.measure("opening tree load"):
+            try:
+                tree = OpeningTree(self._path_to_json, self._path_to_tree)
+            except Exception as exception:
+                logger.warning(
+                    "Opening tree %s unusable, building it in memory: %s",
+                    self._path_to_tree,
+                    exception,
+                )
+
+                try:
+                    tree = OpeningTree(self._path_to_json, None)
+                except Exception as error:
+                    logger.exception("Opening tree could not be built")
+                    self.failed.emit(f"Opening tree could not be loaded.\n\n{error}")
+                    return
+
+        self._tree = tree
+        self.tree_ready.emit()
+
+    def find(self, board: Board) -> list[str] | None:
+        """Get ECO code and opening name if opening index is loaded."""
+        if self._index is None:
+            self.start()
+            return None
+
+        return self._index.find(board)
+
+    def find_deepest(self, keys: Iterable[int]) -> list[str] | None:
+        """Get ECO code and opening name of first known position in `keys`."""
+        if self._index is None:
+            self.start()
+            return None
+
+        for key in keys:
+            openings_data: list[str] | None = self._index.find_key(key)
+
+            if openings_data is not None:
+                return openings_data
+
+        return None
+
+    def continuations(self, board: Board) -> list[BookContinuation] | None:
+        """Get book moves from position on `board` if opening tree is loaded."""
+        if self._tree is None:
+            self.start_tree()
+            return None
+
+        return self._tree.continuations(board)
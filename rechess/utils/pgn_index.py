@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from contextlib import contextmanager
+from io import TextIOWrapper
+from typing import BinaryIO, Callable, Final, Iterator, Sequence
+
+from chess.pgn import Game, Headers, read_game, read_headers
+
+
+HEADER: Final[struct.Struct] = struct.Struct("<4sIQQQ")
+INDEX_SUFFIX: Final[str] = ".rcidx"
+MAGIC: Final[bytes] = b"RCPI"
+PROGRESS_INTERVAL: Final[int] = 1000
+VERSION: Final[int] = 2
+
+
+class LineReader:
+    """Decoded lines of binary PGN file with byte offset of next line."""
+
+    def __init__(self, pgn_file: BinaryIO) -> None:
+        self._pgn_file: BinaryIO = pgn_file
+        self.offset: int = pgn_file.tell()
+
+    def readline(self) -> str:
+        """Get next line as text and advance byte offset past it."""
+        line: bytes = self._pgn_file.readline()
+        self.offset += len(line)
+        return line.decode("utf-8", errors="replace").replace("\r\n", "\n")
+
+
+@contextmanager
+def text_at(pgn_file: BinaryIO, offset: int) -> Iterator[TextIOWrapper]:
+    """Get text stream of binary `pgn_file` from byte `offset` on."""
+    pgn_file.seek(offset)
+    pgn_text: TextIOWrapper = TextIOWrapper(
+        pgn_file, encoding="utf-8", errors="replace"
+    )
+
+    try:
+        yield pgn_text
+    finally:
+        pgn_text.detach()
+
+
+class PgnIndex:
+    """Byte offsets of games in PGN file, persisted in index file next to it."""
+
+    def __init__(
+        self,
+        path_to_pgn: str,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> None:
+        self.path_to_pgn: str = path_to_pgn
+        self.path_to_index: str = path_to_pgn + INDEX_SUFFIX
+
+        self._mmap: mmap.mmap | None = None
+        self._offsets: memoryview | array = array("Q")
+
+        if self.is_stale(path_to_pgn, self.path_to_index):
+            self._offsets = self.build(path_to_pgn, on_progress)
+
+            try:
+                self.save(path_to_pgn, self.path_to_index, self._offsets)
+            except OSError:
+                pass
+        else:
+            self._offsets = self.load(self.path_to_index)
+
+        self._pgn_file: BinaryIO = open(path_to_pgn, "rb")
+
+    def __len__(self) -> int:
+        """Get number of indexed games."""
+        return len(self._offsets)
+
+    @property
+    def offsets(self) -> Sequence[int]:
+        """Get byte offsets of indexed games."""
+        return self._offsets
+
+    @staticmethod
+    def signature(path_to_pgn: str) -> tuple[int, int]:
+        """Get size and modification time of PGN file at `path_to_pgn`."""
+        status: os.stat_result = os.stat(path_to_pgn)
+        return status.st_size, status.st_mtime_ns
+
+    @classmethod
+    def is_stale(cls, path_to_pgn: str, path_to_index: str) -> bool:
+        """Return True if index file does not describe current PGN file."""
+        try:
+            with open(path_to_index, "rb") as index_file:
+                header: bytes = index_file.read(HEADER.size)
+        except OSError:
+            return True
+
+        if len(header) < HEADER.size:
+            return True
+
+        magic, version, size, modified, _ = HEADER.unpack(header)
+
+        if (magic, version) != (MAGIC, VERSION):
+            return True
+
+        return (size, modified) != cls.signature(path_to_pgn)
+
+    @staticmethod
+    def build(
+        path_to_pgn: str,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> array:
+        """Scan headers of all games in one pass and collect their byte offsets."""
+        offsets: array = array("Q")
+        total_size: int = os.path.getsize(path_to_pgn)
+
+        with open(path_to_pgn, "rb") as pgn_file:
+            pgn_lines: LineReader = LineReader(pgn_file)
+
+            while True:
+                offset: int = pgn_lines.offset
+
+                if read_headers(pgn_lines) is None:
+                    break
+
+                offsets.append(offset)
+
+                if on_progress is not None and len(offsets) % PROGRESS_INTERVAL == 0:
+                    on_progress(offset, total_size)
+
+        if on_progress is not None:
+            on_progress(total_size, total_size)
+
+        return offsets
+
+    @classmethod
+    def save(cls, path_to_pgn: str, path_to_index: str, offsets: array) -> None:
+        """Write `offsets` to index file by atomic rename."""
+        size, modified = cls.signature(path_to_pgn)
+        directory: str = os.path.dirname(os.path.abspath(path_to_index))
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=directory,
+            prefix=".pgn-index-",
+            suffix=".tmp",
+        )
+
+        try:
+            with os.fdopen(file_descriptor, "wb") as index_file:
+                index_file.write(
+                    HEADER.pack(MAGIC, VERSION, size, modified, len(offsets))
+                )
+                offsets.tofile(index_file)
+
+            os.chmod(temporary_path, 0o644)
+            os.replace(temporary_path, path_to_index)
+        except OSError:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+            raise
+
+    def load(self, path_to_index: str) -> memoryview:
+        """Map offsets stored in index file at `path_to_index`."""
+        with open(path_to_index, "rb") as index_file:
+            self._mmap = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        count: int = HEADER.unpack_from(self._mmap)[4]
+        offsets_end: int = HEADER.size + 8 * count
+        return memoryview(self._mmap)[HEADER.size : offsets_end].cast("Q")
+
+    def read_headers(self, game_index: int) -> Headers:
+        """Get headers of game at `game_index` by seeking to it."""
+        with text_at(self._pgn_file, self._offsets[game_index]) as pgn_text:
+            return read_headers(pgn_text) or Headers()
+
+    def read_game(self, game_index: int) -> Game | None:
+        """Get game at `game_index` by seeking to it."""
+        with text_at(self._pgn_file, self._offsets[game_index]) as pgn_text:
+            return read_game(pgn_text)
+
+    def close(self) -> None:
+        """Close PGN file and unmap index file."""
+        self._pgn_file.close()
+
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import logging
+from functools import partial
+from typing import ClassVar
+
+from PySide6.QtCore import QObject, QThreadPool, Signal
+
+from rechess.utils.pgn_index import PgnIndex
+from rechess.utils.position_index import PositionIndex
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class PgnLoader(QObject):
+    """Background indexing of PGN files with progress and readiness signals."""
+
+    failed: ClassVar[Signal] = Signal(str)
+    positions_progress_changed: ClassVar[Signal] = Signal(int)
+    positions_ready: ClassVar[Signal] = Signal(PositionIndex)
+    progress_changed: ClassVar[Signal] = Signal(int)
+    ready: ClassVar[Signal] = Signal(PgnIndex)
+
+    def start(self, path_to_pgn: str) -> None:
+        """Start indexing PGN file at `path_to_pgn` on thread pool worker."""
+        QThreadPool.globalInstance().start(partial(self._load, path_to_pgn))
+
+    def _load(self, path_to_pgn: str) -> None:
+        """Load or build game and position indexes of PGN file in turn."""
+        try:
+            index: PgnIndex = PgnIndex(path_to_pgn, self._report_progress)
+        except Exception as error:
+            logger.exception("PGN file %s could not be indexed", path_to_pgn)
+            self.failed.emit(str(error))
+            return
+
+        offsets: list[int] = index.offsets.tolist()
+        self.ready.emit(index)
+
+        try:
+            position_index: PositionIndex = PositionIndex(
+                path_to_pgn,
+                offsets,
+                self._report_positions_progress,
+            )
+        except Exception as error:
+            logger.exception("Positions of %s could not be indexed", path_to_pgn)
+            self.failed.emit(str(error))
+            return
+
+        self.positions_ready.emit(position_index)
+
+    def _report_progress(self, bytes_read: int, total_bytes: int) -> None:
+        """Emit percentage of PGN file indexed so far."""
+        self.progress_changed.emit(100 * bytes_read // max(1, total_bytes))
+
+    def _report_positions_progress(self, games_read: int, total_games: int) -> None:
+        """Emit percentage of games whose positions are indexed so far."""
+        self.positions_progress_changed.emit(100 * games_read // max(1, total_games))
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import os
+from datetime import datetime
+from functools import partial
+from threading import RLock
+from typing import ClassVar
+
+from chess.pgn import Game as PgnGame
+from PySide6.QtCore import QObject, QThreadPool, Signal
+
+
+class PgnWriter(QObject):
+    """Background writing of games to PGN files and to rolling archive."""
+
+    failed: ClassVar[Signal] = Signal(str)
+    written: ClassVar[Signal] = Signal(str)
+
+    def __init__(
+        self,
+        path_to_archive: str,
+        batch_size: int,
+        max_archive_size: int,
+    ) -> None:
+        super().__init__()
+
+        self._path_to_archive: str = path_to_archive
+        self._batch_size: int = batch_size
+        self._max_archive_size: int = max_archive_size
+
+        self._lock: RLock = RLock()
+        self._pending_games: list[PgnGame] = []
+
+    def write(self, path_to_file: str, pgn_game: PgnGame) -> None:
+        """Write `pgn_game` to file at `path_to_file` on thread pool worker."""
+        QThreadPool.globalInstance().start(partial(self._save, path_to_file, pgn_game))
+
+    def archive(self, pgn_game: PgnGame) -> None:
+        """Queue `pgn_game` for archive and append full batch of games."""
+        self._pending_games.append(pgn_game)
+
+        if len(self._pending_games) >= self._batch_size:
+            self.flush()
+
+    def flush(self, wait: bool = False) -> None:
+        """Append queued games to archive, waiting for it if `wait` is True."""
+        pgn_games: list[PgnGame] = self._pending_games
+        self._pending_games = []
+
+        if not pgn_games:
+            return
+
+        if wait:
+            self._append_to_archive(pgn_games)
+        else:
+            QThreadPool.globalInstance().start(
+                partial(self._append_to_archive, pgn_games)
+            )
+
+    def _save(self, path_to_file: str, pgn_game: PgnGame) -> None:
+        """Write `pgn_game` to file at `path_to_file` and announce it."""
+        if self._write(path_to_file, [pgn_game], "w"):
+            self.written.emit(path_to_file)
+
+    def _append_to_archive(self, pgn_games: list[PgnGame]) -> None:
+        """Roll archive over if it is full and append `pgn_games` to it."""
+        with self._lock:
+            try:
+                self._roll_archive()
+            except OSError as error:
+                self.failed.emit(str(error))
+                return
+
+            self._write(self._path_to_archive, pgn_games, "a")
+
+    def _roll_archive(self) -> None:
+        """Rename archive with timestamp once it reaches maximum size."""
+        if not os.path.exists(self._path_to_archive):
+            return
+
+        if os.path.getsize(self._path_to_archive) < self._max_archive_size:
+            return
+
+        stem, extension = os.path.splitext(self._path_to_archive)
+        timestamp: str = datetime.now().strftime("%Y%m%d-%H%M%S")
+        os.replace(self._path_to_archive, f"{stem}-{timestamp}{extension}")
+
+    def _write(self, path_to_file: str, pgn_games: list[PgnGame], mode: str) -> bool:
+        """Return True if `pgn_games` were written to file at `path_to_file`."""
+        with self._lock:
+            try:
+                with open(path_to_file, mode, encoding="utf-8") as pgn_file:
+                    for pgn_game in pgn_games:
+                        pgn_file.write(f"{pgn_game}\n\n")
+            except OSError as error:
+                self.failed.emit(str(error))
+                return False
+
+        return True
@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import heapq
+import mmap
+import multiprocessing
+import os
+import struct
+import tempfile
+from collections import Counter
+from itertools import islice
+from typing import (
+    BinaryIO,
+    Callable,
+    Final,
+    Generator,
+    Iterator,
+    NamedTuple,
+    Sequence,
+)
+
+from chess import Board, Move
+from chess.pgn import read_game
+from chess.polyglot import zobrist_hash
+
+from rechess.utils.pgn_index import text_at
+
+
+CHUNK_SIZE: Final[int] = 500
+HIT_LIMIT: Final[int] = 100_000
+HEADER: Final[struct.Struct] = struct.Struct("<4sIQQQQ")
+INDEX_SUFFIX: Final[str] = ".rcpos"
+MAGIC: Final[bytes] = b"RCPX"
+NO_MOVE: Final[int] = 0xFFFF
+RECORD: Final[struct.Struct] = struct.Struct("<QIHH")
+RESULT_CODES: Final[dict[str, int]] = {"1-0": 1, "1/2-1/2": 2, "0-1": 3}
+VERSION: Final[int] = 1
+
+
+class PositionHit(NamedTuple):
+    """Type annotations for game reaching position."""
+
+    game_index: int
+    ply: int
+    move: Move | None
+
+
+class MoveStatistics(NamedTuple):
+    """Type annotations for statistics of move played from position."""
+
+    move: Move | None
+    games: int
+    white_wins: int
+    draws: int
+    black_wins: int
+
+
+class PositionStatistics(NamedTuple):
+    """Type annotations for statistics of games reaching position."""
+
+    moves: list[MoveStatistics]
+    games: int
+    is_complete: bool
+
+
+def encode_move(move: Move | None) -> int:
+    """Pack `move` into 16 bits, or NO_MOVE if there is none."""
+    if move is None:
+        return NO_MOVE
+    return move.from_square | move.to_square << 6 | (move.promotion or 0) << 12
+
+
+def decode_move(move_code: int) -> Move | None:
+    """Unpack move packed into 16 bits by `encode_move`."""
+    if move_code == NO_MOVE:
+        return None
+    return Move(move_code & 63, move_code >> 6 & 63, move_code >> 12 or None)
+
+
+def index_games(path_to_pgn: str, first_game: int, offsets: list[int]) -> bytes:
+    """Get sorted records of positions in games starting at byte `offsets`."""
+    records: list[tuple[int, int, int, int]] = []
+    results: bytearray = bytearray()
+
+    with open(path_to_pgn, "rb") as pgn_file:
+        for game_index, offset in enumerate(offsets, first_game):
+            with text_at(pgn_file, offset) as pgn_text:
+                pgn_game: PgnGame | None = read_game(pgn_text)
+
+            if pgn_game is None:
+                results.append(0)
+                continue
+
+            results.append(RESULT_CODES.get(pgn_game.headers.get("Result"), 0))
+            board: Board = pgn_game.board()
+            ply: int = 0
+
+            for move in pgn_game.mainline_moves():
+                key: int = zobrist_hash(board)
+                records.append((key, game_index, ply, encode_move(move)))
+                board.push(move)
+                ply += 1
+
+            records.append((zobrist_hash(board), game_index, ply, NO_MOVE))
+
+    records.sort()
+    return bytes(results) + b"".join(RECORD.pack(*record) for record in records)
+
+
+class PositionIndex:
+    """Sorted records mapping Zobrist hash of position to games reaching it."""
+
+    def __init__(
+        self,
+        path_to_pgn: str,
+        offsets: Sequence[int],
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> None:
+        self.path_to_pgn: str = path_to_pgn
+        self.path_to_index: str = path_to_pgn + INDEX_SUFFIX
+
+        if self.is_stale(path_to_pgn, self.path_to_index):
+            self.build(path_to_pgn, self.path_to_index, offsets, on_progress)
+
+        with open(self.path_to_index, "rb") as index_file:
+            self._mmap: mmap.mmap = mmap.mmap(
+                index_file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+
+        _, _, _, _, game_count, record_count = HEADER.unpack_from(self._mmap)
+        records_start: int = HEADER.size + game_count
+        records_end: int = records_start + RECORD.size * record_count
+
+        self._results: memoryview = memoryview(self._mmap)[HEADER.size : records_start]
+        self._records: memoryview = memoryview(self._mmap)[records_start:records_end]
+        self._record_count: int = record_count
+
+    def __len__(self) -> int:
+        """Get number of indexed positions."""
+        return self._record_count
+
+    @staticmethod
+    def signature(path_to_pgn: str) -> tuple[int, int]:
+        """Get size and modification time of PGN file at `path_to_pgn`."""
+        status: os.stat_result = os.stat(path_to_pgn)
+        return status.st_size, status.st_mtime_ns
+
+    @classmethod
+    def is_stale(cls, path_to_pgn: str, path_to_index: str) -> bool:
+        """Return True if index file does not describe current PGN file."""
+        try:
+            with open(path_to_index, "rb") as index_file:
+                header: bytes = index_file.read(HEADER.size)
+        except OSError:
+            return True
+
+        if len(header) < HEADER.size:
+            return True
+
+        magic, version, size, modified, _, _ = HEADER.unpack(header)
+
+        if (magic, version) != (MAGIC, VERSION):
+            return True
+
+        return (size, modified) != cls.signature(path_to_pgn)
+
+    @classmethod
+    def build(
+        cls,
+        path_to_pgn: str,
+        path_to_index: str,
+        offsets: Sequence[int],
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> None:
+        """Index chunks of games in worker processes and merge their records."""
+        chunks: list[tuple[str, int, list[int]]] = [
+            (
+                path_to_pgn,
+                first_game,
+                list(offsets[first_game : first_game + CHUNK_SIZE]),
+            )
+            for first_game in range(0, len(offsets), CHUNK_SIZE)
+        ]
+        results: bytearray = bytearray()
+        chunk_bounds: list[tuple[int, int]] = []
+        directory: str = os.path.dirname(os.path.abspath(path_to_index))
+        spill_file: BinaryIO = tempfile.TemporaryFile(
+            dir=directory,
+            prefix=".position-chunks-",
+        )
+
+        with spill_file:
+            with multiprocessing.get_context("spawn").Pool() as pool:
+                for chunk, (_, _, chunk_offsets) in zip(
+                    pool.imap(_index_chunk, chunks), chunks
+                ):
+                    results += chunk[: len(chunk_offsets)]
+                    start: int = spill_file.tell()
+                    spill_file.write(memoryview(chunk)[len(chunk_offsets) :])
+                    chunk_bounds.append((start, spill_file.tell()))
+
+                    if on_progress is not None:
+                        on_progress(len(results), len(offsets))
+
+            spill_file.flush()
+            size, modified = cls.signature(path_to_pgn)
+            record_count: int = spill_file.tell() // RECORD.size
+            file_descriptor, temporary_path = tempfile.mkstemp(
+                dir=directory,
+                prefix=".position-index-",
+                suffix=".tmp",
+            )
+
+            try:
+                with os.fdopen(file_descriptor, "wb") as index_file:
+                    index_file.write(
+                        HEADER.pack(
+                            MAGIC, VERSION, size, modified, len(results), record_count
+                        )
+                    )
+                    index_file.write(results)
+
+                    if record_count:
+                        cls.merge_chunks(spill_file.fileno(), chunk_bounds, index_file)
+
+                os.chmod(temporary_path, 0o644)
+                os.replace(temporary_path, path_to_index)
+            except OSError:
+                if os.path.exists(temporary_path):
+                    os.remove(temporary_path)
+
+                raise
+
+    @staticmethod
+    def merge_chunks(
+        spill_descriptor: int,
+        chunk_bounds: list[tuple[int, int]],
+        index_file: BinaryIO,
+    ) -> None:
+        """Write records of sorted chunks in spill file merged into `index_file`."""
+        spill_map: mmap.mmap = mmap.mmap(spill_descriptor, 0, access=mmap.ACCESS_READ)
+        spill_view: memoryview = memoryview(spill_map)
+        chunk_views: list[memoryview] = [
+            spill_view[start:end] for start, end in chunk_bounds
+        ]
+        merged_records: Generator[tuple[int, int, int, int], None, None] = heapq.merge(
+            *(RECORD.iter_unpack(chunk_view) for chunk_view in chunk_views)
+        )
+
+        try:
+            for record in merged_records:
+                index_file.write(RECORD.pack(*record))
+        finally:
+            merged_records.close()
+
+            for chunk_view in chunk_views:
+                chunk_view.release()
+
+            spill_view.release()
+            spill_map.close()
+
+    def key_at(self, record_index: int) -> int:
+        """Get Zobrist hash of record at `record_index`."""
+        return struct.unpack_from("<Q", self._records, RECORD.size * record_index)[0]
+
+    def lower_bound(self, key: int) -> int:
+        """Get index of first record whose Zobrist hash is not below `key`."""
+        low: int = 0
+        high: int = self._record_count
+
+        while low < high:
+            middle: int = (low + high) // 2
+
+            if self.key_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+    def hits(self, board: Board) -> Iterator[PositionHit]:
+        """Get games reaching position on `board`, along with moves played."""
+        key: int = zobrist_hash(board)
+
+        for record_index in range(self.lower_bound(key), self._record_count):
+            record_key, game_index, ply, move_code = RECORD.unpack_from(
+                self._records, RECORD.size * record_index
+            )
+
+            if record_key != key:
+                break
+
+            yield PositionHit(game_index, ply, decode_move(move_code))
+
+    def find(self, board: Board) -> list[int]:
+        """Get indexes of games reaching position on `board`."""
+        return sorted({hit.game_index for hit in self.hits(board)})
+
+    def move_statistics(self, board: Board) -> list[MoveStatistics]:
+        """Get moves played from position on `board` by most games first."""
+        return self.statistics(board, None).moves
+
+    def statistics(
+        self,
+        board: Board,
+        hit_limit: int | None = HIT_LIMIT,
+    ) -> PositionStatistics:
+        """Get moves and game count of position on `board` within `hit_limit` hits."""
+        hits: list[PositionHit] = list(
+            islice(self.hits(board), None if hit_limit is None else hit_limit + 1)
+        )
+        is_complete: bool = hit_limit is None or len(hits) <= hit_limit
+        move_games: set[tuple[Move | None, int]] = {
+            (hit.move, hit.game_index) for hit in hits[:hit_limit]
+        }
+        counts: Counter[tuple[Move | None, int]] = Counter(
+            (move, self._results[game_index]) for move, game_index in move_games
+        )
+        moves: dict[Move | None, list[int]] = {}
+
+        for (move, result_code), count in counts.items():
+            moves.setdefault(move, [0, 0, 0, 0])[result_code] += count
+
+        return PositionStatistics(
+            sorted(
+                (
+                    MoveStatistics(move, sum(results), *results[1:])
+                    for move, results in moves.items()
+                ),
+                key=lambda statistics: statistics.games,
+                reverse=True,
+            ),
+            len({game_index for _, game_index in move_games}),
+            is_complete,
+        )
+
+    def close(self) -> None:
+        """Unmap index file."""
+        self._results.release()
+        self._records.release()
+        self._mmap.close()
+
+
+def _index_chunk(chunk: tuple[str, int, list[int]]) -> bytes:
+    """Index games of `chunk` in worker process."""
+    return index_games(*chunk)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, NamedTuple, TypeVar
+
+
+CachedValue = TypeVar("CachedValue")
+
+
+class CacheInfo(NamedTuple):
+    """Type annotations for cache info."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_in_bytes: int
+    budget_in_bytes: int
+
+
+class RenderCache(Generic[CachedValue]):
+    """Least recently used cache bounded by total size in bytes."""
+
+    def __init__(
+        self,
+        budget_in_bytes: int,
+        size_of: Callable[[CachedValue], int],
+    ) -> None:
+        self._budget_in_bytes: int = budget_in_bytes
+        self._size_of: Callable[[CachedValue], int] = size_of
+        self._entries: OrderedDict[Hashable, tuple[CachedValue, int]] = OrderedDict()
+        self._size_in_bytes: int = 0
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def __len__(self) -> int:
+        """Get number of cached entries."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> CachedValue | None:
+        """Get value cached under `key`, marking it as recently used."""
+        entry: tuple[CachedValue, int] | None = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: Hashable, value: CachedValue) -> None:
+        """Cache `value` under `key`, evicting entries over budget."""
+        if key in self._entries:
+            self._size_in_bytes -= self._entries.pop(key)[1]
+
+        size_in_bytes: int = self._size_of(value)
+        self._entries[key] = value, size_in_bytes
+        self._size_in_bytes += size_in_bytes
+
+        while self._size_in_bytes > self._budget_in_bytes and len(self._entries) > 1:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._size_in_bytes -= evicted_size
+            self.evictions += 1
+
+    def get_or_create(
+        self,
+        key: Hashable,
+        create: Callable[[], CachedValue],
+    ) -> CachedValue:
+        """Get value cached under `key` or cache one made by `create`."""
+        value: CachedValue | None = self.get(key)
+
+        if value is None:
+            value = create()
+            self.put(key, value)
+
+        return value
+
+    def clear(self) -> None:
+        """Remove all entries while keeping statistics."""
+        self._entries.clear()
+        self._size_in_bytes = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Get hit, miss and eviction counts along with size usage."""
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            entries=len(self._entries),
+            size_in_bytes=self._size_in_bytes,
+            budget_in_bytes=self._budget_in_bytes,
+        )
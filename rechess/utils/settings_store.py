@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from threading import Lock, RLock, Timer
+from typing import Any, ClassVar
+
+from PySide6.QtCore import QObject, Signal
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class SettingsStore(QObject):
+    """In-memory settings with debounced write-behind persistence."""
+
+    value_changed: ClassVar[Signal] = Signal(str, str, object)
+
+    def __init__(self, path_to_file: str, flush_delay: float = 0.5) -> None:
+        super().__init__()
+
+        self._path_to_file: str = path_to_file
+        self._flush_delay: float = flush_delay
+
+        self._lock: RLock = RLock()
+        self._write_lock: Lock = Lock()
+        self._flush_timer: Timer | None = None
+        self._is_dirty: bool = False
+
+        with open(path_to_file) as settings_file:
+            self._settings: dict[str, dict[str, Any]] = json.load(settings_file)
+
+    @property
+    def is_dirty(self) -> bool:
+        """Return True if some changes are not yet written to file."""
+        return self._is_dirty
+
+    def value(self, section: str, key: str) -> Any:
+        """Get value of `key` from `section`."""
+        return self._settings[section][key]
+
+    def set_value(self, section: str, key: str, value: Any) -> None:
+        """Set `value` to `key` for `section` and schedule flush."""
+        with self._lock:
+            if self._settings[section].get(key) == value:
+                return
+
+            self._settings[section][key] = value
+            self._is_dirty = True
+            self.schedule_flush()
+
+        self.value_changed.emit(section, key, value)
+
+    def schedule_flush(self) -> None:
+        """Restart countdown after which pending changes are flushed."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+
+            self._flush_timer = Timer(self._flush_delay, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Write pending changes to file by atomic rename, one flush at a time."""
+        with self._write_lock:
+            try:
+                self._write()
+            except OSError:
+                logger.exception("Settings could not be written")
+
+                with self._lock:
+                    self._is_dirty = True
+
+    def _write(self) -> None:
+        """Snapshot pending changes and replace file while holding write lock."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            if not self._is_dirty:
+                return
+
+            settings_text: str = json.dumps(self._settings, indent=2) + "\n"
+            self._is_dirty = False
+
+        directory: str = os.path.dirname(os.path.abspath(self._path_to_file))
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=directory,
+            prefix=".settings-",
+            suffix=".tmp",
+        )
+
+        try:
+            with os.fdopen(file_descriptor, mode="w", newline="\n") as settings_file:
+                settings_file.write(settings_text)
+                settings_file.flush()
+                os.fsync(settings_file.fileno())
+
+            os.replace(temporary_path, self._path_to_file)
+        except OSError:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+            raise
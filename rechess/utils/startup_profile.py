@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter
+from typing import ClassVar, Iterator
+
+from PySide6.QtCore import QObject, Signal
+
+
+class StartupProfile(QObject):
+    """Durations of startup phases measured since app launch."""
+
+    phase_recorded: ClassVar[Signal] = Signal(str)
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._origin: float = perf_counter()
+        self._lock: Lock = Lock()
+        self._phases: dict[str, tuple[float, float]] = {}
+
+    @property
+    def phases(self) -> dict[str, tuple[float, float]]:
+        """Get start offset and duration in seconds of each phase."""
+        with self._lock:
+            return dict(self._phases)
+
+    def elapsed(self) -> float:
+        """Get seconds elapsed since app launch."""
+        return perf_counter() - self._origin
+
+    def record(self, phase_name: str, start: float, duration: float) -> None:
+        """Record `phase_name` starting at `start` lasting `duration`."""
+        with self._lock:
+            if phase_name in self._phases:
+                return
+            self._phases[phase_name] = (start, duration)
+
+        self.phase_recorded.emit(phase_name)
+
+    def has_phases(self, *phase_names: str) -> bool:
+        """Return True if all of `phase_names` are recorded."""
+        with self._lock:
+            return all(phase_name in self._phases for phase_name in phase_names)
+
+    @contextmanager
+    def measure(self, phase_name: str) -> Iterator[None]:
+        """Measure duration of code block as `phase_name`."""
+        start: float = self.elapsed()
+
+        try:
+            yield
+        finally:
+            self.record(phase_name, start, self.elapsed() - start)
+
+    def report(self) -> str:
+        """Get per-phase breakdown sorted by phase start."""
+        lines: list[str] = ["Startup profile:"]
+
+        for phase_name, (start, duration) in sorted(
+            self.phases.items(), key=lambda phase: phase[1][0]
+        ):
+            lines.append(
+                f"  {phase_name:<24} "
+                f"start {start * 1000:8.1f} ms  "
+                f"took {duration * 1000:8.1f} ms"
+            )
+
+        return "\n".join(lines)
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+from chess import Board, Move
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import rechess.ui  # noqa: E402, F401  (imports core package without cycle)
+from rechess.core.endgame_tablebase import (  # noqa: E402
+    EndgameTablebase,
+    TablebaseProbe,
+)
+
+
+class FakeTablebase:
+    """Tablebase answering probes from positions given by EPD."""
+
+    def __init__(self, probes: dict[str, tuple[int, int]]) -> None:
+        self.probes: dict[str, tuple[int, int]] = probes
+        self.probe_count: int = 0
+
+    def get_wdl(self, board: Board) -> int | None:
+        """Get WDL value stored for `board`."""
+        self.probe_count += 1
+        probe: tuple[int, int] | None = self.probes.get(board.epd())
+        return None if probe is None else probe[0]
+
+    def get_dtz(self, board: Board) -> int | None:
+        """Get DTZ value stored for `board`."""
+        probe: tuple[int, int] | None = self.probes.get(board.epd())
+        return None if probe is None else probe[1]
+
+    def close(self) -> None:
+        """Do nothing, as there are no table files."""
+
+
+def endgame_tablebase(
+    board: Board,
+    root_probe: tuple[int, int],
+    default_probe: tuple[int, int] | None,
+    move_probes: dict[str, tuple[int, int] | None] | None = None,
+) -> EndgameTablebase:
+    """Get tablebase covering `board` and positions after its legal moves."""
+    probes: dict[str, tuple[int, int]] = {board.epd(): root_probe}
+
+    for move in board.legal_moves:
+        probe: tuple[int, int] | None = (move_probes or {}).get(
+            move.uci(), default_probe
+        )
+        board.push(move)
+
+        if probe is not None:
+            probes[board.epd()] = probe
+
+        board.pop()
+
+    tablebase: EndgameTablebase = EndgameTablebase("", 5)
+    tablebase._tablebase = FakeTablebase(probes)
+    return tablebase
+
+
+def test_three_pieces_prefer_checkmate() -> None:
+    """Checkmate is chosen over other moves keeping same win."""
+    board: Board = Board("7k/8/6K1/8/8/8/8/Q7 w - - 0 1")
+    tablebase: EndgameTablebase = endgame_tablebase(board, (2, 1), (-2, -3))
+
+    best_move: Move | None = tablebase.best_move(board)
+
+    assert best_move is not None
+    board.push(best_move)
+    assert board.is_checkmate()
+
+
+def test_four_pieces_prefer_win_with_shortest_dtz() -> None:
+    """Winning move with DTZ closest to zero beats slower wins and draws."""
+    board: Board = Board("8/8/8/4k3/8/8/3P4/R3K3 w - - 0 1")
+    tablebase: EndgameTablebase = endgame_tablebase(
+        board,
+        (2, 3),
+        (0, 0),
+        {"a1a8": (-2, -9), "a1a5": (-2, -3)},
+    )
+
+    assert tablebase.best_move(board) == Move.from_uci("a1a5")
+
+
+def test_five_pieces_prefer_zeroing_win() -> None:
+    """Winning pawn move that resets DTZ beats faster non-zeroing win."""
+    board: Board = Board("8/8/8/4k3/8/8/3PP3/R3K3 w - - 0 1")
+    tablebase: EndgameTablebase = endgame_tablebase(
+        board,
+        (2, 3),
+        (-2, -2),
+        {
+            "d2d3": (0, 0),
+            "d2d4": (0, 0),
+            "e2e3": (0, 0),
+            "e2e4": (-2, -20),
+        },
+    )
+
+    assert tablebase.best_move(board) == Move.from_uci("e2e4")
+
+
+def test_five_pieces_losing_side_delays_longest() -> None:
+    """Losing side picks move with largest DTZ for winning side."""
+    board: Board = Board("8/8/8/4k3/8/8/3PP3/R3K3 b - - 0 1")
+    tablebase: EndgameTablebase = endgame_tablebase(
+        board,
+        (-2, -5),
+        (2, 3),
+        {"e5d5": (2, 11)},
+    )
+
+    assert tablebase.best_move(board) == Move.from_uci("e5d5")
+
+
+def test_missing_child_probe_gives_no_move() -> None:
+    """No move is ranked if any position after legal move is not covered."""
+    board: Board = Board("8/8/8/4k3/8/8/3P4/R3K3 w - - 0 1")
+    tablebase: EndgameTablebase = endgame_tablebase(
+        board,
+        (2, 3),
+        (-2, -3),
+        {"a1a8": None},
+    )
+
+    assert tablebase.best_move(board) is None
+
+
+@pytest.mark.parametrize(
+    "fen",
+    [
+        "8/8/8/4k3/8/8/2PPP3/R3K3 w - - 0 1",
+        "4k3/8/8/8/8/8/8/R3K3 w Q - 0 1",
+    ],
+    ids=["six-pieces", "castling-rights"],
+)
+def test_unprobeable_position_is_not_probed(fen: str) -> None:
+    """Positions beyond piece limit or with castling rights skip table files."""
+    board: Board = Board(fen)
+    tablebase: EndgameTablebase = endgame_tablebase(board, (2, 3), (-2, -3))
+
+    assert tablebase.probe(board) is None
+    assert tablebase.best_move(board) is None
+    assert tablebase._tablebase.probe_count == 0
+
+
+def test_probes_are_cached() -> None:
+    """Repeated probes of position are answered from cache."""
+    board: Board = Board("7k/8/6K1/8/8/8/8/Q7 w - - 0 1")
+    tablebase: EndgameTablebase = endgame_tablebase(board, (2, 1), (-2, -3))
+
+    assert tablebase.probe(board) == TablebaseProbe(2, 1)
+    assert tablebase.probe(board) == TablebaseProbe(2, 1)
+    assert (tablebase.hits, tablebase.misses) == (1, 1)
+    assert tablebase._tablebase.probe_count == 1
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Final, Iterator
+
+import pytest
+from chess import Board, Move
+from chess.engine import Cp, Mate
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import rechess.ui  # noqa: E402, F401  (imports core package without cycle)
+from rechess.core.evaluation_cache import (  # noqa: E402
+    CachedEvaluation,
+    EvaluationCache,
+)
+
+
+ENGINE: Final[str] = "Stockfish 17"
+
+
+def positions(count: int) -> list[Board]:
+    """Get `count` distinct positions after one move from starting position."""
+    boards: list[Board] = []
+
+    for move in list(Board().legal_moves)[:count]:
+        board: Board = Board()
+        board.push(move)
+        boards.append(board)
+
+    return boards
+
+
+def row_count(cache: EvaluationCache) -> int:
+    """Get number of cached evaluations."""
+    return cache.connection.execute("SELECT COUNT(*) FROM evaluations").fetchone()[0]
+
+
+@pytest.fixture
+def path_to_cache(tmp_path: Path) -> str:
+    """Get path of cache database in temporary directory."""
+    return str(tmp_path / "evaluations.sqlite")
+
+
+@pytest.fixture
+def cache(path_to_cache: str) -> Iterator[EvaluationCache]:
+    """Get cache with room for ten evaluations."""
+    evaluation_cache: EvaluationCache = EvaluationCache(path_to_cache, 10)
+    yield evaluation_cache
+    evaluation_cache.close()
+
+
+def test_deeper_evaluation_replaces_shallower(cache: EvaluationCache) -> None:
+    """Evaluation is replaced only by one searched deeper."""
+    board: Board = Board()
+    e4: list[Move] = [Move.from_uci("e2e4")]
+    d4: list[Move] = [Move.from_uci("d2d4")]
+
+    cache.put(board, ENGINE, 12, Cp(30), e4)
+    cache.put(board, ENGINE, 10, Cp(-50), d4)
+
+    assert cache.get(board, ENGINE) == CachedEvaluation(12, Cp(30), e4, ENGINE)
+
+    cache.put(board, ENGINE, 12, Cp(-50), d4)
+
+    assert cache.get(board, ENGINE).score == Cp(30)
+
+    cache.put(board, ENGINE, 18, Mate(-3), d4)
+
+    assert cache.get(board, ENGINE) == CachedEvaluation(18, Mate(-3), d4, ENGINE)
+
+
+def test_evaluations_are_kept_per_engine(cache: EvaluationCache) -> None:
+    """Same position is cached separately for each engine."""
+    board: Board = Board()
+
+    cache.put(board, ENGINE, 20, Cp(25), [])
+
+    assert cache.get(board, "Leela") is None
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert cache.hit_rate == 0.0
+
+
+def test_commit_evicts_least_recently_used(cache: EvaluationCache) -> None:
+    """Committing over budget keeps most recently used evaluations."""
+    boards: list[Board] = positions(12)
+
+    for board in boards:
+        cache.put(board, ENGINE, 10, Cp(0), [])
+
+    cache.get(boards[0], ENGINE)
+    cache.get(boards[1], ENGINE)
+    cache.commit()
+
+    assert row_count(cache) == 9
+    assert cache.get(boards[0], ENGINE) is not None
+    assert cache.get(boards[1], ENGINE) is not None
+    assert cache.get(boards[2], ENGINE) is None
+    assert cache.get(boards[11], ENGINE) is not None
+
+
+def test_commit_within_budget_keeps_all(cache: EvaluationCache) -> None:
+    """Committing within budget evicts nothing."""
+    for board in positions(10):
+        cache.put(board, ENGINE, 10, Cp(0), [])
+
+    cache.commit()
+
+    assert row_count(cache) == 10
+
+
+def test_reopened_cache_continues_access_order(path_to_cache: str) -> None:
+    """Access clock resumes after reopening, so new entries rank as newest."""
+    boards: list[Board] = positions(12)
+    cache: EvaluationCache = EvaluationCache(path_to_cache, 10)
+
+    for board in boards[:10]:
+        cache.put(board, ENGINE, 10, Cp(0), [])
+
+    cache.close()
+
+    cache = EvaluationCache(path_to_cache, 10)
+
+    for board in boards[10:]:
+        cache.put(board, ENGINE, 10, Cp(0), [])
+
+    cache.commit()
+
+    assert cache.get(boards[0], ENGINE) is None
+    assert cache.get(boards[11], ENGINE) is not None
+
+    cache.close()
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import os
+import random
+
+import pytest
+from chess import Board, Move
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import rechess.ui  # noqa: E402, F401  (imports core package without cycle)
+from rechess.core.game_history import GameHistory  # noqa: E402
+from rechess.core.game_tree import SNAPSHOT_INTERVAL, GameNode  # noqa: E402
+
+
+def play(history: GameHistory, board: Board, ucis: list[str]) -> None:
+    """Push moves given as `ucis` on `board` and append them to `history`."""
+    for uci in ucis:
+        move: Move = Move.from_uci(uci)
+        san: str = board.san(move)
+        board.push(move)
+        history.append(move, san, board)
+
+
+def random_moves(plies: int, seed: int = 0) -> list[Move]:
+    """Get up to `plies` random legal moves from starting position."""
+    randomizer: random.Random = random.Random(seed)
+    board: Board = Board()
+
+    while not board.is_game_over() and len(board.move_stack) < plies:
+        board.push(randomizer.choice(list(board.legal_moves)))
+
+    return board.move_stack
+
+
+@pytest.fixture
+def history() -> GameHistory:
+    """Get empty game history from starting position."""
+    return GameHistory()
+
+
+def test_truncate_keeps_cut_moves_as_variations(history: GameHistory) -> None:
+    """Cut moves stay in tree and new move becomes main line."""
+    board: Board = Board()
+    play(history, board, ["e2e4", "e7e5", "g1f3"])
+    history.take_changed_index()
+
+    history.truncate(2)
+    board.pop()
+    play(history, board, ["f1c4"])
+
+    parent: GameNode = history.line[1]
+
+    assert history.sans() == ["e4", "e5", "Bc4"]
+    assert [child.san for child in parent.children] == ["Bc4", "Nf3"]
+    assert [variation.san for variation in parent.variations] == ["Nf3"]
+    assert history.take_changed_index() == 2
+
+
+def test_truncate_to_zero_keeps_first_move(history: GameHistory) -> None:
+    """Cutting whole line keeps first move below root node."""
+    play(history, Board(), ["d2d4", "d7d5"])
+
+    history.truncate(0)
+
+    assert len(history) == 0
+    assert [child.san for child in history.root_node.children] == ["d4"]
+    assert history.root_node.main_child.main_child.san == "d5"
+
+
+def test_replaying_existing_child_promotes_it(history: GameHistory) -> None:
+    """Appending move played before reuses its node and puts it first."""
+    board: Board = Board()
+    play(history, board, ["e2e4"])
+    first_node: GameNode = history.line[0]
+
+    history.truncate(0)
+    play(history, Board(), ["d2d4"])
+    history.truncate(0)
+    play(history, Board(), ["e2e4"])
+
+    assert history.line[0] is first_node
+    assert [child.san for child in history.root_node.children] == ["e4", "d4"]
+
+
+def test_ellipsis_offsets_item_indexes(history: GameHistory) -> None:
+    """Ellipsis occupies first item when history starts with Black to move."""
+    root: Board = Board("4k3/8/8/8/8/8/4P3/4K3 b - - 0 1")
+    history.reset(root)
+    history.append_ellipsis()
+    play(history, root.copy(), ["e8d7", "e2e4"])
+
+    assert len(history) == 3
+    assert history.sans() == ["...", "Kd7", "e4"]
+    assert history.san_at(0) == "..."
+    assert history.move_at(0) is None
+    assert history.node_at(0) is history.root_node
+    assert history.move_at(1) == Move.from_uci("e8d7")
+    assert history.plies_until(2) == 2
+    assert history.position_at(2).fen() == "8/3k4/8/8/4P3/8/8/4K3 b - - 0 2"
+
+    history.truncate(1)
+
+    assert history.sans() == ["..."]
+
+    history.truncate(0)
+
+    assert not history.has_ellipsis
+    assert len(history) == 0
+
+
+@pytest.mark.parametrize(
+    "plies",
+    [SNAPSHOT_INTERVAL - 1, SNAPSHOT_INTERVAL, SNAPSHOT_INTERVAL + 1, 100],
+)
+def test_node_board_replays_from_nearest_snapshot(
+    history: GameHistory,
+    plies: int,
+) -> None:
+    """Position of every node matches board reached by playing its moves."""
+    moves: list[Move] = random_moves(plies)
+    board: Board = Board()
+
+    for move in moves:
+        san: str = board.san(move)
+        board.push(move)
+        history.append(move, san, board)
+
+    replayed: Board = Board()
+
+    for node, move in zip(history.line, moves):
+        replayed.push(move)
+
+        assert node.board().fen() == replayed.fen()
+        assert (node._snapshot is not None) == (node.ply % SNAPSHOT_INTERVAL == 0)
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import os
+import struct
+from pathlib import Path
+from typing import Final, Iterator
+
+import pytest
+from chess import Board, Move
+from chess.polyglot import zobrist_hash
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import rechess.ui  # noqa: E402, F401  (imports core package without cycle)
+from rechess.core.opening_book import OpeningBook  # noqa: E402
+
+
+ENTRY: Final[struct.Struct] = struct.Struct(">QHHI")
+
+
+def write_book(path_to_book: Path, board: Board, weights: dict[str, int]) -> None:
+    """Write Polyglot book with moves from `board` having given `weights`."""
+    key: int = zobrist_hash(board)
+    entries: list[bytes] = []
+
+    for uci, weight in weights.items():
+        move: Move = Move.from_uci(uci)
+        entries.append(
+            ENTRY.pack(key, move.to_square | move.from_square << 6, weight, 0)
+        )
+
+    path_to_book.write_bytes(b"".join(entries))
+
+
+@pytest.fixture
+def book(tmp_path: Path) -> Iterator[OpeningBook]:
+    """Get book whose starting position has weighted and zero-weight moves."""
+    path_to_book: Path = tmp_path / "book.bin"
+    write_book(path_to_book, Board(), {"e2e4": 10, "d2d4": 5, "g1f3": 0})
+
+    opening_book: OpeningBook = OpeningBook(str(path_to_book))
+    yield opening_book
+    opening_book.close()
+
+
+def chosen_moves(
+    book: OpeningBook,
+    weighting: str,
+    variety: int,
+    tries: int = 50,
+) -> set[str]:
+    """Get moves chosen from starting position in `tries` attempts."""
+    return {
+        book.choose_move(Board(), weighting, 10, variety).uci() for _ in range(tries)
+    }
+
+
+def test_best_weighting_picks_heaviest_move(book: OpeningBook) -> None:
+    """Best weighting always picks move with largest weight."""
+    assert chosen_moves(book, "best", 100) == {"e2e4"}
+
+
+def test_weighted_choice_never_picks_zero_weight(book: OpeningBook) -> None:
+    """Zero-weight move stays in book but is never drawn by weight."""
+    assert chosen_moves(book, "weighted", 100, 200) == {"e2e4", "d2d4"}
+
+
+def test_uniform_choice_includes_zero_weight(book: OpeningBook) -> None:
+    """Uniform choice at full variety considers zero-weight move."""
+    assert chosen_moves(book, "uniform", 100, 200) == {"e2e4", "d2d4", "g1f3"}
+
+
+def test_no_variety_keeps_only_best_moves(book: OpeningBook) -> None:
+    """Variety of zero leaves only moves with best weight."""
+    assert chosen_moves(book, "uniform", 0) == {"e2e4"}
+
+
+def test_all_zero_weights_fall_back_to_uniform(tmp_path: Path) -> None:
+    """Weighted choice among zero-weight moves picks any of them."""
+    path_to_book: Path = tmp_path / "book.bin"
+    write_book(path_to_book, Board(), {"e2e4": 0, "d2d4": 0})
+    book: OpeningBook = OpeningBook(str(path_to_book))
+
+    assert chosen_moves(book, "weighted", 0, 100) == {"e2e4", "d2d4"}
+
+    book.close()
+
+
+def test_missing_position_and_depth_limit(book: OpeningBook) -> None:
+    """Positions outside book or past depth limit give no move."""
+    board: Board = Board()
+
+    assert book.choose_move(board, "best", 0, 100) is None
+
+    board.push_san("e4")
+
+    assert book.choose_move(board, "best", 10, 100) is None
+    assert (book.hits, book.misses) == (0, 1)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from rechess.utils.pgn_index import INDEX_SUFFIX, PgnIndex
+
+
+GAMES: list[str] = [
+    '[Event "Ljubljana"]\n[White "Žiga Čeh"]\n[Result "1-0"]\n\n1. e4 e5 1-0\n',
+    '[Event "Köln"]\n[White "Jürgen Müller"]\n[Result "0-1"]\n\n1. d4 d5 0-1\n',
+    '[Event "Tokyo"]\n[White "羽生善治"]\n[Result "1/2-1/2"]\n\n1. c4 1/2-1/2\n',
+]
+
+
+def write_pgn(path_to_pgn: Path, games: list[str], newline: str = "\n") -> None:
+    """Write `games` separated by blank lines with `newline` line endings."""
+    pgn_text: str = "\n".join(games).replace("\n", newline)
+    path_to_pgn.write_bytes(pgn_text.encode())
+
+
+@pytest.fixture(params=["\n", "\r\n"], ids=["lf", "crlf"])
+def path_to_pgn(request: pytest.FixtureRequest, tmp_path: Path) -> Path:
+    """Get PGN file of games with UTF-8 headers and given line endings."""
+    path: Path = tmp_path / "games.pgn"
+    write_pgn(path, GAMES, request.param)
+    return path
+
+
+@pytest.fixture
+def index(path_to_pgn: Path) -> Iterator[PgnIndex]:
+    """Get index built for `path_to_pgn`."""
+    pgn_index: PgnIndex = PgnIndex(str(path_to_pgn))
+    yield pgn_index
+    pgn_index.close()
+
+
+def test_offsets_point_at_game_starts(path_to_pgn: Path, index: PgnIndex) -> None:
+    """Byte offsets land on event tag of each game despite multibyte headers."""
+    pgn_bytes: bytes = path_to_pgn.read_bytes()
+
+    assert len(index) == len(GAMES)
+
+    for offset in index.offsets:
+        assert pgn_bytes[offset:].startswith(b'[Event "')
+
+
+def test_games_are_read_by_seeking(index: PgnIndex) -> None:
+    """Headers and moves of each game are read from its offset."""
+    assert index.read_headers(0)["White"] == "Žiga Čeh"
+    assert index.read_headers(1)["White"] == "Jürgen Müller"
+    assert index.read_headers(2)["White"] == "羽生善治"
+    assert index.read_game(1).headers["Event"] == "Köln"
+    assert [move.uci() for move in index.read_game(2).mainline_moves()] == ["c2c4"]
+
+
+def test_saved_index_is_loaded(path_to_pgn: Path, index: PgnIndex) -> None:
+    """Index file of unchanged PGN file is mapped instead of rebuilt."""
+    path_to_index: str = str(path_to_pgn) + INDEX_SUFFIX
+
+    assert os.path.exists(path_to_index)
+    assert not PgnIndex.is_stale(str(path_to_pgn), path_to_index)
+
+    loaded: PgnIndex = PgnIndex(str(path_to_pgn))
+
+    assert isinstance(loaded.offsets, memoryview)
+    assert list(loaded.offsets) == list(index.offsets)
+
+    loaded.close()
+
+
+def test_changed_pgn_file_makes_index_stale(path_to_pgn: Path) -> None:
+    """Appending game invalidates index file and rebuild finds new game."""
+    PgnIndex(str(path_to_pgn)).close()
+
+    with open(path_to_pgn, "ab") as pgn_file:
+        pgn_file.write(b'\n[Event "Extra"]\n\n1. Nf3 *\n')
+
+    assert PgnIndex.is_stale(str(path_to_pgn), str(path_to_pgn) + INDEX_SUFFIX)
+
+    rebuilt: PgnIndex = PgnIndex(str(path_to_pgn))
+
+    assert len(rebuilt) == len(GAMES) + 1
+    assert rebuilt.read_headers(len(GAMES))["Event"] == "Extra"
+
+    rebuilt.close()
+
+
+def test_truncated_index_file_is_stale(path_to_pgn: Path) -> None:
+    """Index file shorter than its header is treated as stale."""
+    path_to_index: Path = Path(str(path_to_pgn) + INDEX_SUFFIX)
+    path_to_index.write_bytes(b"RCPI")
+
+    assert PgnIndex.is_stale(str(path_to_pgn), str(path_to_index))
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from chess import Board, Move
+
+from rechess.utils import position_index
+from rechess.utils.pgn_index import PgnIndex
+from rechess.utils.position_index import (
+    INDEX_SUFFIX,
+    MoveStatistics,
+    PositionIndex,
+    PositionStatistics,
+)
+
+
+GAMES: list[tuple[str, str]] = [
+    ("1. e4 e5 2. Nf3 Nc6", "1-0"),
+    ("1. e4 c5 2. Nf3 d6", "0-1"),
+    ("1. d4 d5 2. Nf3 e6", "1/2-1/2"),
+    ("1. Nf3 d5 2. d4 Nf6", "1-0"),
+    ("1. e4 e5 2. Nf3 Nf6", "*"),
+]
+
+
+def indexed_keys(positions: PositionIndex) -> Iterator[int]:
+    """Get Zobrist hashes of all records in index order."""
+    for record_index in range(len(positions)):
+        yield positions.key_at(record_index)
+
+
+def board_after(*sans: str) -> Board:
+    """Get position after moves given as `sans` from starting position."""
+    board: Board = Board()
+
+    for san in sans:
+        board.push_san(san)
+
+    return board
+
+
+@pytest.fixture
+def path_to_pgn(tmp_path: Path) -> Path:
+    """Get PGN file of `GAMES` with Windows line endings."""
+    path: Path = tmp_path / "games.pgn"
+    path.write_bytes(
+        "".join(
+            f'[Event "Game {number}"]\r\n[White "Müller"]\r\n'
+            f'[Result "{result}"]\r\n\r\n{moves} {result}\r\n\r\n'
+            for number, (moves, result) in enumerate(GAMES)
+        ).encode()
+    )
+    return path
+
+
+@pytest.fixture
+def index(
+    monkeypatch: pytest.MonkeyPatch,
+    path_to_pgn: Path,
+) -> Iterator[PositionIndex]:
+    """Get position index built from chunks of two games each."""
+    monkeypatch.setattr(position_index, "CHUNK_SIZE", 2)
+    pgn_index: PgnIndex = PgnIndex(str(path_to_pgn))
+    offsets: list[int] = list(pgn_index.offsets)
+    pgn_index.close()
+
+    positions: PositionIndex = PositionIndex(str(path_to_pgn), offsets)
+    yield positions
+    positions.close()
+
+
+def test_merged_chunks_keep_records_sorted(index: PositionIndex) -> None:
+    """Records of all chunks are merged in order of Zobrist hash."""
+    keys: list[int] = list(indexed_keys(index))
+
+    assert len(keys) == 5 * len(GAMES)
+    assert keys == sorted(keys)
+
+
+def test_find_reports_games_reaching_position(index: PositionIndex) -> None:
+    """Games reaching position are found, also through transposition."""
+    assert index.find(Board()) == [0, 1, 2, 3, 4]
+    assert index.find(board_after("e4", "e5", "Nf3")) == [0, 4]
+    assert index.find(board_after("d4", "d5", "Nf3")) == [2, 3]
+    assert index.find(board_after("h4")) == []
+
+
+def test_statistics_count_moves_and_results(index: PositionIndex) -> None:
+    """Moves from position are counted by games with results per move."""
+    statistics: PositionStatistics = index.statistics(Board())
+
+    assert statistics.games == 5
+    assert statistics.is_complete
+    assert statistics.moves[0] == MoveStatistics(Move.from_uci("e2e4"), 3, 1, 0, 1)
+    assert set(statistics.moves[1:]) == {
+        MoveStatistics(Move.from_uci("d2d4"), 1, 0, 1, 0),
+        MoveStatistics(Move.from_uci("g1f3"), 1, 1, 0, 0),
+    }
+    assert index.move_statistics(Board()) == statistics.moves
+
+
+def test_statistics_of_final_position(index: PositionIndex) -> None:
+    """Position ending game is reported without move."""
+    statistics: PositionStatistics = index.statistics(
+        board_after("d4", "d5", "Nf3", "e6")
+    )
+
+    assert statistics == PositionStatistics([MoveStatistics(None, 1, 0, 1, 0)], 1, True)
+
+
+def test_statistics_stop_at_hit_limit(index: PositionIndex) -> None:
+    """Scan stops after `hit_limit` hits and reports partial statistics."""
+    statistics: PositionStatistics = index.statistics(Board(), 2)
+
+    assert statistics.games == 2
+    assert not statistics.is_complete
+    assert sum(move.games for move in statistics.moves) == 2
+
+
+def test_changed_pgn_file_makes_index_stale(
+    path_to_pgn: Path,
+    index: PositionIndex,
+) -> None:
+    """Index file is stale once PGN file changes."""
+    path_to_index: str = str(path_to_pgn) + INDEX_SUFFIX
+
+    assert not PositionIndex.is_stale(str(path_to_pgn), path_to_index)
+
+    with open(path_to_pgn, "ab") as pgn_file:
+        pgn_file.write(b'[Event "Extra"]\r\n\r\n1. h4 *\r\n')
+
+    assert PositionIndex.is_stale(str(path_to_pgn), path_to_index)
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import os
+import random
+from typing import Any, Iterator
+
+import pytest
+from chess import Board, Move
+from PySide6.QtCore import QModelIndex, QPersistentModelIndex, Qt
+from PySide6.QtTest import QAbstractItemModelTester
+from PySide6.QtWidgets import QApplication
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from rechess.ui.table import TableModel, TableView  # noqa: E402
+from rechess.core import Game  # noqa: E402
+
+
+class CountingTableModel(TableModel):
+    """Table model recording data calls and change notifications."""
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+
+        self.data_calls: int = 0
+        self.notifications: list[tuple[Any, ...]] = []
+
+        self.layoutChanged.connect(lambda: self.notifications.append(("layout",)))
+        self.modelReset.connect(lambda: self.notifications.append(("reset",)))
+        self.rowsInserted.connect(
+            lambda _, first, last: self.notifications.append(("rows", first, last))
+        )
+        self.dataChanged.connect(
+            lambda top_left, bottom_right: self.notifications.append(
+                (
+                    "data",
+                    top_left.row(),
+                    top_left.column(),
+                    bottom_right.row(),
+                    bottom_right.column(),
+                )
+            )
+        )
+
+    def data(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        """Count call and get SAN representation for move at `index`."""
+        self.data_calls += 1
+        return super().data(index, role)
+
+
+def append_move(game: Game, model: TableModel, move: Move) -> None:
+    """Push `move` and select it as table view does after each move."""
+    game.push(move)
+    model.refresh_view()
+    game.update_state(len(game.history) - 1)
+
+
+def random_moves(plies: int, seed: int = 0) -> list[Move]:
+    """Get up to `plies` random legal moves from starting position."""
+    randomizer: random.Random = random.Random(seed)
+    board: Board = Board()
+
+    while not board.is_game_over() and len(board.move_stack) < plies:
+        board.push(randomizer.choice(list(board.legal_moves)))
+
+    return board.move_stack
+
+
+@pytest.fixture(scope="module")
+def app() -> Iterator[QApplication]:
+    """Get application instance needed by models and views."""
+    yield QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def game(app: QApplication) -> Game:
+    """Get new game."""
+    return Game()
+
+
+@pytest.fixture
+def model(game: Game) -> CountingTableModel:
+    """Get counting table model over move history of `game`."""
+    table_model: CountingTableModel = CountingTableModel(game.history)
+    QAbstractItemModelTester(
+        table_model,
+        QAbstractItemModelTester.FailureReportingMode.Fatal,
+        table_model,
+    )
+    return table_model
+
+
+def test_refresh_view_notifies_only_appended_cell(
+    game: Game,
+    model: CountingTableModel,
+) -> None:
+    """Appending move inserts row for White and changes one cell for Black."""
+    for move_index, move in enumerate(random_moves(40)):
+        model.notifications.clear()
+
+        append_move(game, model, move)
+
+        row: int = move_index // 2
+
+        if move_index % 2 == 0:
+            assert model.notifications == [("rows", row, row)]
+        else:
+            assert model.notifications == [("data", row, 1, row, 1)]
+
+
+def test_bulk_append_inserts_all_rows_at_once(
+    game: Game,
+    model: CountingTableModel,
+) -> None:
+    """Appending many moves at once inserts their rows in one notification."""
+    moves: list[Move] = random_moves(101)
+
+    game.push_moves(moves)
+    model.refresh_view()
+
+    assert model.notifications == [("rows", 0, (len(moves) + 1) // 2 - 1)]
+    assert model.rowCount() == (len(moves) + 1) // 2
+
+
+def test_data_calls_per_move_stay_bounded(
+    app: QApplication,
+    game: Game,
+    model: CountingTableModel,
+) -> None:
+    """Data calls per appended move do not grow with game length."""
+    view: TableView = TableView(model)
+    view.resize(200, 300)
+    view.show()
+    app.processEvents()
+
+    calls_per_move: list[int] = []
+
+    for move in random_moves(200):
+        model.data_calls = 0
+
+        append_move(game, model, move)
+        app.processEvents()
+
+        calls_per_move.append(model.data_calls)
+
+    assert len(calls_per_move) == 200
+    assert max(calls_per_move[100:]) <= max(calls_per_move[:50])
+    early_average: float = sum(calls_per_move[50:100]) / 50
+    late_average: float = sum(calls_per_move[100:]) / 100
+    assert late_average <= 1.1 * early_average
+    assert not any(
+        notification[0] in ("layout", "reset") for notification in model.notifications
+    )